@@ -8,6 +8,7 @@ from collections import defaultdict, Counter
 # Era sürümündeki DOĞRU sınıfları import et
 try:
     from aee_core_classes_era import Proposition, EpistemicData
+    from aee_events_era import emit, EVENT_FLAG_SET
 except ImportError:
     print("Bias Detector Error: Could not import from aee_core_classes_era.py.")
     Proposition = None; EpistemicData = None
@@ -34,7 +35,7 @@ def detect_source_diversity_bias(kb: Dict[str, Proposition], subject_threshold:
             if len(source_types) < diversity_threshold and high_conf_props:
                 bias_flag = "SOURCE_MONOCULTURE"; print(f"    Potential Bias Detected: Subject '{subject}' low diversity ({len(source_types)}<{diversity_threshold}). Flagging {len(high_conf_props)} props.")
                 for prop in high_conf_props:
-                    if bias_flag not in prop.epistemic_data.bias_flags: prop.epistemic_data.bias_flags.append(bias_flag); flagged_props_count +=1
+                    if bias_flag not in prop.epistemic_data.bias_flags: prop.epistemic_data.bias_flags.append(bias_flag); flagged_props_count +=1; emit(kb, EVENT_FLAG_SET, prop, flag=bias_flag)
     print(f"  Source Diversity Check complete. Flagged {flagged_props_count} propositions.")
 
 def detect_argument_balance_bias(kb: Dict[str, Proposition], confidence_threshold: float = 0.7):
@@ -48,7 +49,7 @@ def detect_argument_balance_bias(kb: Dict[str, Proposition], confidence_threshol
         if ep_data.computed_confidence is not None and \
            ep_data.computed_confidence >= confidence_threshold and \
            ep_data.supports and not ep_data.contradicts: # Destek listesi dolu VE Çelişki listesi boş ise
-            if bias_flag not in ep_data.bias_flags: ep_data.bias_flags.append(bias_flag); flagged_props_count += 1
+            if bias_flag not in ep_data.bias_flags: ep_data.bias_flags.append(bias_flag); flagged_props_count += 1; emit(kb, EVENT_FLAG_SET, prop, flag=bias_flag)
     print(f"  Argument Balance Check complete. Flagged {flagged_props_count} propositions.")
 
 
@@ -0,0 +1,175 @@
+# aee_changefeed_era.py
+# AEE Era Sürümü: KB değişikliklerinin ekleme-only (append-only) JSONL günlüğü.
+# ChangeFeedWriter bir KB'nin olaylarına (aee_events_era) abone olur ve her değişikliği artan
+# sıra numarasıyla (seq) bir satır olarak yazar: önerme ekleme, bağlantı ekleme/silme, bias
+# işareti, güven/güvenilirlik değişimi ve çıkarma (eviction). Tüketiciler dosyayı bir bayt
+# imlecinden (cursor) okur; dışa aktarımlar ve kopyalar (replica) yalnızca değişiklik kadar iş yapar.
+# Not: Dosya başına tek yazıcı varsayılır; okuyucular yarım yazılmış son satırı okumaz.
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Any
+
+# Era sürümündeki sınıfları import et
+try:
+    from aee_core_classes_era import Proposition
+    from aee_checkpoint_era import proposition_to_dict, proposition_from_dict
+    from aee_events_era import (subscribe, unsubscribe, EVENT_PROP_INSERTED, EVENT_LINK_ADDED, EVENT_LINK_REMOVED,
+                                EVENT_CONFIDENCE_CHANGED, EVENT_RELIABILITY_CHANGED, EVENT_FLAG_SET, EVENT_PROP_EVICTED)
+except ImportError:
+    print("ChangeFeed Error: Could not import dependencies from aee_core_classes_era.py, aee_checkpoint_era.py or aee_events_era.py.")
+    Proposition = None
+
+# --- Sabitler ---
+_TAIL_BLOCK_BYTES = 4096 # Son sıra numarasını bulmak için dosya sonundan okunan blok
+
+def last_change_sequence(path: str) -> int:
+    """ Günlükteki son tam kaydın sıra numarasını döndürür (dosya yoksa veya boşsa 0). """
+    if not os.path.exists(path): return 0
+    with open(path, "rb") as feed_file:
+        feed_file.seek(0, os.SEEK_END); end = feed_file.tell(); tail = b""
+        while end > 0:
+            start = max(0, end - _TAIL_BLOCK_BYTES); feed_file.seek(start)
+            tail = feed_file.read(end - start) + tail; end = start
+            complete = tail[:tail.rfind(b"\n") + 1] if b"\n" in tail else b"" # Yarım son satır atlanır
+            lines = complete.splitlines()
+            if len(lines) > 1 or (lines and end == 0): return json.loads(lines[-1])["seq"]
+    return 0
+
+def truncate_partial_record(path: str) -> int:
+    """
+    Çökme sonrası yarım kalmış son satırı (son satır sonu karakterinden sonrasını) dosyadan keser.
+    Okuyucular yarım satırı hiç tüketmediğinden imleçleri geçerli kalır. Kesilen bayt sayısını döndürür.
+    """
+    if not os.path.exists(path): return 0
+    with open(path, "r+b") as feed_file:
+        feed_file.seek(0, os.SEEK_END); size = feed_file.tell(); end = size
+        while end > 0:
+            start = max(0, end - _TAIL_BLOCK_BYTES); feed_file.seek(start)
+            newline_index = feed_file.read(end - start).rfind(b"\n")
+            if newline_index >= 0: end = start + newline_index + 1; break
+            end = start
+        if end < size: feed_file.truncate(end)
+    return size - end
+
+class ChangeFeedWriter:
+    """
+    KB değişikliklerini JSONL günlüğüne yazan abone. Mevcut dosyaya eklenirken önce yarım kalmış
+    son satır kesilir (truncate_partial_record) ve sıra numarası son tam kayıttan devam eder. Kayıtlar tamponlanır; flush() / close() ile diske yazılır.
+    Her kayıt: {"seq", "ts", "op" (olay türü), "id" (prop_id), ...olay verisi}; ekleme kayıtları
+    önermenin tamamını (kontrol noktası biçiminde) "prop" altında taşır.
+    """
+
+    def __init__(self, path: str, kb: Optional[Dict[str, Proposition]] = None):
+        self.path = path
+        truncated_bytes = truncate_partial_record(path) # Yeni kayıt yarım satırın devamına yazılmasın
+        if truncated_bytes: print(f"  Change feed: dropped a partial last record ({truncated_bytes} bytes) in {path}.")
+        self.next_seq = last_change_sequence(path) + 1
+        self._file = open(path, "a", encoding="utf-8")
+        self._kb: Optional[Dict[str, Proposition]] = None
+        if kb is not None: self.attach(kb)
+
+    def attach(self, kb: Dict[str, Proposition]):
+        if self._kb is kb: return
+        if self._kb is not None: self.detach()
+        self._kb = kb; subscribe(kb, self.on_event)
+
+    def detach(self):
+        if self._kb is not None: unsubscribe(self._kb, self.on_event); self._kb = None
+
+    def on_event(self, event_type: str, prop: Proposition, data: Dict[str, Any]):
+        record: Dict[str, Any] = {"seq": self.next_seq, "ts": datetime.now().isoformat(), "op": event_type, "id": prop.prop_id}
+        if event_type == EVENT_PROP_INSERTED: record["prop"] = proposition_to_dict(prop)
+        else: record.update(data)
+        self._file.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+        self.next_seq += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self.detach()
+        if not self._file.closed: self._file.close()
+
+    def __enter__(self) -> "ChangeFeedWriter": return self
+    def __exit__(self, *exc_info): self.close()
+
+# --- Okuma ---
+def read_changes(path: str, cursor: int = 0, max_records: Optional[int] = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    cursor bayt ofsetinden itibaren tam kayıtları okur; (kayıtlar, yeni imleç) döndürür.
+    Yeni imleç bir sonraki çağrıda kullanılır (tail). Dosya henüz yoksa ([], cursor).
+    """
+    records: List[Dict[str, Any]] = []
+    if not os.path.exists(path): return records, cursor
+    with open(path, "rb") as feed_file:
+        feed_file.seek(cursor)
+        while max_records is None or len(records) < max_records:
+            line = feed_file.readline()
+            if not line.endswith(b"\n"): break # Dosya sonu veya yazıcının yarım bıraktığı satır
+            records.append(json.loads(line)); cursor += len(line)
+    return records, cursor
+
+def find_sequence_cursor(path: str, after_seq: int) -> int:
+    """ Sıra numarası after_seq'ten büyük ilk kaydın bayt ofsetini döndürür (imleç kaybolduğunda). """
+    cursor = 0
+    if not os.path.exists(path): return cursor
+    with open(path, "rb") as feed_file:
+        for line in feed_file:
+            if not line.endswith(b"\n") or json.loads(line)["seq"] > after_seq: break
+            cursor += len(line)
+    return cursor
+
+# --- Kopya (Replica) Uygulama ---
+def apply_change(kb: Dict[str, Proposition], record: Dict[str, Any]):
+    """ Tek bir değişiklik kaydını kopya KB'ye uygular (aynı kayıt iki kez uygulanırsa sonuç değişmez). """
+    op = record["op"]
+    if op == EVENT_PROP_INSERTED:
+        prop = proposition_from_dict(record["prop"]); kb[prop.prop_id] = prop; return
+    if op == EVENT_PROP_EVICTED:
+        kb.pop(record["id"], None); return
+    prop = kb.get(record["id"])
+    if prop is None: return # Kopya sonradan çıkarılmış bir önermeye ait kaydı atlar
+    ep_data = prop.epistemic_data
+    if op == EVENT_LINK_ADDED:
+        link_ids = getattr(ep_data, record["kind"])
+        if record["linked_id"] not in link_ids: link_ids.append(record["linked_id"])
+    elif op == EVENT_LINK_REMOVED:
+        link_ids = getattr(ep_data, record["kind"])
+        if record["linked_id"] in link_ids: link_ids.remove(record["linked_id"])
+    elif op == EVENT_FLAG_SET:
+        if record["flag"] not in ep_data.bias_flags: ep_data.bias_flags.append(record["flag"])
+    elif op == EVENT_CONFIDENCE_CHANGED: ep_data.computed_confidence = record["new"]
+    elif op == EVENT_RELIABILITY_CHANGED: ep_data.reliability_score = record["new"]
+
+def replicate_changes(path: str, kb: Dict[str, Proposition], cursor: int = 0) -> Tuple[int, int]:
+    """ Günlükteki yeni kayıtları kopya KB'ye uygular; (uygulanan kayıt sayısı, yeni imleç) döndürür. """
+    records, cursor = read_changes(path, cursor)
+    for record in records: apply_change(kb, record)
+    return len(records), cursor
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    import tempfile
+    print("Testing AEE Change Feed Module (Era Version)...")
+    if Proposition:
+        from aee_core_classes_era import EpistemicData
+        from aee_linker_era import find_and_link_evidence_era
+        from aee_events_era import emit
+        feed_path = os.path.join(tempfile.mkdtemp(), "kb.changes.jsonl")
+        primary: Dict[str, Proposition] = {}; replica: Dict[str, Proposition] = {}
+        with ChangeFeedWriter(feed_path, primary) as writer:
+            for source_id, value, negated in (("news.com", "blue", False), ("blog", "blue", True), ("wiki", "blue", False)):
+                prop = Proposition(f"sky {value}", f"sky {value}", EpistemicData(source_id=source_id), subject_lemma="sky",
+                                   relation_lemma="be", value_lemma=value, is_negated=negated)
+                emit(primary, EVENT_PROP_INSERTED, prop); find_and_link_evidence_era(prop, primary); primary[prop.prop_id] = prop
+            writer.flush()
+            applied, cursor = replicate_changes(feed_path, replica)
+            print(f"First tail: applied {applied} changes (cursor {cursor}, last seq {last_change_sequence(feed_path)})")
+            evicted = list(primary)[1]; emit(primary, EVENT_PROP_EVICTED, primary.pop(evicted))
+        applied, cursor = replicate_changes(feed_path, replica, cursor)
+        print(f"Second tail: applied {applied} changes; replica keys equal primary: {list(replica) == list(primary)}")
+        os.remove(feed_path)
+    else: print("Could not run tests due to import error.")
+    print("\nChange feed module testing complete.")
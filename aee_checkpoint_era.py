@@ -0,0 +1,113 @@
+# aee_checkpoint_era.py
+# AEE Era Sürümü: Önermeleri (bağlantılarıyla birlikte) kompakt gzip'li JSON kontrol noktası
+# dosyalarına yazar ve geri okur. Aşamalı CLI, dağıtık birleştirme ve değişiklik akışı bu
+# serileştirmeyi kullanır. Yazma işlemi atomiktir (geçici dosya + os.replace).
+
+import gzip
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple, Iterable
+
+# Era sürümündeki sınıfları import et
+try:
+    from aee_core_classes_era import Proposition, EpistemicData
+    from aee_corpus_era import DocumentStore, resolve_text_span
+except ImportError:
+    print("Checkpoint Error: Could not import Proposition/EpistemicData class from aee_core_classes_era.py.")
+    Proposition = None; EpistemicData = None
+
+CHECKPOINT_FORMAT_VERSION = 1
+
+# --- Serileştirme ---
+def proposition_to_dict(prop: Proposition, document_store: Optional[DocumentStore] = None, resolve_text: bool = True) -> Dict[str, Any]:
+    """
+    Önermeyi JSON'a yazılabilir bir sözlüğe dönüştürür. Ofset modundaki (metni saklanmayan) önermelerin
+    metni resolve_text ise document_store'dan (varsayılan: DEFAULT_DOCUMENT_STORE) çözülüp yazılır;
+    böylece kontrol noktası depo olmadan da okunabilir.
+    """
+    ep_data = prop.epistemic_data
+    text_span = resolve_text_span(prop, document_store) if resolve_text and not prop.text_span else prop.text_span
+    return {
+        "id": prop.prop_id, "text": text_span,
+        # Era extractor'da text_span tüm cümledir; aynıysa ikinci kez yazılmaz
+        "sent": None if prop.sentence_text == prop.text_span else prop.sentence_text,
+        "s": prop.subject_lemma, "r": prop.relation_lemma, "v": prop.value_lemma, "neg": prop.is_negated,
+        "refs": [list(ref) for ref in prop.sentence_refs], "analysis": prop.other_analysis,
+        "ep": {
+            "source_id": ep_data.source_id, "timestamp": ep_data.timestamp.isoformat(),
+            "initial": ep_data.initial_confidence, "computed": ep_data.computed_confidence,
+            "source_type": ep_data.source_type, "reliability": ep_data.reliability_score,
+            "supports": ep_data.supports, "contradicts": ep_data.contradicts, "bias_flags": ep_data.bias_flags,
+            "plausibility": ep_data.plausibility_score, "notes": ep_data.validation_notes,
+            "count": ep_data.occurrence_count,
+            "last_ref": ep_data.last_referenced.isoformat() if ep_data.last_referenced else None,
+            "meta": ep_data.other_metadata,
+        },
+    }
+
+def proposition_from_dict(data: Dict[str, Any]) -> Proposition:
+    """ proposition_to_dict çıktısından Proposition nesnesini yeniden oluşturur. """
+    ep = data["ep"]
+    ep_data = EpistemicData(
+        source_id=ep["source_id"], timestamp=datetime.fromisoformat(ep["timestamp"]),
+        initial_confidence=ep["initial"], source_type=ep.get("source_type"), reliability_score=ep.get("reliability"),
+        supports=list(ep.get("supports", [])), contradicts=list(ep.get("contradicts", [])), bias_flags=list(ep.get("bias_flags", [])),
+        plausibility_score=ep.get("plausibility"), validation_notes=list(ep.get("notes", [])),
+        occurrence_count=ep.get("count", 1),
+        last_referenced=datetime.fromisoformat(ep["last_ref"]) if ep.get("last_ref") else None,
+        other_metadata=dict(ep.get("meta", {})))
+    ep_data.computed_confidence = ep["computed"] # __post_init__ initial ile ezer
+    text_span = data.get("text", "")
+    return Proposition(
+        text_span=text_span, sentence_text=data["sent"] if data.get("sent") is not None else text_span,
+        epistemic_data=ep_data, prop_id=data["id"], subject_lemma=data.get("s"), relation_lemma=data.get("r"),
+        value_lemma=data.get("v"), is_negated=data.get("neg", False), other_analysis=dict(data.get("analysis", {})),
+        sentence_refs=[tuple(ref) for ref in data.get("refs", [])])
+
+# --- Kontrol Noktası Dosyaları ---
+def save_checkpoint(path: str, propositions: Iterable[Proposition], stage: str, meta: Optional[Dict[str, Any]] = None,
+                    document_store: Optional[DocumentStore] = None, resolve_texts: bool = True):
+    """
+    Önermeleri (verilen sırayla) ve aşama bilgisini gzip'li JSON olarak atomik biçimde yazar.
+    Sıra korunur; KB ekleme sırası linkleme ve güncelleme sonuçlarını etkiler.
+    Ofset modundaki önermelerin metinleri document_store'dan çözülerek yazılır (resolve_texts=False ise
+    yazılmaz; dokümanlar o zaman çağıran tarafından ayrıca taşınmalıdır).
+    """
+    payload = {"format": CHECKPOINT_FORMAT_VERSION, "stage": stage, "saved_at": datetime.now().isoformat(),
+               "meta": meta or {}, "propositions": [proposition_to_dict(prop, document_store, resolve_texts) for prop in propositions]}
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as checkpoint_file:
+        json.dump(payload, checkpoint_file, separators=(",", ":"), default=str)
+    os.replace(tmp_path, path)
+
+def load_checkpoint(path: str) -> Tuple[Dict[str, Proposition], Dict[str, Any]]:
+    """ Kontrol noktasını okur; (ekleme sırası korunmuş KB sözlüğü, meta + stage bilgisi) döndürür. """
+    with gzip.open(path, "rt", encoding="utf-8") as checkpoint_file:
+        payload = json.load(checkpoint_file)
+    kb: Dict[str, Proposition] = {}
+    for prop_data in payload.get("propositions", []):
+        prop = proposition_from_dict(prop_data); kb[prop.prop_id] = prop
+    meta = dict(payload.get("meta", {})); meta["stage"] = payload.get("stage")
+    return kb, meta
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    import tempfile
+    print("Testing AEE Checkpoint Module (Era Version)...")
+    if Proposition:
+        ed1 = EpistemicData(source_id="news.com", initial_confidence=0.7); ed1.computed_confidence = 0.66
+        p1 = Proposition("The sky is blue.", "The sky is blue.", ed1, subject_lemma="sky", relation_lemma="be", value_lemma="blue",
+                         sentence_refs=[("news.com#0", 0, 16)])
+        ed2 = EpistemicData(source_id="user_blog", initial_confidence=0.4)
+        p2 = Proposition("The sky is not blue.", "The sky is not blue.", ed2, subject_lemma="sky", relation_lemma="be", value_lemma="blue", is_negated=True)
+        p1.epistemic_data.contradicts.append(p2.prop_id); p2.epistemic_data.contradicts.append(p1.prop_id)
+        checkpoint_path = os.path.join(tempfile.mkdtemp(), "test.ckpt.json.gz")
+        save_checkpoint(checkpoint_path, [p1, p2], stage="link", meta={"note": "test"})
+        kb_loaded, meta = load_checkpoint(checkpoint_path)
+        print(f"Saved and loaded {len(kb_loaded)} propositions (stage: {meta['stage']}, {os.path.getsize(checkpoint_path)} bytes)")
+        for prop in kb_loaded.values(): print(f"  {prop} | Contradicts: {[pid[:8] for pid in prop.epistemic_data.contradicts]}")
+        print(f"Round trip equal: {list(kb_loaded.values()) == [p1, p2]}")
+        os.remove(checkpoint_path)
+    else: print("Could not run tests due to import error.")
+    print("\nCheckpoint module testing complete.")
@@ -0,0 +1,286 @@
+# aee_cli_era.py
+# AEE Era Sürümü: Aşamalı komut satırı arayüzü (extract, validate, link, bias, update, explain, report).
+# Her aşama bir önceki aşamanın kontrol noktasını (workdir/<aşama>.ckpt.json.gz) okur ve kendi
+# kontrol noktasını yazar. Böylece ayar denemelerinde yalnızca ucuz aşamalar (örn: update + explain)
+# yeniden çalıştırılabilir; yarıda kesilen bir "run" son tamamlanan aşamadan veya extract
+# parçasından devam eder.
+#
+# Örnek:
+#   python aee_cli_era.py run --input inputs.jsonl --workdir runs/demo
+#   python aee_cli_era.py update --workdir runs/demo
+#   python aee_cli_era.py explain --workdir runs/demo --prop-id 3f2a --trace-depth 2
+#   python aee_cli_era.py merge --workdir runs/all --shards runs/node1 runs/node2 --dedup
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from datetime import timedelta
+from typing import Dict, List, Optional, Any
+
+# Era sürümündeki modülleri import et (spaCy gerektiren extractor yalnızca extract aşamasında yüklenir)
+try:
+    from aee_core_classes_era import Proposition
+    from aee_checkpoint_era import save_checkpoint, load_checkpoint
+    from aee_validator import apply_plausibility_check_era
+    from aee_dedup_era import deduplicate_propositions
+    from aee_linker_era import find_and_link_evidence_era, link_propositions_sharded
+    from aee_bias_detector import run_bias_detection_v3
+    from aee_updater_era import run_updates_era, ConfidenceLedger, RELIABILITY_MODEL_BINARY, RELIABILITY_MODEL_TRUST
+    from aee_cycles_era import SupportCycleDetector
+    from aee_explainer_era import generate_explanation_era
+    from aee_merge_era import merge_knowledge_bases
+    from aee_temporal_era import TemporalLinkIndex, format_window_report
+except ImportError as e:
+    print(f"Fatal Error: Could not import necessary modules for the AEE CLI.")
+    print(f"Import Error: {e}")
+    exit()
+
+# --- Sabitler ---
+STAGES = ("extract", "validate", "link", "bias", "update")
+DEFAULT_CHUNK_ITEMS = 50 # extract aşamasında her N girdi öğesinde bir parça kontrol noktası yazılır
+EXTRACT_PARTS_DIR = "extract_parts"
+
+class StageError(Exception):
+    """Aşama girdisi (kontrol noktası veya girdi dosyası) bulunamadığında yükseltilir."""
+    pass
+
+# --- Yardımcılar ---
+def checkpoint_path(workdir: str, stage: str) -> str:
+    return os.path.join(workdir, f"{stage}.ckpt.json.gz")
+
+def is_stage_complete(workdir: str, stage: str) -> bool:
+    return os.path.exists(checkpoint_path(workdir, stage))
+
+def invalidate_stages_from(workdir: str, stage: str):
+    """ Verilen aşama ve sonrasının kontrol noktalarını siler (yeniden çalıştırmada eskimiş sonuç kalmasın). """
+    for later_stage in STAGES[STAGES.index(stage):]:
+        path = checkpoint_path(workdir, later_stage)
+        if os.path.exists(path): os.remove(path)
+    if stage == "extract": shutil.rmtree(os.path.join(workdir, EXTRACT_PARTS_DIR), ignore_errors=True)
+
+def load_stage_input(workdir: str, stage: str):
+    """ Aşamanın girdisi olan önceki aşama kontrol noktasını yükler. """
+    previous_stage = STAGES[STAGES.index(stage) - 1]
+    path = checkpoint_path(workdir, previous_stage)
+    if not os.path.exists(path):
+        raise StageError(f"Stage '{stage}' needs the '{previous_stage}' checkpoint ({path}). Run '{previous_stage}' first.")
+    return load_checkpoint(path)
+
+def load_latest_checkpoint(workdir: str):
+    """ Tamamlanmış en son aşamanın kontrol noktasını yükler (explain/report için). """
+    for stage in reversed(STAGES):
+        if is_stage_complete(workdir, stage): return load_checkpoint(checkpoint_path(workdir, stage))
+    raise StageError(f"No completed stage checkpoint found in '{workdir}'.")
+
+def load_shard_checkpoint(path: str) -> str:
+    """ merge için parça: kontrol noktası dosyası veya en az link aşaması tamamlanmış bir workdir. """
+    if os.path.isfile(path): return path
+    for stage in reversed(STAGES[STAGES.index("link"):]):
+        if is_stage_complete(path, stage): return checkpoint_path(path, stage)
+    raise StageError(f"Shard '{path}' has no link (or later) checkpoint. Run the shard up to 'link' first.")
+
+def load_inputs(path: str) -> List[Dict[str, str]]:
+    """ Girdi dosyasını okur: JSON listesi veya satır başına bir JSON nesnesi (JSONL). """
+    if not os.path.exists(path): raise StageError(f"Input file not found: {path}")
+    with open(path, encoding="utf-8") as input_file: content = input_file.read()
+    if content.lstrip().startswith("["): return json.loads(content)
+    return [json.loads(line) for line in content.splitlines() if line.strip()]
+
+# --- Aşamalar ---
+def stage_extract(workdir: str, input_path: str, chunk_items: int = DEFAULT_CHUNK_ITEMS,
+                  max_chunk_chars: Optional[int] = None, two_tier: bool = False) -> int:
+    """
+    Girdi öğelerinden önerme çıkarır. Her chunk_items öğede bir parça kontrol noktası yazılır;
+    kesilen çalışma son tamamlanan parçadan devam eder. Bitince parçalar tek kontrol noktasında birleşir.
+    """
+    inputs = load_inputs(input_path)
+    parts_dir = os.path.join(workdir, EXTRACT_PARTS_DIR); os.makedirs(parts_dir, exist_ok=True)
+    part_files = sorted(name for name in os.listdir(parts_dir) if name.endswith(".ckpt.json.gz"))
+    next_item = 0
+    if part_files:
+        _, last_meta = load_checkpoint(os.path.join(parts_dir, part_files[-1]))
+        if last_meta.get("input") != os.path.abspath(input_path):
+            raise StageError(f"Extract parts in '{parts_dir}' belong to another input ({last_meta.get('input')}). Use --from extract to restart.")
+        next_item = last_meta.get("next_item", 0)
+        print(f"Resuming extract at input item {next_item}/{len(inputs)} ({len(part_files)} parts done).")
+
+    if next_item < len(inputs):
+        # spaCy modeli yalnızca gerçekten çıkarım yapılacaksa yüklenir
+        import aee_era_main
+        extract_kwargs: Dict[str, Any] = {"max_chunk_chars": max_chunk_chars} if max_chunk_chars else {}
+        if two_tier: extract_kwargs["two_tier"] = True
+        for chunk_start in range(next_item, len(inputs), chunk_items):
+            chunk_end = min(chunk_start + chunk_items, len(inputs))
+            chunk_props: List[Proposition] = []
+            for item_index in range(chunk_start, chunk_end):
+                chunk_props.extend(aee_era_main.extract_input_propositions(inputs[item_index], item_index, **extract_kwargs))
+            save_checkpoint(os.path.join(parts_dir, f"part_{chunk_start:08d}.ckpt.json.gz"), chunk_props, stage="extract",
+                            meta={"input": os.path.abspath(input_path), "next_item": chunk_end})
+            print(f"  Extracted items {chunk_start}-{chunk_end - 1}: {len(chunk_props)} propositions.")
+
+    all_props: List[Proposition] = []
+    for name in sorted(name for name in os.listdir(parts_dir) if name.endswith(".ckpt.json.gz")):
+        part_kb, _ = load_checkpoint(os.path.join(parts_dir, name)); all_props.extend(part_kb.values())
+    save_checkpoint(checkpoint_path(workdir, "extract"), all_props, stage="extract",
+                    meta={"input": os.path.abspath(input_path), "items": len(inputs)})
+    shutil.rmtree(parts_dir, ignore_errors=True)
+    return len(all_props)
+
+def stage_validate(workdir: str) -> int:
+    kb, _ = load_stage_input(workdir, "validate")
+    for prop in kb.values(): apply_plausibility_check_era(prop)
+    save_checkpoint(checkpoint_path(workdir, "validate"), kb.values(), stage="validate")
+    return len(kb)
+
+def stage_link(workdir: str, dedup: bool = False, link_workers: int = 1, link_window_days: Optional[float] = None,
+               measure_skipped_links: bool = False) -> int:
+    extracted_kb, _ = load_stage_input(workdir, "link")
+    new_props = list(extracted_kb.values())
+    if dedup: new_props = deduplicate_propositions(new_props)
+    knowledge_base: Dict[str, Proposition] = {}
+    temporal_index = (TemporalLinkIndex(timedelta(days=link_window_days), measure_skipped_links=measure_skipped_links)
+                      if link_window_days is not None else None)
+    if link_workers > 1 and temporal_index is None: link_propositions_sharded(new_props, knowledge_base, num_workers=link_workers)
+    else:
+        for new_prop in new_props:
+            if new_prop.prop_id not in knowledge_base:
+                if temporal_index is not None: temporal_index.link(new_prop, knowledge_base)
+                else: find_and_link_evidence_era(new_prop, knowledge_base)
+                knowledge_base[new_prop.prop_id] = new_prop
+    if temporal_index is not None: print(f"  {format_window_report(temporal_index.report())}")
+    save_checkpoint(checkpoint_path(workdir, "link"), knowledge_base.values(), stage="link",
+                    meta={"dedup": dedup, "link_window_days": link_window_days})
+    return len(knowledge_base)
+
+def stage_bias(workdir: str) -> int:
+    kb, _ = load_stage_input(workdir, "bias")
+    if kb: run_bias_detection_v3(kb)
+    save_checkpoint(checkpoint_path(workdir, "bias"), kb.values(), stage="bias")
+    return len(kb)
+
+def stage_update(workdir: str, reliability_model: str = RELIABILITY_MODEL_BINARY, update_workers: int = 1,
+                 incremental_cycles: bool = False) -> int:
+    kb, _ = load_stage_input(workdir, "update")
+    ledger = ConfidenceLedger()
+    cycle_detector = None
+    if incremental_cycles: # Linkleme ayrı aşamada yapıldı: bağlantılar tek seferde yeniden oynatılır
+        cycle_detector = SupportCycleDetector(); cycle_detector.request_full_rescan()
+    run_updates_era(kb, ledger=ledger, reliability_model=reliability_model, update_workers=update_workers, cycle_detector=cycle_detector)
+    save_checkpoint(checkpoint_path(workdir, "update"), kb.values(), stage="update",
+                    meta={"ledger": ledger.as_rows(), "reliability_model": reliability_model})
+    return len(kb)
+
+def run_stage(workdir: str, stage: str, args: argparse.Namespace) -> int:
+    """ Tek bir aşamayı çalıştırır; sonraki aşamaların kontrol noktaları eskidiği için silinir. """
+    for later_stage in STAGES[STAGES.index(stage) + 1:]:
+        if is_stage_complete(workdir, later_stage): os.remove(checkpoint_path(workdir, later_stage))
+    stage_start = time.time()
+    if stage == "extract": count = stage_extract(workdir, args.input, args.chunk_items, args.max_chunk_chars, args.two_tier)
+    elif stage == "validate": count = stage_validate(workdir)
+    elif stage == "link": count = stage_link(workdir, args.dedup, args.link_workers, args.link_window_days, args.measure_skipped_links)
+    elif stage == "bias": count = stage_bias(workdir)
+    else: count = stage_update(workdir, args.reliability_model, args.update_workers, args.incremental_cycles)
+    print(f"[{stage}] complete: {count} propositions -> {checkpoint_path(workdir, stage)} ({time.time() - stage_start:.2f}s)")
+    return count
+
+# --- Komutlar ---
+def command_run(args: argparse.Namespace):
+    """ Tüm aşamaları sırayla çalıştırır; tamamlanmış aşamalar atlanır (devam etme). """
+    if args.from_stage: invalidate_stages_from(args.workdir, args.from_stage)
+    for stage in STAGES:
+        if is_stage_complete(args.workdir, stage): print(f"[{stage}] already complete, skipping."); continue
+        if stage == "extract" and not args.input: raise StageError("The extract stage needs --input.")
+        run_stage(args.workdir, stage, args)
+
+def command_explain(args: argparse.Namespace):
+    kb, meta = load_latest_checkpoint(args.workdir)
+    ledger = ConfidenceLedger.from_rows(meta["ledger"]) if meta.get("ledger") else None
+    if args.prop_id:
+        prop_ids = [prop_id for prop_id in kb if prop_id.startswith(args.prop_id)]
+        if not prop_ids: raise StageError(f"No proposition id starts with '{args.prop_id}'.")
+    else: prop_ids = list(kb.keys())
+    trace_memo: Dict[str, Any] = {}
+    for prop_id in prop_ids:
+        print(generate_explanation_era(prop_id, kb, trace_depth=args.trace_depth, trace_memo=trace_memo, ledger=ledger))
+        print("-" * 40)
+
+def command_report(args: argparse.Namespace):
+    kb, meta = load_latest_checkpoint(args.workdir)
+    print(f"Report from the '{meta.get('stage')}' checkpoint.")
+    from aee_era_main import report_kb_era # Rapor fonksiyonu ana script'te
+    report_kb_era(kb)
+
+def command_merge(args: argparse.Namespace):
+    """ Linklenmiş parçaları birleştirir, birleşik KB'yi günceller ve workdir'e update kontrol noktası olarak yazar. """
+    shard_paths = [load_shard_checkpoint(path) for path in args.shards]
+    workdir = os.path.realpath(args.workdir)
+    for path in shard_paths: # workdir temizliği bir parçanın kontrol noktasını silmesin
+        if os.path.commonpath([workdir, os.path.realpath(path)]) == workdir:
+            raise StageError(f"Shard '{path}' lies inside the merge workdir '{args.workdir}'. Use a separate --workdir.")
+    invalidate_stages_from(args.workdir, "extract") # workdir'deki eski aşamalar birleşik KB'ye ait değil
+    ledger = ConfidenceLedger(); merge_stats: Dict[str, Any] = {}
+    kb = merge_knowledge_bases(shard_paths, dedup=args.dedup, reliability_model=args.reliability_model,
+                               update_workers=args.update_workers, ledger=ledger, stats=merge_stats)
+    save_checkpoint(checkpoint_path(args.workdir, "update"), kb.values(), stage="update",
+                    meta={"ledger": ledger.as_rows(), "reliability_model": args.reliability_model,
+                          "shards": [os.path.abspath(path) for path in shard_paths], "merge": merge_stats["merge"]})
+    print(f"[merge] complete: {len(kb)} propositions -> {checkpoint_path(args.workdir, 'update')}")
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="AEE Era staged pipeline with per-stage checkpoints.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(sub, with_input=False):
+        sub.add_argument("--workdir", required=True, help="Directory holding the stage checkpoints.")
+        if with_input:
+            sub.add_argument("--input", help="Input file: JSON list or JSONL of {source_id, text|path, source_type}.")
+            sub.add_argument("--chunk-items", type=int, default=DEFAULT_CHUNK_ITEMS, help="Input items per extract checkpoint part.")
+            sub.add_argument("--max-chunk-chars", type=int, default=None, help="Longer texts are parsed in sentence-aligned chunks.")
+            sub.add_argument("--two-tier", action="store_true", help="Fully parse only sentences that pass the cheap claim prefilter.")
+            sub.add_argument("--dedup", action="store_true", help="Collapse identical same-source propositions before linking.")
+            sub.add_argument("--link-workers", type=int, default=1, help="Link in subject shards across processes.")
+            sub.add_argument("--link-window-days", type=float, default=None, help="Only link propositions whose timestamps are at most this many days apart (serial linking).")
+            sub.add_argument("--measure-skipped-links", action="store_true", help="With --link-window-days, also count the links the window leaves out (scans all same-subject candidates).")
+            sub.add_argument("--reliability-model", choices=(RELIABILITY_MODEL_BINARY, RELIABILITY_MODEL_TRUST),
+                             default=RELIABILITY_MODEL_BINARY, help="Source reliability model used by the update stage.")
+            sub.add_argument("--update-workers", type=int, default=1, help="Update confidences per link component across processes.")
+            sub.add_argument("--incremental-cycles", action="store_true", help="Flag circular support by replaying support links instead of the full DFS scan.")
+
+    add_common(subparsers.add_parser("run", help="Run (or resume) all stages up to update."), with_input=True)
+    subparsers.choices["run"].add_argument("--from", dest="from_stage", choices=STAGES, help="Discard this stage and later ones, then run.")
+    for stage in STAGES:
+        add_common(subparsers.add_parser(stage, help=f"Run only the {stage} stage."), with_input=True)
+    explain_parser = subparsers.add_parser("explain", help="Explain propositions from the latest checkpoint.")
+    add_common(explain_parser)
+    explain_parser.add_argument("--prop-id", help="Explain only propositions whose id starts with this prefix.")
+    explain_parser.add_argument("--trace-depth", type=int, default=0, help="Append multi-hop evidence chains up to this depth.")
+    add_common(subparsers.add_parser("report", help="Print the KB report from the latest checkpoint."))
+    merge_parser = subparsers.add_parser("merge", help="Merge independently linked shards into one updated KB.")
+    add_common(merge_parser)
+    merge_parser.add_argument("--shards", nargs="+", required=True, help="Shard workdirs (linked or later) or checkpoint files, in merge order.")
+    merge_parser.add_argument("--dedup", action="store_true", help="Collapse identical same-source propositions across shards.")
+    merge_parser.add_argument("--reliability-model", choices=(RELIABILITY_MODEL_BINARY, RELIABILITY_MODEL_TRUST),
+                              default=RELIABILITY_MODEL_BINARY, help="Source reliability model used by the merged update.")
+    merge_parser.add_argument("--update-workers", type=int, default=1, help="Update confidences per link component across processes.")
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    os.makedirs(args.workdir, exist_ok=True)
+    try:
+        if args.command == "run": command_run(args)
+        elif args.command == "explain": command_explain(args)
+        elif args.command == "report": command_report(args)
+        elif args.command == "merge": command_merge(args)
+        else:
+            if args.command == "extract" and not args.input: raise StageError("The extract stage needs --input.")
+            run_stage(args.workdir, args.command, args)
+    except StageError as e:
+        print(f"Error: {e}"); return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,7 @@
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 @dataclass
 class EpistemicData:
@@ -28,6 +28,11 @@ class EpistemicData:
     plausibility_score: Optional[float] = None # Önermenin genel makullük/olabilirlik skoru (örn: 0.0-1.0)
     validation_notes: List[str] = field(default_factory=list) # Makullük kontrolünden gelen notlar (örn: ['Contradicts common sense'])
 
+    # Tekilleştirme (dedup): Aynı kaynaktan gelen özdeş önermenin kaç kez görüldüğü
+    occurrence_count: int = 1
+    # Saklama (retention): Önermeye en son ne zaman bağlantı kurulduğu (None ise timestamp kullanılır)
+    last_referenced: Optional[datetime] = None
+
     other_metadata: Dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self):
@@ -48,6 +53,8 @@ class Proposition:
     value_lemma: Optional[str] = None
     is_negated: bool = False
     other_analysis: Dict[str, Any] = field(default_factory=dict)
+    # Önermenin geçtiği cümlelere referanslar: (doc_id, start_char, end_char)
+    sentence_refs: List[Tuple[str, int, int]] = field(default_factory=list)
 
     def __str__(self):
         # Raporlamada kolaylık için __str__ güncellenebilir, şimdilik aynı.
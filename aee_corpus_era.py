@@ -0,0 +1,126 @@
+# aee_corpus_era.py
+# AEE Era Sürümü: Ham girdi metinlerini doküman başına tek bir tamponda (veya bellek eşlemli
+# dosyada) tutar. Ofset modunda önermeler cümle metnini kopyalamaz; yalnızca
+# (doc_id, start_char, end_char) referansı saklanır ve metin gerektiğinde üretilir.
+
+import mmap
+from typing import Dict, Optional, Tuple, List, Any
+
+# --- Sabitler ---
+CHECKPOINT_CHARS = 4096 # Bellek eşlemli UTF-8 dosyalarda karakter -> bayt dönüşümü için kontrol noktası aralığı
+MAX_UTF8_BYTES_PER_CHAR = 4
+
+class DocumentStore:
+    """
+    doc_id -> doküman metni deposu. Metin girdileri tek bir paylaşılan str olarak tutulur;
+    dosya girdileri mmap ile eşlenir ve yalnızca istenen aralık çözülür (decode).
+    """
+
+    def __init__(self):
+        self._texts: Dict[str, str] = {}
+        # doc_id -> (mmap, dosya nesnesi, karakter kontrol noktalarının bayt ofsetleri; ASCII ise None)
+        self._mapped: Dict[str, Tuple[mmap.mmap, Any, Optional[List[int]]]] = {}
+
+    def add_text(self, doc_id: str, text: str):
+        """ Metni kopyalamadan depoya ekler (aynı str nesnesi paylaşılır). Aynı doc_id varsa eski kayıt kapatılıp değiştirilir. """
+        self.remove(doc_id)
+        self._texts[doc_id] = text
+
+    def add_file(self, doc_id: str, path: str) -> str:
+        """
+        UTF-8 dosyayı bellek eşlemli olarak depoya ekler ve ayrıştırma için çözülmüş metni döndürür.
+        Çağıran taraf ayrıştırmadan sonra bu metni bırakmalıdır; önermeler metne ofsetlerle erişir.
+        Boş veya geçersiz UTF-8 dosyalar bellek içi tampon olarak tutulur. Aynı doc_id varsa eski kayıt
+        (eşleme ve dosya tanıtıcısı) kapatılıp değiştirilir.
+        """
+        self.remove(doc_id)
+        file_obj = open(path, "rb")
+        try:
+            mapped = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # Boş dosya eşlenemez
+            file_obj.close(); self._texts[doc_id] = ""; return ""
+        try:
+            text = mapped[:].decode("utf-8")
+        except UnicodeDecodeError:
+            text = mapped[:].decode("utf-8", errors="replace")
+            mapped.close(); file_obj.close(); self._texts[doc_id] = text
+            return text
+        checkpoints: Optional[List[int]] = None
+        if not text.isascii(): # ASCII'de karakter ofseti = bayt ofseti
+            checkpoints = [0]
+            for pos in range(0, len(text), CHECKPOINT_CHARS):
+                checkpoints.append(checkpoints[-1] + len(text[pos:pos + CHECKPOINT_CHARS].encode("utf-8")))
+        self._mapped[doc_id] = (mapped, file_obj, checkpoints)
+        return text
+
+    def get_text(self, doc_id: str, start_char: int, end_char: int) -> Optional[str]:
+        """ Dokümandaki [start_char, end_char) aralığını döndürür; doküman yoksa None. """
+        text = self._texts.get(doc_id)
+        if text is not None: return text[start_char:end_char]
+        entry = self._mapped.get(doc_id)
+        if entry is None: return None
+        mapped, _, checkpoints = entry
+        if checkpoints is None: return mapped[start_char:end_char].decode("ascii")
+        block = start_char // CHECKPOINT_CHARS
+        base_byte = checkpoints[block]; rel_start = start_char - block * CHECKPOINT_CHARS; rel_end = end_char - block * CHECKPOINT_CHARS
+        # Üst sınır kadar bayt çöz; sonda yarım kalan karakter istenen aralığın dışındadır
+        decoded = mapped[base_byte:base_byte + rel_end * MAX_UTF8_BYTES_PER_CHAR].decode("utf-8", errors="ignore")
+        return decoded[rel_start:rel_end]
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._texts or doc_id in self._mapped
+
+    def as_rows(self) -> Dict[str, Dict[str, str]]:
+        """ Depoyu {"texts": {doc_id: metin}, "files": {doc_id: dosya yolu}} olarak döndürür (kontrol noktasına yazmak için). """
+        return {"texts": dict(self._texts), "files": {doc_id: entry[1].name for doc_id, entry in self._mapped.items()}}
+
+    def add_rows(self, rows: Dict[str, Dict[str, str]]):
+        """ as_rows çıktısındaki, depoda henüz olmayan dokümanları ekler (dosyalar yeniden eşlenir). """
+        for doc_id, text in rows.get("texts", {}).items():
+            if doc_id not in self: self.add_text(doc_id, text)
+        for doc_id, path in rows.get("files", {}).items():
+            if doc_id not in self: self.add_file(doc_id, path)
+
+    def remove(self, doc_id: str):
+        self._texts.pop(doc_id, None)
+        entry = self._mapped.pop(doc_id, None)
+        if entry: entry[0].close(); entry[1].close()
+
+    def close(self):
+        for doc_id in list(self._mapped.keys()): self.remove(doc_id)
+        self._texts.clear()
+
+# Explainer ve dışa aktarım için varsayılan (süreç genelinde) depo
+DEFAULT_DOCUMENT_STORE = DocumentStore()
+
+def resolve_sentence_text(prop: Any, store: Optional[DocumentStore] = None) -> str:
+    """
+    Önermenin cümle metnini döndürür. Metin önermede saklanmıyorsa (ofset modu)
+    ilk cümle referansı üzerinden depodan üretilir.
+    """
+    if prop.sentence_text: return prop.sentence_text
+    if prop.sentence_refs:
+        doc_id, start_char, end_char = prop.sentence_refs[0]
+        text = (store or DEFAULT_DOCUMENT_STORE).get_text(doc_id, start_char, end_char)
+        if text is not None: return text
+    return ""
+
+def resolve_text_span(prop: Any, store: Optional[DocumentStore] = None) -> str:
+    """ Önermenin metin parçasını döndürür (Era extractor'da text_span tüm cümledir). """
+    return prop.text_span if prop.text_span else resolve_sentence_text(prop, store)
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    import os, tempfile
+    print("Testing AEE Corpus Module (Era Version)...")
+    store = DocumentStore()
+    store.add_text("doc_text", "The sky is blue. Water is wet.")
+    print(f"Text buffer slice: '{store.get_text('doc_text', 17, 30)}'")
+    sample = "Çay sıcaktır. " * 1000 + "The sun is hot."
+    with tempfile.NamedTemporaryFile("wb", suffix=".txt", delete=False) as tmp:
+        tmp.write(sample.encode("utf-8")); tmp_path = tmp.name
+    decoded = store.add_file("doc_file", tmp_path)
+    start = decoded.index("The sun")
+    print(f"Mapped file slice: '{store.get_text('doc_file', start, start + 15)}' (matches: {decoded[start:start + 15] == store.get_text('doc_file', start, start + 15)})")
+    store.close(); os.remove(tmp_path)
+    print("\nCorpus module testing complete.")
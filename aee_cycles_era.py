@@ -0,0 +1,156 @@
+# aee_cycles_era.py
+# AEE Era Sürümü: Destek bağlantısı eklenirken artımlı döngü (circular support) tespiti.
+# Linker A-B destek bağlantısını eklemeden önce B'nin mevcut destek bağlantılarıyla A'ya
+# ulaşıp ulaşamadığına bakılır; ulaşıyorsa yeni bağlantı bir döngü kapatır ve yalnızca bu
+# döngünün üyeleri CIRCULAR_SUPPORT ile işaretlenir. Union-find bağlı olmayan uçlar için
+# aramayı tamamen atlar; bağlıysa sınırlı BFS ile döngü yolu bulunur. Arama sınırı aşılırsa
+# güncelleme aşamasında tam yeniden tarama (rescan) yapılır.
+#
+# Not: Destek bağlantıları simetrik tutulduğu için her bağlantı yönlü grafta kendi başına bir
+# 2-döngüdür. Buradaki döngü, bağlantı eklenmeden önce uçların zaten bağlı olmasıdır (en az 3
+# önermelik döngü). Bu tanım KB sırasından bağımsızdır; updater'daki tam DFS taraması
+# (detect_circular_support_era) ise ilk bulduğu döngüde durduğu için ziyaret sırasına bağlıdır.
+
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Any
+
+# Era sürümündeki sınıfları import et
+try:
+    from aee_core_classes_era import Proposition
+    from aee_events_era import emit, EVENT_FLAG_SET
+except ImportError:
+    print("Cycles Error: Could not import dependencies from aee_core_classes_era.py or aee_events_era.py.")
+    Proposition = None
+
+# --- Sabitler ---
+CIRCULAR_SUPPORT_FLAG = "CIRCULAR_SUPPORT"
+DEFAULT_MAX_SEARCH_NODES = 10000 # Bağlantı başına BFS'te ziyaret edilecek en fazla önerme
+_SEARCH_EXCEEDED = object()
+
+class SupportCycleDetector:
+    """
+    Destek bağlantıları eklendikçe döngüleri artımlı olarak tespit eder.
+    Linker her yeni destek bağlantısından önce on_support_edge'i çağırır. Aynı nesne sürekli
+    veri girişinde birden fazla pipeline çalıştırmasında kullanılabilir (mevcut KB için önce build).
+    """
+
+    def __init__(self, max_search_nodes: Optional[int] = DEFAULT_MAX_SEARCH_NODES):
+        self.max_search_nodes = max_search_nodes
+        self.needs_full_rescan = False # Sınır aşıldı veya bağlantılar toplu eklendi (örn: parçalı linkleme)
+        self.stats: Dict[str, int] = {"edges_checked": 0, "searches": 0, "cycles_found": 0, "flagged": 0, "searches_exceeded": 0}
+        self._parent: Dict[str, str] = {}
+
+    # --- Union-find (bağlılık ön filtresi; KB'den silinen önermeler yüzünden fazla bağlı görünebilir, BFS doğrular) ---
+    def _find(self, prop_id: str) -> str:
+        parent = self._parent
+        if prop_id not in parent: parent[prop_id] = prop_id; return prop_id
+        while parent[prop_id] != prop_id:
+            parent[prop_id] = parent[parent[prop_id]]; prop_id = parent[prop_id]
+        return prop_id
+
+    def _union(self, root_a: str, root_b: str):
+        if root_a != root_b: self._parent[root_b] = root_a
+
+    def build(self, kb: Dict[str, Proposition]):
+        """ Mevcut KB'nin destek bağlantılarından bağlılık bilgisini kurar (işaretleme yapmaz). """
+        for prop_id, prop in kb.items():
+            for linked_id in prop.epistemic_data.supports:
+                if linked_id in kb: self._union(self._find(prop_id), self._find(linked_id))
+
+    def prune(self, kb: Dict[str, Proposition]):
+        """ Bağlılık bilgisini KB'de kalan önermelerden yeniden kurar (çıkarılan önermelerin kayıtları bırakılır). """
+        self._parent = {}; self.build(kb)
+
+    def request_full_rescan(self):
+        self.needs_full_rescan = True
+
+    def _find_support_path(self, start_id: str, target_id: str, get_neighbours: Callable[[str], Iterable[str]],
+                           max_nodes: Optional[int]) -> Any:
+        """ start_id'den target_id'ye destek bağlantılarıyla BFS; yol (start..target), None veya sınır aşımı işareti döndürür. """
+        came_from: Dict[str, Optional[str]] = {start_id: None}; frontier = deque([start_id])
+        while frontier:
+            current_id = frontier.popleft()
+            for neighbour_id in get_neighbours(current_id):
+                if neighbour_id in came_from: continue
+                came_from[neighbour_id] = current_id
+                if neighbour_id == target_id:
+                    path = [neighbour_id]
+                    while came_from[path[-1]] is not None: path.append(came_from[path[-1]])
+                    return path[::-1]
+                if max_nodes is not None and len(came_from) > max_nodes: return _SEARCH_EXCEEDED
+                frontier.append(neighbour_id)
+        return None
+
+    def _check_edge(self, kb: Dict[str, Proposition], id_a: str, id_b: str, get_neighbours: Callable[[str], Iterable[str]],
+                    get_prop: Callable[[str], Optional[Proposition]], max_nodes: Optional[int]) -> int:
+        self.stats["edges_checked"] += 1
+        root_a, root_b = self._find(id_a), self._find(id_b)
+        if root_a != root_b: self._union(root_a, root_b); return 0 # Farklı bileşenler: döngü olamaz
+        self.stats["searches"] += 1
+        path = self._find_support_path(id_b, id_a, get_neighbours, max_nodes)
+        if path is _SEARCH_EXCEEDED:
+            self.stats["searches_exceeded"] += 1; self.needs_full_rescan = True; return 0
+        if path is None: return 0
+        self.stats["cycles_found"] += 1; flagged_count = 0
+        for node_id in path:
+            node_prop = get_prop(node_id)
+            if node_prop and CIRCULAR_SUPPORT_FLAG not in node_prop.epistemic_data.bias_flags:
+                node_prop.epistemic_data.bias_flags.append(CIRCULAR_SUPPORT_FLAG); flagged_count += 1
+                emit(kb, EVENT_FLAG_SET, node_prop, flag=CIRCULAR_SUPPORT_FLAG)
+        self.stats["flagged"] += flagged_count
+        return flagged_count
+
+    def on_support_edge(self, new_prop: Proposition, old_prop: Proposition, kb: Dict[str, Proposition]) -> int:
+        """
+        new_prop -> old_prop destek bağlantısı EKLENMEDEN önce çağrılır. Bağlantı bir döngü kapatıyorsa
+        döngü üyelerini işaretler ve yeni işaretlenen önerme sayısını döndürür. new_prop henüz KB'de olmayabilir.
+        """
+        if old_prop.prop_id in new_prop.epistemic_data.supports: return 0 # Bağlantı zaten var
+        new_id = new_prop.prop_id
+        def get_prop(prop_id: str) -> Optional[Proposition]:
+            return new_prop if prop_id == new_id else kb.get(prop_id)
+        def get_neighbours(prop_id: str) -> Iterable[str]:
+            prop = get_prop(prop_id)
+            return prop.epistemic_data.supports if prop else ()
+        return self._check_edge(kb, new_id, old_prop.prop_id, get_neighbours, get_prop, self.max_search_nodes)
+
+    def rescan(self, kb: Dict[str, Proposition]) -> int:
+        """
+        Tam yeniden tarama (toplu yeniden kurulum): destek bağlantıları linkleme sırasıyla (KB sırası)
+        yeniden oynatılır ve her bağlantı sınırsız aramayla kontrol edilir. Sonuç, aynı KB'nin seri
+        linklemesi sırasında artımlı modun vereceği işaretlerle aynıdır. Yeni işaretlenen önerme sayısını döndürür.
+        """
+        if not Proposition: return 0
+        self._parent = {}; self.needs_full_rescan = False
+        position = {prop_id: index for index, prop_id in enumerate(kb)}
+        replayed: Dict[str, List[str]] = {prop_id: [] for prop_id in kb}
+        flagged_count = 0
+        for prop_id, prop in kb.items():
+            # Bir önerme linklendiğinde yalnızca kendinden önce eklenmiş önermelere bağlanır
+            for linked_id in prop.epistemic_data.supports:
+                if position.get(linked_id, len(position)) >= position[prop_id]: continue
+                flagged_count += self._check_edge(kb, prop_id, linked_id, replayed.__getitem__, kb.get, None)
+                replayed[prop_id].append(linked_id); replayed[linked_id].append(prop_id)
+        return flagged_count
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE Cycles Module (Era Version)...")
+    if Proposition:
+        from aee_core_classes_era import EpistemicData
+        kb_test: Dict[str, Proposition] = {}
+        detector = SupportCycleDetector()
+        def add_prop(name: str, supported_names: List[str]) -> Proposition:
+            prop = Proposition(name, name, EpistemicData(source_id=f"src_{name}"), prop_id=name, subject_lemma="x", relation_lemma="be", value_lemma=name)
+            for supported_name in supported_names: # Linker'ın yaptığı gibi: önce kontrol, sonra simetrik bağlantı
+                old_prop = kb_test[supported_name]; detector.on_support_edge(prop, old_prop, kb_test)
+                prop.epistemic_data.supports.append(old_prop.prop_id); old_prop.epistemic_data.supports.append(prop.prop_id)
+            kb_test[prop.prop_id] = prop; return prop
+        add_prop("a", []); add_prop("b", ["a"]); add_prop("c", ["b"]); add_prop("d", ["c", "a"]) # a-b-c-d-a döngüsü
+        add_prop("e", ["a"]); add_prop("f", []) # Döngü dışı
+        print(f"Incremental flags: {[pid for pid, p in kb_test.items() if CIRCULAR_SUPPORT_FLAG in p.epistemic_data.bias_flags]}")
+        print(f"Stats: {detector.stats}")
+        for prop in kb_test.values(): prop.epistemic_data.bias_flags.clear()
+        print(f"Rescan flagged {SupportCycleDetector().rescan(kb_test)}: {[pid for pid, p in kb_test.items() if p.epistemic_data.bias_flags]}")
+    else: print("Could not run tests due to import error.")
+    print("\nCycles module testing complete.")
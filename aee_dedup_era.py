@@ -0,0 +1,86 @@
+# aee_dedup_era.py
+# AEE Era Sürümü: Aynı kaynaktan gelen özdeş önermeleri sayaçlı tek bir kayda indirger.
+# Tekrarlı derlemlerde KB'nin ve bağlantı grafiğinin karesel büyümesini engeller.
+
+from typing import Dict, List, Optional, Tuple
+
+# Era sürümündeki sınıfları import et
+try:
+    from aee_core_classes_era import Proposition
+except ImportError:
+    print("Dedup Error: Could not import Proposition class from aee_core_classes_era.py.")
+    Proposition = None
+
+# (source_id, subject, relation, value, is_negated)
+DedupKey = Tuple[str, Optional[str], Optional[str], Optional[str], bool]
+
+# --- Yardımcı Fonksiyonlar ---
+def get_dedup_key(prop: Proposition) -> DedupKey:
+    """ Önermenin tekilleştirme anahtarını döndürür: (source_id, subject, relation, value, is_negated). """
+    return (prop.epistemic_data.source_id, prop.subject_lemma, prop.relation_lemma, prop.value_lemma, prop.is_negated)
+
+def merge_duplicate_proposition(canonical: Proposition, duplicate: Proposition):
+    """
+    duplicate önermesini canonical kaydın içine katar: tekrar sayacı ve cümle referansları
+    birleştirilir, başlangıç güveni tüm tekrarların ağırlıklı ortalamasına çekilir
+    (dilbilimsel ipuçları tekrarlar arasında farklı olabilir).
+    Not: Bu fonksiyon doğrudan canonical nesnesini değiştirir; bağlantıları (supports/contradicts) taşımaz.
+    """
+    can_ep = canonical.epistemic_data; dup_ep = duplicate.epistemic_data
+    total_count = can_ep.occurrence_count + dup_ep.occurrence_count
+    can_ep.initial_confidence = (can_ep.initial_confidence * can_ep.occurrence_count +
+                                 dup_ep.initial_confidence * dup_ep.occurrence_count) / total_count
+    can_ep.occurrence_count = total_count
+    for note in dup_ep.validation_notes:
+        if note not in can_ep.validation_notes: can_ep.validation_notes.append(note)
+    canonical.sentence_refs.extend(duplicate.sentence_refs)
+
+def build_dedup_index(kb: Dict[str, Proposition]) -> Dict[DedupKey, Proposition]:
+    """ Mevcut KB'deki önermeler için anahtar -> kanonik önerme indeksini oluşturur. """
+    dedup_index: Dict[DedupKey, Proposition] = {}
+    if not Proposition: return dedup_index
+    for prop in kb.values():
+        dedup_index.setdefault(get_dedup_key(prop), prop)
+    return dedup_index
+
+# --- Ana Tekilleştirme Fonksiyonu ---
+def deduplicate_propositions(propositions: List[Proposition],
+                             dedup_index: Optional[Dict[DedupKey, Proposition]] = None) -> List[Proposition]:
+    """
+    Özdeş önermeleri tek bir kayıtta toplar ve yalnızca yeni kanonik önermeleri
+    (ilk görülme sırasıyla) döndürür. dedup_index verilirse mevcut KB'deki kayıtlarla da
+    eşleştirme yapılır ve indeks yerinde güncellenir.
+    """
+    if dedup_index is None: dedup_index = {}
+    unique_props: List[Proposition] = []
+    if not Proposition: return unique_props
+    for prop in propositions:
+        key = get_dedup_key(prop)
+        canonical = dedup_index.get(key)
+        if canonical is None:
+            dedup_index[key] = prop
+            unique_props.append(prop)
+        else:
+            merge_duplicate_proposition(canonical, prop)
+    return unique_props
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE Dedup Module (Era Version)...")
+    if Proposition:
+        from aee_core_classes_era import EpistemicData
+        props_test: List[Proposition] = []
+        for i in range(5):
+            ed = EpistemicData(source_id="blog_a", initial_confidence=0.5 + 0.05 * i)
+            props_test.append(Proposition("sky is blue", "The sky is blue.", ed, subject_lemma="sky", relation_lemma="be",
+                                          value_lemma="blue", sentence_refs=[("blog_a#0", i * 20, i * 20 + 16)]))
+        ed_neg = EpistemicData(source_id="blog_a"); props_test.append(Proposition("sky is not blue", "The sky is not blue.", ed_neg, subject_lemma="sky", relation_lemma="be", value_lemma="blue", is_negated=True))
+        ed_other = EpistemicData(source_id="news.com"); props_test.append(Proposition("sky is blue", "The sky is blue.", ed_other, subject_lemma="sky", relation_lemma="be", value_lemma="blue"))
+
+        unique = deduplicate_propositions(props_test)
+        print(f"\n{len(props_test)} propositions -> {len(unique)} unique records")
+        for prop in unique:
+            print(f"  {prop} | Count: {prop.epistemic_data.occurrence_count} | "
+                  f"Initial: {prop.epistemic_data.initial_confidence:.3f} | Refs: {len(prop.sentence_refs)}")
+    else: print("Could not run tests due to import error.")
+    print("\nDedup module testing complete.")
@@ -2,24 +2,44 @@
 # AEE Era Sürümü İşlem Hattını Çalıştıran Ana Script
 # Era Extractor ve Linker entegre edildi. (Era Adım 2 Tamamlandı - Proje Kodu Bitti!)
 
+import hashlib
+import os
 import time
-from typing import Dict, List, Optional, Any
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
 
 # Era sürümü klasöründeki TÜM modülleri import et
 try:
+    from spacy.tokens import Doc
     from aee_core_classes_era import Proposition, EpistemicData
-    from aee_extractor_era import process_with_spacy, extract_propositions_era, NLP_MODEL # Era Extractor
-    from aee_linker_era import find_and_link_evidence_era # Era Linker
-    from aee_updater_era import run_updates_era # Era Updater
+    from aee_extractor_era import process_with_spacy, extract_propositions_era, process_with_spacy_chunked, iter_candidate_docs_two_tier, get_two_tier_selectivity, get_source_based_confidence, NLP_MODEL, DEFAULT_MAX_CHUNK_CHARS # Era Extractor
+    from aee_linker_era import find_and_link_evidence_era, link_propositions_sharded, get_verdict_cache_stats # Era Linker
+    from aee_updater_era import run_updates_era, ConfidenceLedger, RELIABILITY_MODEL_BINARY # Era Updater
     from aee_explainer_era import generate_explanation_era # Era Explainer
     from aee_bias_detector import run_bias_detection_v3 # v3 Bias Detector
-    from aee_validator import check_plausibility_v_era # Era Validator
+    from aee_validator import apply_plausibility_check_era # Era Validator
+    from aee_dedup_era import deduplicate_propositions, build_dedup_index, get_dedup_key, merge_duplicate_proposition # Era Dedup
+    from aee_retention_era import RetentionPolicy, apply_retention_policy # Era Retention
+    from aee_kb_era import KnowledgeBase # Era KB (indeksli sorgu)
+    from aee_snapshot_era import SnapshotStore # Era Snapshot (okuyucu izolasyonu)
+    from aee_corpus_era import DocumentStore, DEFAULT_DOCUMENT_STORE # Era Corpus (ofset modu)
+    from aee_memory_era import MemoryTracker, SpillStore, estimate_kb_size # Era Memory (bütçe/spill)
+    from aee_stages_era import run_staged_pipeline, format_stage_report, DEFAULT_STAGE_QUEUE_SIZE # Era Stages (pipelining)
+    from aee_cycles_era import SupportCycleDetector # Era Cycles (artımlı döngü tespiti)
+    from aee_leaderboard_era import ContestedClaimsLeaderboard, DEFAULT_TOP_K # Era Leaderboard (canlı sıralama)
+    from aee_events_era import emit, EVENT_PROP_INSERTED # Era Events (KB değişiklik olayları)
+    from aee_changefeed_era import ChangeFeedWriter # Era Change Feed (ekleme-only değişiklik günlüğü)
+    from aee_temporal_era import TemporalLinkIndex, parse_item_timestamp, format_window_report # Era Temporal (zaman pencereli linkleme)
+    from aee_neardup_era import NearDuplicateIndex, attach_duplicate_sources, NEAR_DUP_SKIP, NEAR_DUP_MERGE # Era NearDup (MinHash/LSH)
     from aee_utils import get_proposition_by_id # Utils
 except ImportError as e:
     print(f"Fatal Error: Could not import necessary modules. Check file paths and dependencies in AEE/Era folder.")
     print(f"Import Error: {e}")
     exit()
 
+# --- Sabitler ---
+DEFAULT_EXTRACTION_BUDGET_FRACTION = 0.7 # Zaman bütçeli modda çıkarımın kullanabileceği pay (kalanı link/bias/update için)
+
 # --- Raporlama Fonksiyonu (Era) ---
 def report_kb_era(kb: Dict[str, Proposition]):
     # ... (Öncekiyle aynı - değişiklik yok) ...
@@ -51,60 +71,355 @@ def report_kb_era(kb: Dict[str, Proposition]):
             print(f"    Plaus.: {plausibility_str} | Notes: [{validation_notes_str}]")
     print("\n" + "="*70); print(" End of KB Report "); print("="*70)
 
+def report_contested_claims_era(leaderboard: ContestedClaimsLeaderboard, k: int = DEFAULT_TOP_K):
+    """ KB'yi sıralamadan, canlı leaderboard indeksinden en çok çelişilen önermeleri yazdırır. """
+    print(f"\n--- Top {k} Contested Claims (most contradicted, then highest confidence) ---")
+    contested = leaderboard.top_contradicted(k)
+    if not contested: print("  No contradicted propositions."); return
+    for rank, prop in enumerate(contested, 1):
+        ep_data = prop.epistemic_data
+        print(f"  {rank:2d}. [{len(ep_data.contradicts)} contradictions, conf {ep_data.computed_confidence:.3f}] "
+              f"{prop.subject_lemma} - {prop.relation_lemma} - {prop.value_lemma} ({ep_data.source_id}, {prop.prop_id[:8]})")
+
+
+# --- Girdi Öğesinden Önerme Çıkarma (Era) ---
+def get_item_content_digest(item: Dict[str, str]) -> str:
+    """ Öğe içeriğinin kısa SHA-1 özeti ("text" metni veya "path" dosyasının baytları). """
+    digest = hashlib.sha1()
+    text = item.get("text", "")
+    if text: digest.update(text.encode("utf-8"))
+    elif item.get("path") and os.path.exists(item["path"]):
+        with open(item["path"], "rb") as input_file:
+            for block in iter(lambda: input_file.read(1 << 20), b""): digest.update(block)
+    return digest.hexdigest()[:12]
+
+def get_item_ids(item: Dict[str, str], item_index: int) -> Tuple[str, str]:
+    """
+    Öğenin (source_id, doc_id) çifti; source_id yoksa geçici bir kaynak adı üretilir.
+    doc_id içerik özetini de taşır: item_index her pipeline çalıştırmasında 0'dan başladığından, sürekli veri
+    girişinde farklı içerikli dokümanlar aynı kimliği almaz (aynı kimlik her zaman aynı metin demektir).
+    """
+    source_id = item.get("source_id", f"unknown_source_{int(time.time())}")
+    return source_id, f"{source_id}#{item_index}:{get_item_content_digest(item)}"
+
+def get_item_timestamp(item: Dict[str, str], item_index: int) -> Optional[datetime]:
+    """ Öğenin "timestamp" alanı; geçersizse öğe için uyarı yazılır ve çıkarım anı kullanılır (None). """
+    try: return parse_item_timestamp(item.get("timestamp"))
+    except ValueError as e:
+        print(f"  Warning: input item {item_index} ({item.get('source_id')}): {e}. Using the extraction time instead.")
+        return None
+
+def parse_input_item(item: Dict[str, str], item_index: int, text_offsets: bool = False,
+                     document_store: Optional[DocumentStore] = None,
+                     max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS, two_tier: bool = False,
+                     filter_stats: Optional[Dict[str, int]] = None) -> Tuple[str, str, Iterable[Tuple[Doc, int]]]:
+    """
+    Tek bir girdi öğesinin ("text" veya "path") metnini yükler ve (source_id, doc_id, (Doc, char_offset) akışı) döndürür.
+    Uzun metinler parçalı, two_tier modunda yalnızca aday cümleler ayrıştırılır (sayılar filter_stats'a eklenir).
+    """
+    source_id, doc_id = get_item_ids(item, item_index); text = item.get("text", "")
+    if text_offsets and document_store is None: document_store = DEFAULT_DOCUMENT_STORE
+    if not text and item.get("path"):
+        if text_offsets: text = document_store.add_file(doc_id, item["path"]) # mmap; çözülmüş metin yalnızca ayrıştırma süresince tutulur
+        else:
+            with open(item["path"], encoding="utf-8") as input_file: text = input_file.read()
+    elif text and text_offsets: document_store.add_text(doc_id, text) # Kopyasız, doküman başına tek tampon
+    if not text: return source_id, doc_id, []
+    if two_tier: return source_id, doc_id, iter_candidate_docs_two_tier(text, max_chunk_chars, filter_stats=filter_stats)
+    if len(text) > max_chunk_chars:
+        # Büyük doküman: parçalı ayrıştırma, parçalar akış olarak gelir
+        return source_id, doc_id, process_with_spacy_chunked(text, max_chunk_chars)
+    doc = process_with_spacy(text)
+    return source_id, doc_id, [(doc, 0)] if doc else []
+
+def extract_input_propositions(item: Dict[str, str], item_index: int, text_offsets: bool = False,
+                               document_store: Optional[DocumentStore] = None,
+                               max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS, two_tier: bool = False,
+                               filter_stats: Optional[Dict[str, int]] = None) -> Iterator[Proposition]:
+    """
+    Tek bir girdi öğesinin önermelerini akış olarak çıkarır (makullük kontrolü yapılmaz).
+    Pipeline ve aşamalı CLI kullanır; seçenekler için bkz. parse_input_item.
+    Öğede "timestamp" (ISO 8601 / Unix saniyesi) varsa önermelerin zaman damgası odur (yoksa veya geçersizse çıkarım anı).
+    """
+    item_timestamp = get_item_timestamp(item, item_index)
+    source_id, doc_id, docs = parse_input_item(item, item_index, text_offsets, document_store, max_chunk_chars, two_tier, filter_stats)
+    for doc, char_offset in docs:
+        # ERA EXTRACTOR ÇAĞIRILIYOR
+        for prop in extract_propositions_era(doc, source_id, doc_id=doc_id, store_text=not text_offsets, char_offset=char_offset):
+            if item_timestamp is not None: prop.epistemic_data.timestamp = item_timestamp
+            yield prop
+
 
 # --- Ana İşlem Fonksiyonu (Era - Final) ---
-def run_aee_era_pipeline(inputs: List[Dict[str, str]]) -> Dict[str, Proposition]:
+def run_aee_era_pipeline(inputs: List[Dict[str, str]], dedup: bool = False, link_workers: int = 1,
+                         kb: Optional[Dict[str, Proposition]] = None,
+                         retention_policy: Optional[RetentionPolicy] = None,
+                         snapshot_store: Optional[SnapshotStore] = None,
+                         text_offsets: bool = False, document_store: Optional[DocumentStore] = None,
+                         max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS,
+                         memory_budget_mb: Optional[float] = None, track_memory: bool = False,
+                         stats: Optional[Dict[str, Any]] = None,
+                         ledger: Optional[ConfidenceLedger] = None,
+                         near_duplicates: Optional[str] = None,
+                         near_duplicate_index: Optional[NearDuplicateIndex] = None,
+                         time_budget: Optional[float] = None,
+                         extraction_budget_fraction: float = DEFAULT_EXTRACTION_BUDGET_FRACTION,
+                         reliability_model: str = RELIABILITY_MODEL_BINARY,
+                         two_tier: bool = False, pipelined: bool = False,
+                         stage_queue_size: int = DEFAULT_STAGE_QUEUE_SIZE,
+                         update_workers: int = 1, incremental_cycles: bool = False,
+                         cycle_detector: Optional[SupportCycleDetector] = None,
+                         leaderboard: Optional[ContestedClaimsLeaderboard] = None,
+                         change_feed: Optional[ChangeFeedWriter] = None,
+                         link_window: Optional[timedelta] = None,
+                         temporal_index: Optional[TemporalLinkIndex] = None,
+                         measure_skipped_links: bool = False) -> Dict[str, Proposition]:
     """
     Verilen girdiler için AEE Era işlem hattını tam olarak çalıştırır
     (Era Extract, Plausibility Check, Era Linker, Bias Detect, Era Update).
+    Girdi öğeleri "text" yerine "path" (UTF-8 dosya yolu) içerebilir.
+
+    Seçenekler:
+    - dedup: Aynı kaynaktan gelen özdeş önermeler (source, subject, relation, value, negation)
+      linklemeden önce sayaçlı tek bir kayda indirgenir.
+    - link_workers > 1: Linkleme özne hash'ine göre parçalanıp ayrı süreçlerde yapılır (sonuç seri ile aynıdır).
+    - kb: Yeni önermeler bu mevcut KB'ye eklenir (sürekli veri girişi).
+    - retention_policy: Güncellemeden sonra saklama politikası uygulanarak KB sınırlı tutulur (güvene göre
+      çıkarmada bu çalıştırmanın önermeleri de rafine güvenleriyle sıralanır).
+    - snapshot_store: Güncellemeler bittiğinde yeni KB sürümü atomik olarak yayınlanır; okuyucular
+      bu sırada snapshot_store.current üzerinden tutarlı önceki sürümü okumaya devam eder.
+    - text_offsets: Önermeler cümle metnini kopyalamaz; metinler document_store'da (varsayılan:
+      DEFAULT_DOCUMENT_STORE) doküman başına tek tampon, "path" dosyaları bellek eşlemli tutulur.
+    - max_chunk_chars: Daha uzun metinler cümle sınırlarında parçalanıp toplu ayrıştırılır.
+    - memory_budget_mb / track_memory: tracemalloc ile aşama bazında tepe bellek ölçülür; bütçe
+      aşıldığında linklemeyi bekleyen önermeler geçici diske taşınır.
+    - stats: Verilirse çalışma istatistikleri (örn: "memory") bu sözlüğe yazılır.
+    - ledger: Güncelleme sırasında her önermenin güven katkıları bu deftere kaydedilir.
+    - near_duplicates: "skip" veya "merge". Ayrıştırmadan önce metinlerin MinHash imzaları LSH indeksinde
+      (near_duplicate_index; verilmezse bu çalıştırma için yeni) aranır; eşiği geçen yakın-kopya metin
+      ayrıştırılmaz. "merge" modunda kaynak kimliği kanonik dokümanın önermelerine
+      (other_metadata["duplicate_sources"]) eklenir. Sayılar stats["near_duplicates"] altına yazılır.
+    - time_budget: Saniye cinsinden süre bütçesi (anytime modu). Girdiler kaynak güvenine göre
+      (get_source_based_confidence, yüksekten düşüğe) sıralanır; bütçenin extraction_budget_fraction
+      kadarı dolmak üzereyken çıkarım durur. Linkleme, bias tespiti ve güncelleme alınan önermeler
+      üzerinde yine tamamlanır; atlanan girdiler stats["time_budget"] altına yazılır (yakın-kopya
+      kontrolünde elenenler ayrıca near_duplicate_items olarak sayılır).
+    - reliability_model: "binary" (varsayılan) veya "trust". "trust" modunda kaynak güvenilirliği,
+      kaynaklar arası uyum/çelişki grafında yinelemeli güven yayılımıyla hesaplanır.
+    - two_tier: İki kademeli çıkarım. Cümleler önce ucuz sözcüksel filtre ve etiketleyiciden geçer,
+      yalnızca önerme üretebilecek adaylar tam ayrıştırılır. Seçicilik stats["two_tier"] altına yazılır.
+    - pipelined: Ayrıştırma -> çıkarım+doğrulama -> linkleme aşamaları sınırlı kuyruklarla (stage_queue_size)
+      eşzamanlı çalışır; linkleme ilk önermelerle başlar, kuyruk dolunca üst aşama bekler (backpressure).
+      Sıra korunduğu için bağlantılar seri mod ile aynıdır. Tekilleştirme akış içinde yapılır; link_workers
+      ve memory_budget_mb bu modda kullanılmaz. Aşama kullanım oranları stats["stages"] altına yazılır.
+    - update_workers > 1: Güven güncellemesi bağlantı grafının bileşenlerine bölünüp süreç havuzunda
+      yapılır; küçük bileşenler gruplanır. Sonuç seri güncellemeyle aynıdır.
+    - incremental_cycles / cycle_detector: Döngüsel destek, linker her destek bağlantısını eklerken
+      artımlı olarak (union-find + sınırlı BFS) tespit edilir ve güncellemedeki tam tarama atlanır.
+      cycle_detector sürekli veri girişinde çalıştırmalar arasında aynı nesneyle verilebilir.
+      Parçalı linklemede (link_workers > 1) güncelleme aşamasında tam yeniden tarama yapılır.
+    - leaderboard: KB'ye bağlanır (attach) ve linker/updater/retention olaylarıyla canlı tutulur;
+      en çok çelişilen önermeler çalıştırma sonunda KB sıralanmadan yazdırılır. Bağlı kalır (detach ile bırakılır).
+    - change_feed: KB'ye bağlanır; ekleme, bağlantı, işaret, güven/güvenilirlik ve çıkarma değişiklikleri
+      sıra numaralı JSONL günlüğüne yazılır ve çalıştırma sonunda diske aktarılır (flush).
+      Not: Tekilleştirmede mevcut kayda katılan tekrarlar (occurrence_count) günlüğe yazılmaz.
+    - link_window / temporal_index: Zaman pencereli linkleme. Yeni önerme yalnızca aynı özneli ve zaman
+      damgası (girdi öğesinin "timestamp" alanı) ±link_window içinde kalan önermelerle karşılaştırılır.
+      temporal_index sürekli veri girişinde çalıştırmalar arasında aynı nesneyle verilebilir. Linkleme bu modda
+      seridir (link_workers kullanılmaz). Karşılaştırma/bağlantı sayıları stats["link_window"] altına yazılır.
+      measure_skipped_links: Pencere dışında kalan çiftlerin kaç bağlantı üreteceği de sayılır (links_outside_window);
+      tüm aynı-özne adaylarına bakıldığından linkleme maliyeti pencere olmadan olduğu kadar olur.
     """
     if NLP_MODEL is None: print("FATAL ERROR: spaCy model not loaded."); return {}
 
     print("\nStarting AEE Era Final Pipeline...")
-    knowledge_base: Dict[str, Proposition] = {}
+    knowledge_base: Dict[str, Proposition] = kb if kb is not None else {}
     start_time = time.time()
+    tracker = MemoryTracker(memory_budget_mb) if (memory_budget_mb is not None or track_memory) else None
+    if tracker: tracker.start(); tracker.mark_phase("extract")
 
     # 1. Adım: Extract (Era) & Validate Plausibility & Link (Era)
     print("Phase 1: Extracting(Era), Validating Plausibility, and Linking(Era)...")
-    all_extracted_props_before_linking: List[Proposition] = []
-    for item in inputs:
-        source_id = item.get("source_id", f"unknown_source_{int(time.time())}"); text = item.get("text", "")
-        if not text: continue
-        doc = process_with_spacy(text)
-        if doc:
-            # ERA EXTRACTOR ÇAĞIRILIYOR
-            extracted_props = extract_propositions_era(doc, source_id)
-            for prop in extracted_props:
-                 plausibility_score, validation_notes = check_plausibility_v_era(prop)
-                 if hasattr(prop, 'epistemic_data') and prop.epistemic_data:
-                    prop.epistemic_data.plausibility_score = plausibility_score
-                    if validation_notes: prop.epistemic_data.validation_notes.extend(validation_notes)
+    # Bellek bütçesi varsa bekleyen önermeler bütçe aşımında diske taşınabilen depoda tutulur
+    spill_store = SpillStore(tracker) if memory_budget_mb is not None else None
+    all_extracted_props_before_linking = spill_store if spill_store is not None else []
+    near_dup_stats = {"checked": 0, "skipped": 0, "merged": 0}
+    two_tier_stats: Dict[str, Any] = {}
+    duplicate_sources_by_doc: Dict[str, List[str]] = {}
+    if near_duplicates and near_duplicate_index is None: near_duplicate_index = NearDuplicateIndex()
+    if text_offsets and document_store is None: document_store = DEFAULT_DOCUMENT_STORE # Saklama politikası da aynı depoyu kullanır
+    if leaderboard is not None: leaderboard.attach(knowledge_base)
+    if change_feed is not None: change_feed.attach(knowledge_base)
+    if incremental_cycles and cycle_detector is None:
+        cycle_detector = SupportCycleDetector(); cycle_detector.build(knowledge_base) # Mevcut KB'nin bağlılığı
+    if link_window is not None and temporal_index is None:
+        temporal_index = TemporalLinkIndex(link_window, measure_skipped_links=measure_skipped_links); temporal_index.build(knowledge_base) # Mevcut KB önermeleri aday olur
+    def link_new_proposition(new_prop: Proposition):
+        if temporal_index is not None: temporal_index.link(new_prop, knowledge_base, cycle_detector)
+        else: find_and_link_evidence_era(new_prop, knowledge_base, cycle_detector) # ERA LINKER ÇAĞIRILIYOR
+    indexed_inputs = list(enumerate(inputs)) # doc_id'ler sıralamadan bağımsız olarak orijinal indeksi kullanır
+    budget_report: Optional[Dict[str, Any]] = None
+    if time_budget is not None:
+        # Anytime modu: en güvenilir kaynaklar önce (eşitlikte orijinal sıra korunur)
+        indexed_inputs.sort(key=lambda entry: -get_source_based_confidence(entry[1].get("source_id", "")))
+        extraction_deadline = start_time + time_budget * extraction_budget_fraction
+        budget_report = {"budget_seconds": time_budget, "extraction_deadline_seconds": time_budget * extraction_budget_fraction,
+                         "processed_items": 0, "near_duplicate_items": 0, "skipped_items": []}
+
+    def iter_accepted_items() -> Iterator[Tuple[int, Dict[str, str]]]:
+        """ Zaman bütçesi ve yakın-kopya kontrollerinden geçen girdi öğelerini sırayla üretir. """
+        extraction_seconds = 0.0; extracted_chars = 0
+        for position, (item_index, item) in enumerate(indexed_inputs):
+            if budget_report is not None:
+                # Sonraki öğenin tahmini süresi (şimdiye kadarki saniye/karakter oranıyla) son tarihi aşacaksa dur
+                item_chars = len(item.get("text", "")) or (os.path.getsize(item["path"]) if item.get("path") and os.path.exists(item["path"]) else 0)
+                estimated_seconds = extraction_seconds / extracted_chars * item_chars if extracted_chars else 0.0
+                if time.time() + estimated_seconds > extraction_deadline:
+                    budget_report["skipped_items"] = [{"index": skipped_index, "source_id": skipped_item.get("source_id")}
+                                                      for skipped_index, skipped_item in indexed_inputs[position:]]
+                    print(f"  Time budget: stopping extraction, {len(indexed_inputs) - position} of {len(indexed_inputs)} input items skipped.")
+                    return
+                item_start = time.time()
+            if near_duplicates:
+                # Ayrıştırmadan önce yakın-kopya kontrolü (dosya girdileri imza için bir kez okunur)
+                source_id, doc_id = get_item_ids(item, item_index); check_text = item.get("text", "")
+                if "source_id" not in item: item = {**item, "source_id": source_id} # Ayrıştırma aynı doc_id'yi kullansın
+                if not check_text and item.get("path"):
+                    with open(item["path"], encoding="utf-8") as input_file: check_text = input_file.read()
+                near_dup_stats["checked"] += 1
+                canonical_doc_id = near_duplicate_index.check_and_add(doc_id, check_text)
+                if canonical_doc_id is not None:
+                    if near_duplicates == NEAR_DUP_MERGE:
+                        duplicate_sources_by_doc.setdefault(canonical_doc_id, []).append(source_id); near_dup_stats["merged"] += 1
+                    else: near_dup_stats["skipped"] += 1
+                    if budget_report is not None: budget_report["near_duplicate_items"] += 1 # Ayrıştırılmadı ama bütçe nedeniyle atlanmadı
+                    continue
+            yield item_index, item # Öğe tüketici tarafından işlenene kadar burada beklenir
+            if budget_report is not None:
+                extraction_seconds += time.time() - item_start; extracted_chars += item_chars; budget_report["processed_items"] += 1
+
+    stage_report: Optional[Dict[str, Any]] = None
+    if pipelined:
+        # Aşamalı mod: ayrıştırma, çıkarım ve linkleme sınırlı kuyruklarla eşzamanlı çalışır
+        if link_workers > 1 or spill_store is not None: print("  Pipelined mode: link_workers and memory_budget_mb spilling are not used.")
+        if tracker: tracker.mark_phase("ingest")
+        dedup_index = build_dedup_index(knowledge_base) if dedup else None
+        extracted_count = 0
+
+        def parse_stage(entry: Tuple[int, Dict[str, str]]) -> Iterator[Tuple[str, str, Doc, int, Any]]:
+            item_timestamp = get_item_timestamp(entry[1], entry[0])
+            source_id, doc_id, docs = parse_input_item(entry[1], entry[0], text_offsets, document_store, max_chunk_chars, two_tier, two_tier_stats)
+            for doc, char_offset in docs: yield source_id, doc_id, doc, char_offset, item_timestamp
+
+        def extract_stage(parsed: Tuple[str, str, Doc, int, Any]) -> Iterator[Proposition]:
+            source_id, doc_id, doc, char_offset, item_timestamp = parsed
+            for prop in extract_propositions_era(doc, source_id, doc_id=doc_id, store_text=not text_offsets, char_offset=char_offset):
+                if item_timestamp is not None: prop.epistemic_data.timestamp = item_timestamp
+                apply_plausibility_check_era(prop)
+                yield prop
+
+        def link_sink(new_prop: Proposition):
+            nonlocal extracted_count
+            extracted_count += 1
+            if dedup_index is not None: # Akış içi tekilleştirme (seri moddaki deduplicate_propositions ile aynı sonuç)
+                key = get_dedup_key(new_prop); canonical = dedup_index.get(key)
+                if canonical is not None: merge_duplicate_proposition(canonical, new_prop); return
+                dedup_index[key] = new_prop
+            if new_prop.prop_id not in knowledge_base:
+                emit(knowledge_base, EVENT_PROP_INSERTED, new_prop)
+                link_new_proposition(new_prop)
+                knowledge_base[new_prop.prop_id] = new_prop
+
+        stage_report = run_staged_pipeline(iter_accepted_items(), [("parse", parse_stage), ("extract", extract_stage)],
+                                           link_sink, sink_name="link", queue_size=stage_queue_size)
+        print(f"  Phase 1a+1b (Pipelined Extraction(Era), Validation & Linking(Era)) complete. Total extracted: {extracted_count}")
+        print(f"  {format_stage_report(stage_report)}")
+        if stats is not None: stats["stages"] = stage_report
+    else:
+        for item_index, item in iter_accepted_items():
+            for prop in extract_input_propositions(item, item_index, text_offsets, document_store, max_chunk_chars, two_tier, two_tier_stats):
+                 apply_plausibility_check_era(prop)
                  all_extracted_props_before_linking.append(prop)
-    print(f"  Phase 1a (Extraction(Era) & Validation) complete. Total extracted: {len(all_extracted_props_before_linking)}")
-
-    print("  Phase 1b (Linking(Era))...")
-    if find_and_link_evidence_era: # Era linker fonksiyonu
-        for new_prop in all_extracted_props_before_linking:
-             if new_prop.prop_id not in knowledge_base:
-                  # ERA LINKER ÇAĞIRILIYOR
-                  find_and_link_evidence_era(new_prop, knowledge_base)
-                  knowledge_base[new_prop.prop_id] = new_prop
-    else: print("Skipping linking due to import error.")
+        print(f"  Phase 1a (Extraction(Era) & Validation) complete. Total extracted: {len(all_extracted_props_before_linking)}")
+    if two_tier:
+        two_tier_stats.update(get_two_tier_selectivity(two_tier_stats))
+        print(f"  Two-tier filter: {two_tier_stats.get('tagged_candidates', 0)} of {two_tier_stats.get('sentences', 0)} sentences parsed"
+              f" ({two_tier_stats['parsed_fraction']:.1%}; lexical pass {two_tier_stats['lexical_pass_rate']:.1%}, tagger pass {two_tier_stats['tagger_pass_rate']:.1%}).")
+        if stats is not None: stats["two_tier"] = two_tier_stats
+    if near_duplicates:
+        print(f"  Near-duplicates: {near_dup_stats['checked']} texts checked, {near_dup_stats['skipped']} skipped, {near_dup_stats['merged']} merged.")
+        if stats is not None: stats["near_duplicates"] = near_dup_stats
+
+    if not pipelined: # Aşamalı modda tekilleştirme ve linkleme akış içinde yapıldı
+        if dedup:
+            extracted_count = len(all_extracted_props_before_linking)
+            all_extracted_props_before_linking = deduplicate_propositions(all_extracted_props_before_linking, build_dedup_index(knowledge_base))
+            print(f"  Dedup: {extracted_count} extracted -> {len(all_extracted_props_before_linking)} unique propositions.")
+
+        print("  Phase 1b (Linking(Era))...")
+        if tracker: tracker.mark_phase("link")
+        if link_workers > 1 and temporal_index is not None: print("  Time-windowed linking is serial: link_workers is not used.")
+        if link_workers > 1 and temporal_index is None: # Özne parçalı paralel linkleme
+            link_propositions_sharded(all_extracted_props_before_linking, knowledge_base, num_workers=link_workers)
+            if cycle_detector is not None: cycle_detector.request_full_rescan() # Bağlantılar toplu eklendi
+        elif find_and_link_evidence_era: # Era linker fonksiyonu
+            for new_prop in all_extracted_props_before_linking:
+                 if new_prop.prop_id not in knowledge_base:
+                      emit(knowledge_base, EVENT_PROP_INSERTED, new_prop) # Değişiklik akışı: önce ekleme, sonra bağlantılar
+                      link_new_proposition(new_prop)
+                      knowledge_base[new_prop.prop_id] = new_prop
+        else: print("Skipping linking due to import error.")
+    spilled_count = 0
+    if spill_store is not None: spilled_count = spill_store.spilled_count; spill_store.close() # Geçici segmentleri sil
+    if duplicate_sources_by_doc: attach_duplicate_sources(knowledge_base, duplicate_sources_by_doc) # near_duplicates="merge"
     print(f"Phase 1 (Extract(Era), Validate, Link(Era)) complete. KB size: {len(knowledge_base)}")
+    verdict_cache_stats = get_verdict_cache_stats() # Süreç geneli; parçalı linklemede işçi süreçleri sayılmaz
+    print(f"  Linker verdict cache: {verdict_cache_stats['hits']} hits / {verdict_cache_stats['misses']} misses ({verdict_cache_stats['hit_rate']:.1%} hit rate).")
+    if stats is not None: stats["verdict_cache"] = verdict_cache_stats
+    if temporal_index is not None:
+        window_report = temporal_index.report(); print(f"  {format_window_report(window_report)}")
+        if stats is not None: stats["link_window"] = window_report
 
     # 1.5 Adım: Bias Detection (v3)
     print("\nPhase 1.5: Running Bias Detection Heuristics...")
+    if tracker: tracker.mark_phase("bias")
     if run_bias_detection_v3 and knowledge_base: run_bias_detection_v3(knowledge_base)
     else: print("Skipping Bias Detection due to import error or empty KB.")
     print("Phase 1.5 complete.")
 
     # 2. Adım: Update (Era Mantığı ile)
     print("\nPhase 2: Running Era Updates (Reliability, Cycle Detect, Plausibility-aware Confidence)...")
-    if run_updates_era: updated_knowledge_base = run_updates_era(knowledge_base) # ERA Updater
+    if tracker: tracker.mark_phase("update")
+    if run_updates_era: updated_knowledge_base = run_updates_era(knowledge_base, ledger=ledger, reliability_model=reliability_model, update_workers=update_workers, cycle_detector=cycle_detector) # ERA Updater
     else: print("Skipping Updates due to import error."); updated_knowledge_base = knowledge_base
+    # 2b Adım: Saklama Politikası (Retention). Güncellemeden sonra: bu çalıştırmanın önermeleri de
+    # rafine güvenleriyle sıralanır. Çıkarılanların komşularının güveni sonraki güncellemede yenilenir.
+    if retention_policy:
+        apply_retention_policy(updated_knowledge_base, retention_policy, reliability_model=reliability_model, ledger=ledger,
+                               document_store=document_store, near_duplicate_index=near_duplicate_index, cycle_detector=cycle_detector)
+        if temporal_index is not None: temporal_index.prune(updated_knowledge_base) # Çıkarılan önermeler aday olmasın
+    # İndeksli KB verildiyse güven/bias indekslerini güncelle
+    if isinstance(updated_knowledge_base, KnowledgeBase): updated_knowledge_base.refresh_all()
+    if snapshot_store is not None:
+        snapshot = snapshot_store.publish(updated_knowledge_base)
+        print(f"  Published KB snapshot version {snapshot.version} ({len(snapshot)} propositions).")
     print("Phase 2 complete.")
 
+    if tracker:
+        tracker.stop()
+        memory_report = tracker.report(); memory_report["spilled_propositions"] = spilled_count
+        memory_report["kb_estimate"] = estimate_kb_size(updated_knowledge_base)
+        print(f"  Memory: phase peaks (MB) {', '.join(f'{phase}={peak:.1f}' for phase, peak in memory_report['phase_peak_mb'].items())}"
+              f" | KB ~{memory_report['kb_estimate']['approx_mb']:.1f} MB | Spilled: {spilled_count}")
+        if stats is not None: stats["memory"] = memory_report
+
     end_time = time.time(); print(f"\nPipeline finished in {end_time - start_time:.2f} seconds.")
+    if budget_report is not None:
+        budget_report["skipped_count"] = len(budget_report["skipped_items"]); budget_report["elapsed_seconds"] = end_time - start_time
+        if stats is not None: stats["time_budget"] = budget_report
+    if leaderboard is not None: report_contested_claims_era(leaderboard)
+    if change_feed is not None:
+        change_feed.flush(); print(f"  Change feed: {change_feed.path} (next seq {change_feed.next_seq}).")
     return updated_knowledge_base
 
 # --- Ana Çalışma Bloğu ---
@@ -0,0 +1,68 @@
+# aee_events_era.py
+# AEE Era Sürümü: KB değişiklik olayları için hafif yayın/abone (publish/subscribe) kaydı.
+# Linker, updater ve retention gibi KB'yi değiştiren fonksiyonlar olayları emit ile yayınlar;
+# canlı indeksler (örn: leaderboard) subscribe ile belirli bir KB nesnesine abone olur.
+# Dinleyicisi olmayan KB'ler için emit tek bir sözlük aramasıdır.
+
+from typing import Any, Callable, Dict, List, Tuple
+
+# Era sürümündeki sınıfları import et
+try:
+    from aee_core_classes_era import Proposition
+except ImportError:
+    print("Events Error: Could not import Proposition class from aee_core_classes_era.py.")
+    Proposition = None
+
+# --- Olay Türleri ---
+EVENT_PROP_INSERTED = "prop_inserted" # Linklemeden önce yayınlanır (sonraki link_added olayları bu önermeye aittir)
+EVENT_LINK_ADDED = "link_added" # data: linked_id, kind ("supports" | "contradicts")
+EVENT_LINK_REMOVED = "link_removed" # data: linked_id, kind
+EVENT_CONFIDENCE_CHANGED = "confidence_changed" # data: old, new
+EVENT_RELIABILITY_CHANGED = "reliability_changed" # data: old, new
+EVENT_FLAG_SET = "flag_set" # data: flag
+EVENT_PROP_EVICTED = "prop_evicted"
+
+# Dinleyici imzası: listener(event_type, prop, data)
+Listener = Callable[[str, Proposition, Dict[str, Any]], None]
+
+# id(kb) -> (kb, dinleyiciler). KB referansı tutulur; böylece abonelik sürerken id başka bir nesneye geçemez.
+_LISTENERS: Dict[int, Tuple[Any, List[Listener]]] = {}
+
+def subscribe(kb: Any, listener: Listener):
+    """ listener'ı bu KB nesnesinin olaylarına abone eder (unsubscribe ile bırakılmalıdır). """
+    _LISTENERS.setdefault(id(kb), (kb, []))[1].append(listener)
+
+def unsubscribe(kb: Any, listener: Listener):
+    entry = _LISTENERS.get(id(kb))
+    if entry is None or entry[0] is not kb: return
+    if listener in entry[1]: entry[1].remove(listener)
+    if not entry[1]: del _LISTENERS[id(kb)]
+
+def has_listeners(kb: Any) -> bool:
+    """ Olay verisi hazırlamak maliyetliyse emit'ten önce kontrol için. """
+    entry = _LISTENERS.get(id(kb))
+    return entry is not None and entry[0] is kb
+
+def emit(kb: Any, event_type: str, prop: Proposition, **data: Any):
+    """ Olayı KB'nin dinleyicilerine sırayla iletir. """
+    entry = _LISTENERS.get(id(kb))
+    if entry is None or entry[0] is not kb: return
+    for listener in list(entry[1]): listener(event_type, prop, data)
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE Events Module (Era Version)...")
+    if Proposition:
+        from aee_core_classes_era import EpistemicData
+        kb_test: Dict[str, Proposition] = {}
+        prop_test = Proposition("Sky is blue", "Sky is blue", EpistemicData(source_id="news.com"))
+        received: List[Tuple[str, Dict[str, Any]]] = []
+        def collect(event_type: str, prop: Proposition, data: Dict[str, Any]): received.append((event_type, data))
+        subscribe(kb_test, collect)
+        emit(kb_test, EVENT_CONFIDENCE_CHANGED, prop_test, old=0.5, new=0.62)
+        emit({}, EVENT_CONFIDENCE_CHANGED, prop_test, old=0.5, new=0.7) # Başka KB: iletilmez
+        unsubscribe(kb_test, collect)
+        emit(kb_test, EVENT_PROP_EVICTED, prop_test)
+        print(f"Received: {received} | Listeners left: {has_listeners(kb_test)}")
+    else: print("Could not run tests due to import error.")
+    print("\nEvents module testing complete.")
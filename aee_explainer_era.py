@@ -1,22 +1,95 @@
 # aee_explainer_era.py
 # AEE Era Sürümü: Önermenin epistemik durumu hakkında plausibility dahil açıklama üretir.
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 # Era sürümündeki sınıfları ve utils'i import et
 try:
     from aee_core_classes_era import Proposition
     from aee_utils import get_proposition_by_id, get_linked_propositions
+    from aee_corpus_era import resolve_text_span
 except ImportError:
     print("Error: Could not import dependencies from aee_core_classes_era.py or aee_utils.py.")
     Proposition = None
 
+# --- Kanıt İzleme (Provenance Trace) Sabitleri ---
+DEFAULT_TRACE_DEPTH = 3 # En fazla kaç bağlantı adımı izlenir
+DEFAULT_TRACE_NODE_BUDGET = 200 # Tek bir izlemede genişletilecek en fazla önerme
+DEFAULT_TRACE_MAX_CHAINS = 5 # Döndürülecek en güçlü zincir sayısı
+
+# Bir adım: (link_type, prop_id, computed_confidence)
+TraceHop = Tuple[str, str, float]
+
+def _get_ranked_neighbours(prop_id: str, kb: Dict[str, Proposition], memo: Dict[str, List[TraceHop]]) -> List[TraceHop]:
+    """ Önermenin supports/contradicts komşularını güvene göre azalan sırada döndürür (memo'da saklanır). """
+    neighbours = memo.get(prop_id)
+    if neighbours is not None: return neighbours
+    neighbours = []
+    prop = kb.get(prop_id)
+    if prop:
+        for link_type, linked_ids in (("supports", prop.epistemic_data.supports), ("contradicts", prop.epistemic_data.contradicts)):
+            for linked_id in linked_ids:
+                linked_prop = kb.get(linked_id)
+                if linked_prop: neighbours.append((link_type, linked_id, linked_prop.epistemic_data.computed_confidence))
+        neighbours.sort(key=lambda hop: hop[2], reverse=True)
+    memo[prop_id] = neighbours
+    return neighbours
+
+def trace_evidence_era(prop_id: str, kb: Dict[str, Proposition], max_depth: int = DEFAULT_TRACE_DEPTH,
+                       node_budget: int = DEFAULT_TRACE_NODE_BUDGET, max_chains: int = DEFAULT_TRACE_MAX_CHAINS,
+                       memo: Optional[Dict[str, List[TraceHop]]] = None) -> List[Dict[str, Any]]:
+    """
+    Önermeden başlayarak supports/contradicts bağlantılarını en fazla max_depth adım BFS ile izler
+    ve en güçlü kanıt zincirlerini döndürür. Her düzeyde bir önermeye ulaşan en güçlü yol tutulur;
+    güçlü yollar önce genişletilir ve en fazla node_budget önerme genişletilir.
+    Zincir gücü adımların güven skorlarının çarpımıdır; her 'contradicts' adımı yönü (polarity) tersine çevirir.
+    memo çağrılar arasında paylaşılabilir (KB değiştiğinde yeni bir memo kullanılmalıdır).
+    Dönüş: [{"strength": float, "polarity": "+"/"-", "hops": [(link_type, prop_id, confidence), ...]}, ...]
+    """
+    if not Proposition or prop_id not in kb: return []
+    if memo is None: memo = {}
+    frontier: Dict[str, Tuple[float, int, List[TraceHop]]] = {prop_id: (1.0, 1, [])}
+    visited = {prop_id}; expanded_count = 0
+    chains: List[Tuple[float, int, List[TraceHop]]] = []
+    for _ in range(max_depth):
+        next_frontier: Dict[str, Tuple[float, int, List[TraceHop]]] = {}
+        for node_id, (strength, polarity, hops) in sorted(frontier.items(), key=lambda item: item[1][0], reverse=True):
+            if expanded_count >= node_budget: break
+            expanded_count += 1
+            for link_type, linked_id, confidence in _get_ranked_neighbours(node_id, kb, memo):
+                if linked_id in visited: continue
+                new_strength = strength * confidence
+                best = next_frontier.get(linked_id)
+                if best is None or new_strength > best[0]:
+                    next_frontier[linked_id] = (new_strength, polarity if link_type == "supports" else -polarity, hops + [(link_type, linked_id, confidence)])
+        if not next_frontier: break
+        chains.extend(next_frontier.values())
+        visited.update(next_frontier.keys()); frontier = next_frontier
+    chains.sort(key=lambda chain: chain[0], reverse=True)
+    return [{"strength": strength, "polarity": "+" if polarity > 0 else "-", "hops": hops}
+            for strength, polarity, hops in chains[:max_chains]]
+
+def format_evidence_trace(chains: List[Dict[str, Any]]) -> List[str]:
+    """ Kanıt zincirlerini açıklama satırlarına dönüştürür. """
+    if not chains: return ["  None"]
+    lines = []
+    for chain in chains:
+        path_str = " -> ".join(f"{link_type} {linked_id[:8]} ({confidence:.2f})" for link_type, linked_id, confidence in chain["hops"])
+        lines.append(f"  [{chain['polarity']}{chain['strength']:.3f}] {path_str}")
+    return lines
+
 # --- Açıklama Üretme Fonksiyonu (Era) ---
 
-def generate_explanation_era(prop_id: str, kb: Dict[str, Proposition]) -> str:
+def generate_explanation_era(prop_id: str, kb: Dict[str, Proposition], trace_depth: int = 0,
+                             trace_memo: Optional[Dict[str, List[TraceHop]]] = None, ledger: Optional[Any] = None,
+                             document_store: Optional[Any] = None) -> str:
     """
     Verilen ID'ye sahip önermenin epistemik durumu hakkında (Plausibility dahil)
     insan tarafından okunabilir bir açıklama metni üretir.
+    trace_depth > 0 ise bu derinliğe kadar en güçlü kanıt zincirleri de eklenir (trace_evidence_era).
+    ledger (aee_updater_era.ConfidenceLedger) verilirse güven skorunun katkı dökümü güncelleme matematiği
+    yeniden çalıştırılmadan defterden okunur.
+    document_store: Ofset modunda önerme metninin çözüleceği depo (pipeline'a verilen depo; varsayılan: DEFAULT_DOCUMENT_STORE).
     """
     if not Proposition: return "Error: Proposition class not available."
 
@@ -33,7 +106,7 @@ def generate_explanation_era(prop_id: str, kb: Dict[str, Proposition]) -> str:
     # Metin parçalarını oluştur (Era versiyonu)
     explanation_lines = []
     explanation_lines.append(f"--- Epistemic Explanation (Era) for Proposition ID: {prop.prop_id[:8]} ---")
-    explanation_lines.append(f"Statement        : '{prop.text_span}'")
+    explanation_lines.append(f"Statement        : '{resolve_text_span(prop, document_store)}'")
     explanation_lines.append(f"Extracted Struct : {'[NEGATED] ' if prop.is_negated else ''}"
                              f"{prop.subject_lemma} - {prop.relation_lemma} - {prop.value_lemma}")
     explanation_lines.append("-" * 20)
@@ -44,11 +117,24 @@ def generate_explanation_era(prop_id: str, kb: Dict[str, Proposition]) -> str:
     explanation_lines.append(f"Plausibility Score: {ep_data.plausibility_score:.2f}" if ep_data.plausibility_score is not None else "N/A")
     explanation_lines.append(f"Validation Notes : [{', '.join(ep_data.validation_notes) if ep_data.validation_notes else 'None'}]")
     explanation_lines.append(f"Confidence Score : {ep_data.computed_confidence:.3f} (Initial: {ep_data.initial_confidence:.2f})")
+    contributions = ledger.get(prop.prop_id) if ledger is not None else None
+    if contributions:
+        explanation_lines.append("Confidence Breakdown: " + " | ".join(
+            f"{name} {value:+.3f}" if name != "initial" else f"{name} {value:.3f}"
+            for name, value in contributions.items() if name == "initial" or abs(value) >= 0.0005))
+    if getattr(ep_data, 'occurrence_count', 1) > 1:
+        explanation_lines.append(f"Occurrences      : {ep_data.occurrence_count} (deduplicated, {len(prop.sentence_refs)} sentence refs)")
+    if ep_data.other_metadata.get("duplicate_sources"):
+        explanation_lines.append(f"Also Reported By : {', '.join(ep_data.other_metadata['duplicate_sources'])} (near-duplicate texts)")
     explanation_lines.append("-" * 20)
     explanation_lines.append(f"Supporting Props ({len(supporters)}): "
                              f"[{', '.join([p.prop_id[:8] for p in supporters]) if supporters else 'None'}]")
     explanation_lines.append(f"Contradicting Props ({len(contradictors)}): "
                              f"[{', '.join([p.prop_id[:8] for p in contradictors]) if contradictors else 'None'}]")
+    if trace_depth > 0:
+        chains = trace_evidence_era(prop.prop_id, kb, max_depth=trace_depth, memo=trace_memo)
+        explanation_lines.append(f"Evidence Trace (depth {trace_depth}, strongest {len(chains)} chains):")
+        explanation_lines.extend(format_evidence_trace(chains))
     explanation_lines.append("-" * 20)
     explanation_lines.append(f"Potential Bias Flags: "
                              f"[{', '.join(ep_data.bias_flags) if ep_data.bias_flags else 'None'}]")
@@ -5,7 +5,8 @@
 import spacy
 from spacy.tokens import Doc, Span, Token
 from datetime import datetime
-from typing import List, Optional, Tuple
+from itertools import islice
+from typing import List, Optional, Tuple, Iterator, Dict
 
 # Era sürümündeki DOĞRU sınıfları import et
 try:
@@ -38,6 +39,56 @@ def process_with_spacy(text: str) -> Optional[Doc]:
         print(f"Error processing text with spaCy: {e}")
         return None
 
+# --- Büyük Dokümanlar için Parçalı İşleme ---
+DEFAULT_MAX_CHUNK_CHARS = 100000 # Bu uzunluktan büyük metinler cümle sınırlarında parçalanır
+DEFAULT_CHUNK_BATCH_SIZE = 4 # NLP_MODEL.pipe'a aynı anda verilecek parça sayısı
+SENTENCIZER = None # Ucuz cümle bölücü (yalnızca tokenizer + sentencizer), ilk kullanımda oluşturulur
+
+def get_sentencizer():
+    """ Ayrıştırıcı (parser) çalıştırmadan cümle sınırı bulan hafif spaCy hattını döndürür. """
+    global SENTENCIZER
+    if SENTENCIZER is None:
+        SENTENCIZER = spacy.blank("en"); SENTENCIZER.add_pipe("sentencizer")
+    return SENTENCIZER
+
+def split_text_at_sentences(text: str, max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS) -> Iterator[Tuple[int, int]]:
+    """
+    Metni en fazla max_chunk_chars uzunluğunda (start, end) karakter aralıklarına böler.
+    Kesim noktası, pencere içindeki son (muhtemelen yarım kalan) cümlenin başıdır; pencerede tek
+    bir cümle varsa son boşlukta, o da yoksa pencere sonunda kesilir.
+    """
+    sentencizer = get_sentencizer()
+    sentencizer.max_length = max(sentencizer.max_length, max_chunk_chars + 1)
+    start = 0; text_len = len(text)
+    while start < text_len:
+        end = min(text_len, start + max_chunk_chars)
+        cut = end
+        if end < text_len:
+            window_sents = list(sentencizer(text[start:end]).sents)
+            if len(window_sents) > 1: cut = start + window_sents[-1].start_char
+            else:
+                last_space = text.rfind(" ", start, end)
+                if last_space > start: cut = last_space + 1
+        yield start, cut
+        start = cut
+
+def process_with_spacy_chunked(text: str, max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS,
+                               batch_size: int = DEFAULT_CHUNK_BATCH_SIZE) -> Iterator[Tuple[Doc, int]]:
+    """
+    Büyük bir metni cümle sınırlarında parçalar ve parçaları NLP_MODEL.pipe ile toplu olarak işler.
+    Her parça için (Doc, parçanın metin içindeki başlangıç ofseti) üretir; tüm metnin Doc'u
+    hiçbir zaman bellekte tutulmaz.
+    """
+    if NLP_MODEL is None:
+        print(f"Error: spaCy model not loaded. Cannot process text.")
+        return
+    chunks = ((text[start:end], start) for start, end in split_text_at_sentences(text, max_chunk_chars))
+    try:
+        for doc, char_offset in NLP_MODEL.pipe(chunks, as_tuples=True, batch_size=batch_size):
+            yield doc, char_offset
+    except Exception as e:
+        print(f"Error processing text chunks with spaCy: {e}")
+
 # --- Yardımcı Fonksiyonlar ---
 def get_token_lemma(token: Optional[Token]) -> Optional[str]:
     """ Verilen Token nesnesinin lemma'sını (kökünü) küçük harfle güvenli bir şekilde alır. """
@@ -131,10 +182,15 @@ MIN_CONFIDENCE = 0.01
 MAX_CONFIDENCE = 0.99
 
 # --- Ana Önerme Çıkarım Fonksiyonu (Era) ---
-def extract_propositions_era(doc: Doc, source_id: str) -> List[Proposition]:
+def extract_propositions_era(doc: Doc, source_id: str, doc_id: Optional[str] = None, store_text: bool = True,
+                             char_offset: int = 0) -> List[Proposition]:
     """
     Era Sürümü: Önermeleri çıkarır ve başlangıç güvenini hem kaynağa
     hem de dilbilimsel ifadelere göre ayarlar.
+    doc_id verilirse cümle referansları (doc_id, start_char, end_char) bu ID ile kaydedilir,
+    verilmezse source_id kullanılır. store_text=False ise cümle metni önermeye kopyalanmaz
+    (ofset modu); metin aee_corpus_era.resolve_sentence_text ile gerektiğinde üretilir.
+    char_offset: doc bir metin parçasıysa parçanın tüm metin içindeki başlangıcı (cümle referansları için).
     """
     propositions: List[Proposition] = []
     if not doc or not Proposition or not EpistemicData: return propositions
@@ -208,14 +264,16 @@ def extract_propositions_era(doc: Doc, source_id: str) -> List[Proposition]:
             )
 
             # Yeni Proposition nesnesini oluştur
+            sentence_text = sent.text if store_text else ""
             new_prop = Proposition(
-                text_span=sent.text, # v1'de tüm cümle, daha sonra geliştirilebilir
-                sentence_text=sent.text,
+                text_span=sentence_text, # v1'de tüm cümle, daha sonra geliştirilebilir
+                sentence_text=sentence_text,
                 epistemic_data=ep_data,
                 subject_lemma=subject_lemma,
                 relation_lemma=relation_lemma,
                 value_lemma=value_lemma,
-                is_negated=is_negated
+                is_negated=is_negated,
+                sentence_refs=[(doc_id or source_id, char_offset + sent.start_char, char_offset + sent.end_char)]
             )
             # print(f"  DEBUG EXTRACT: Extracted: {new_prop}") # Çıkarılanı görmek için açılabilir
             propositions.append(new_prop)
@@ -225,6 +283,99 @@ def extract_propositions_era(doc: Doc, source_id: str) -> List[Proposition]:
 
     return propositions
 
+def iter_propositions_chunked(text: str, source_id: str, doc_id: Optional[str] = None, store_text: bool = True,
+                              max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS,
+                              batch_size: int = DEFAULT_CHUNK_BATCH_SIZE) -> Iterator[Proposition]:
+    """
+    Çok büyük tek bir dokümandan önermeleri akış (stream) olarak çıkarır: metin parçalanır,
+    parçalar toplu ayrıştırılır ve her parçanın önermeleri doğru kaynak ve doküman
+    ofsetleriyle hemen üretilir.
+    """
+    for doc, char_offset in process_with_spacy_chunked(text, max_chunk_chars, batch_size):
+        yield from extract_propositions_era(doc, source_id, doc_id=doc_id, store_text=store_text, char_offset=char_offset)
+
+# --- İki Kademeli Çıkarım (Two-Tier) ---
+# 1. kademe: ucuz cümle bölücü + sözcüksel ön filtre, ardından (modelde varsa) yalnızca etiketleyici
+# (tok2vec/tagger/attribute_ruler). 2. kademe: yalnızca aday cümlelere parser + lemmatizer uygulanır.
+# Etiketleme sırasında hesaplanan doc.tensor parser tarafından yeniden kullanılır; NER hiç çalıştırılmaz
+# (extractor varlık bilgisini kullanmaz).
+MIN_CLAIM_TOKENS = 3 # Özne + yüklem + değer için en az kelime sayısı
+SUBJECT_POS_TAGS = {"NOUN", "PROPN", "PRON", "NUM"}
+PREDICATE_POS_TAGS = {"VERB", "AUX"}
+PARSE_PIPE_NAMES = ("parser", "lemmatizer") # 2. kademede çalışan bileşenler
+UNUSED_PIPE_NAMES = ("ner",) # Extractor'ın kullanmadığı bileşenler
+TAGGER_PIPE_NAMES = ("tagger", "morphologizer")
+DEFAULT_SENTENCE_BATCH_SIZE = 64
+TWO_TIER_STAT_KEYS = ("sentences", "lexical_candidates", "tagged_candidates")
+
+def is_lexical_claim_candidate(sent: Span) -> bool:
+    """ 1. kademe sözcüksel filtre: noktalama dışında en az MIN_CLAIM_TOKENS kelime. """
+    return sum(1 for token in sent if not (token.is_punct or token.is_space)) >= MIN_CLAIM_TOKENS
+
+def is_tagged_claim_candidate(doc: Doc) -> bool:
+    """ Etiketleyici filtresi: cümlede en az bir yüklem (VERB/AUX) ve bir özne adayı (isim/zamir/sayı) olmalı. """
+    return any(token.pos_ in PREDICATE_POS_TAGS for token in doc) and any(token.pos_ in SUBJECT_POS_TAGS for token in doc)
+
+def iter_candidate_docs_two_tier(text: str, max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS,
+                                 batch_size: int = DEFAULT_SENTENCE_BATCH_SIZE,
+                                 filter_stats: Optional[Dict[str, int]] = None) -> Iterator[Tuple[Doc, int]]:
+    """
+    İki kademeli filtreden geçen aday cümleleri ayrıştırır ve (Doc, cümlenin metin içindeki ofseti) üretir.
+    Önerme üretemeyecek cümleler (başlık parçaları, listeler vb.) tam ayrıştırmadan önce elenir.
+    filter_stats verilirse cümle / sözcüksel aday / etiketli aday sayıları bu sözlükte biriktirilir.
+    Not: Cümle sınırları parser yerine sentencizer ile belirlenir; sonuçlar tek geçişli ayrıştırmadan
+    küçük farklar gösterebilir.
+    """
+    if NLP_MODEL is None:
+        print(f"Error: spaCy model not loaded. Cannot process text.")
+        return
+    stats = filter_stats if filter_stats is not None else {}
+    for key in TWO_TIER_STAT_KEYS: stats.setdefault(key, 0)
+    sentencizer = get_sentencizer()
+    sentencizer.max_length = max(sentencizer.max_length, max_chunk_chars + 1)
+
+    def lexical_candidates() -> Iterator[Tuple[str, int]]:
+        for chunk_start, chunk_end in split_text_at_sentences(text, max_chunk_chars):
+            for sent in sentencizer(text[chunk_start:chunk_end]).sents:
+                stats["sentences"] += 1
+                if is_lexical_claim_candidate(sent):
+                    stats["lexical_candidates"] += 1
+                    yield sent.text, chunk_start + sent.start_char
+
+    pipe_names = NLP_MODEL.pipe_names
+    parse_names = [name for name in pipe_names if name in PARSE_PIPE_NAMES]
+    has_tagger = any(name in TAGGER_PIPE_NAMES for name in pipe_names)
+    tagging_disabled = [name for name in pipe_names if name in PARSE_PIPE_NAMES or name in UNUSED_PIPE_NAMES]
+    try:
+        tagged_docs = NLP_MODEL.pipe(lexical_candidates(), as_tuples=True, batch_size=batch_size, disable=tagging_disabled)
+        candidates = ((doc, char_offset) for doc, char_offset in tagged_docs
+                      if not has_tagger or is_tagged_claim_candidate(doc))
+        while True:
+            batch = list(islice(candidates, batch_size))
+            if not batch: break
+            stats["tagged_candidates"] += len(batch)
+            docs = [doc for doc, _ in batch]
+            for name in parse_names: # Kalan bileşenler (parser, lemmatizer) yalnızca adaylara, pipeline sırasıyla
+                docs = list(NLP_MODEL.get_pipe(name).pipe(docs, batch_size=batch_size))
+            for doc, (_, char_offset) in zip(docs, batch): yield doc, char_offset
+    except Exception as e:
+        print(f"Error processing candidate sentences with spaCy: {e}")
+
+def iter_propositions_two_tier(text: str, source_id: str, doc_id: Optional[str] = None, store_text: bool = True,
+                               max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS, batch_size: int = DEFAULT_SENTENCE_BATCH_SIZE,
+                               filter_stats: Optional[Dict[str, int]] = None) -> Iterator[Proposition]:
+    """ Önermeleri iki kademede çıkarır: yalnızca aday cümleler parser'dan geçer (bkz. iter_candidate_docs_two_tier). """
+    for doc, char_offset in iter_candidate_docs_two_tier(text, max_chunk_chars, batch_size, filter_stats):
+        yield from extract_propositions_era(doc, source_id, doc_id=doc_id, store_text=store_text, char_offset=char_offset)
+
+def get_two_tier_selectivity(filter_stats: Dict[str, int]) -> Dict[str, float]:
+    """ Filtre seçiciliğini döndürür: tam ayrıştırmaya giden cümle oranı ve her kademenin geçirme oranı. """
+    sentences = filter_stats.get("sentences", 0); lexical = filter_stats.get("lexical_candidates", 0)
+    tagged = filter_stats.get("tagged_candidates", 0)
+    return {"parsed_fraction": tagged / sentences if sentences else 0.0,
+            "lexical_pass_rate": lexical / sentences if sentences else 0.0,
+            "tagger_pass_rate": tagged / lexical if lexical else 0.0}
+
 # --- Test Bloğu ---
 if __name__ == "__main__":
      print("\nTesting AEE Extractor Module (Era Version - Linguistic Confidence)...")
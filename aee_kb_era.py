@@ -0,0 +1,202 @@
+# aee_kb_era.py
+# AEE Era Sürümü: Dict[str, Proposition] KB'sini saran, ikincil indeksli sorgu arayüzü.
+# Özne, ilişki, değer, kaynak ve bias işaretleri için küme indeksleri ile sıralı bir
+# güven indeksi tutar; sorgular tam tarama yapmadan filtreleme/sıralama/limit uygular.
+
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple, Iterator, Any
+
+# Era sürümündeki sınıfları import et
+try:
+    from aee_core_classes_era import Proposition
+except ImportError:
+    print("KB Error: Could not import Proposition class from aee_core_classes_era.py.")
+    Proposition = None
+
+class KnowledgeBase:
+    """
+    Önerme sözlüğünü saran ve ikincil indeksler tutan KB sınıfı.
+    Mevcut Era fonksiyonlarıyla (linker, bias detector, updater, explainer) uyumlu olması için
+    dict arayüzünü (get, items, values, keys, pop, in, [], len) sunar.
+    Not: Önermelerin güven skoru veya bias işaretleri dışarıda değiştirildiğinde (örn: run_updates_era)
+    sorgulardan önce refresh() / refresh_all() çağrılmalıdır.
+    """
+
+    def __init__(self, propositions: Optional[Dict[str, Proposition]] = None):
+        self._props: Dict[str, Proposition] = propositions if propositions is not None else {}
+        self._by_subject: Dict[Optional[str], Set[str]] = defaultdict(set)
+        self._by_relation: Dict[Optional[str], Set[str]] = defaultdict(set)
+        self._by_value: Dict[Optional[str], Set[str]] = defaultdict(set)
+        self._by_source: Dict[str, Set[str]] = defaultdict(set)
+        self._by_flag: Dict[str, Set[str]] = defaultdict(set)
+        self._flagged: Set[str] = set()
+        self._conf_index: List[Tuple[float, str]] = [] # (computed_confidence, prop_id) sıralı
+        self._indexed_conf: Dict[str, float] = {}
+        self._indexed_flags: Dict[str, Tuple[str, ...]] = {}
+        for prop in self._props.values(): self._index(prop, sorted_insert=False)
+        self._conf_index.sort()
+
+    # --- İndeks Bakımı ---
+    def _index(self, prop: Proposition, sorted_insert: bool = True):
+        prop_id = prop.prop_id; ep_data = prop.epistemic_data
+        self._by_subject[prop.subject_lemma].add(prop_id)
+        self._by_relation[prop.relation_lemma].add(prop_id)
+        self._by_value[prop.value_lemma].add(prop_id)
+        self._by_source[ep_data.source_id].add(prop_id)
+        self._index_flags(prop_id, tuple(ep_data.bias_flags))
+        conf = ep_data.computed_confidence
+        self._indexed_conf[prop_id] = conf
+        if sorted_insert: insort(self._conf_index, (conf, prop_id))
+        else: self._conf_index.append((conf, prop_id))
+
+    def _index_flags(self, prop_id: str, flags: Tuple[str, ...]):
+        self._indexed_flags[prop_id] = flags
+        for flag in flags: self._by_flag[flag].add(prop_id)
+        if flags: self._flagged.add(prop_id)
+
+    def _unindex_flags(self, prop_id: str):
+        for flag in self._indexed_flags.pop(prop_id, ()):
+            self._discard(self._by_flag, flag, prop_id)
+        self._flagged.discard(prop_id)
+
+    def _unindex(self, prop: Proposition):
+        prop_id = prop.prop_id
+        self._discard(self._by_subject, prop.subject_lemma, prop_id)
+        self._discard(self._by_relation, prop.relation_lemma, prop_id)
+        self._discard(self._by_value, prop.value_lemma, prop_id)
+        self._discard(self._by_source, prop.epistemic_data.source_id, prop_id)
+        self._unindex_flags(prop_id)
+        conf = self._indexed_conf.pop(prop_id, None)
+        if conf is not None: self._remove_conf_entry(conf, prop_id)
+
+    def _remove_conf_entry(self, conf: float, prop_id: str):
+        pos = bisect_left(self._conf_index, (conf, prop_id))
+        if pos < len(self._conf_index) and self._conf_index[pos] == (conf, prop_id): del self._conf_index[pos]
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[str]], key: Any, prop_id: str):
+        bucket = index.get(key)
+        if bucket is None: return
+        bucket.discard(prop_id)
+        if not bucket: del index[key]
+
+    def refresh(self, prop_id: str):
+        """ Tek bir önermenin değişebilen alanlarının (güven, bias işaretleri) indekslerini günceller. """
+        prop = self._props.get(prop_id)
+        if not prop: return
+        ep_data = prop.epistemic_data
+        flags = tuple(ep_data.bias_flags)
+        if flags != self._indexed_flags.get(prop_id, ()):
+            self._unindex_flags(prop_id); self._index_flags(prop_id, flags)
+        old_conf = self._indexed_conf.get(prop_id); new_conf = ep_data.computed_confidence
+        if old_conf != new_conf:
+            if old_conf is not None: self._remove_conf_entry(old_conf, prop_id)
+            insort(self._conf_index, (new_conf, prop_id)); self._indexed_conf[prop_id] = new_conf
+
+    def refresh_all(self):
+        """ Toplu güncellemelerden (bias tespiti, run_updates_era) sonra tüm değişken indeksleri yeniler. """
+        self._by_flag.clear(); self._flagged.clear(); self._indexed_flags.clear()
+        for prop_id, prop in self._props.items():
+            self._index_flags(prop_id, tuple(prop.epistemic_data.bias_flags))
+            self._indexed_conf[prop_id] = prop.epistemic_data.computed_confidence
+        self._conf_index = sorted((conf, prop_id) for prop_id, conf in self._indexed_conf.items())
+
+    # --- Dict Arayüzü ---
+    def __getitem__(self, prop_id: str) -> Proposition: return self._props[prop_id]
+    def __setitem__(self, prop_id: str, prop: Proposition):
+        old_prop = self._props.get(prop_id)
+        if old_prop is not None: self._unindex(old_prop)
+        self._props[prop_id] = prop; self._index(prop)
+    def __delitem__(self, prop_id: str):
+        self._unindex(self._props[prop_id]); del self._props[prop_id]
+    def __contains__(self, prop_id: object) -> bool: return prop_id in self._props
+    def __iter__(self) -> Iterator[str]: return iter(self._props)
+    def __len__(self) -> int: return len(self._props)
+    def __bool__(self) -> bool: return bool(self._props)
+    def get(self, prop_id: str, default: Optional[Proposition] = None) -> Optional[Proposition]: return self._props.get(prop_id, default)
+    def keys(self): return self._props.keys()
+    def values(self): return self._props.values()
+    def items(self): return self._props.items()
+    def pop(self, prop_id: str, *default):
+        if prop_id not in self._props: return self._props.pop(prop_id, *default)
+        prop = self._props[prop_id]; del self[prop_id]
+        return prop
+    def as_dict(self) -> Dict[str, Proposition]: return self._props
+
+    # --- Sorgu ---
+    def query(self, subject: Optional[str] = None, relation: Optional[str] = None, value: Optional[str] = None,
+              source_id: Optional[str] = None, bias_flag: Optional[str] = None, flagged: Optional[bool] = None,
+              min_confidence: Optional[float] = None, max_confidence: Optional[float] = None,
+              order_by: Optional[str] = "confidence", descending: bool = True, limit: Optional[int] = None) -> List[Proposition]:
+        """
+        İndeksleri kullanarak önerme sorgular. Eşitlik filtreleri (subject, relation, value, source_id,
+        bias_flag, flagged=True) küme indekslerinin kesişimiyle, güven aralığı sıralı indeksle çözülür.
+        order_by: "confidence" (varsayılan) veya None (sırasız). limit: döndürülecek en fazla önerme.
+        Örn: kb.query(subject="sky", min_confidence=0.7) veya kb.query(source_id="blog_a", flagged=True)
+        """
+        if limit is not None and limit <= 0: return []
+        lo = float("-inf") if min_confidence is None else min_confidence
+        hi = float("inf") if max_confidence is None else max_confidence
+
+        candidate_sets: List[Set[str]] = []
+        for index, key in ((self._by_subject, subject), (self._by_relation, relation), (self._by_value, value),
+                           (self._by_source, source_id), (self._by_flag, bias_flag)):
+            if key is not None: candidate_sets.append(index.get(key, set()))
+        if flagged: candidate_sets.append(self._flagged)
+        exclude_flagged = flagged is False
+
+        if not candidate_sets:
+            # Yalnızca güven aralığı: sıralı indeksten dilim al, limit dolunca dur
+            start = bisect_left(self._conf_index, (lo, "")); end = bisect_right(self._conf_index, (hi, "\U0010ffff"))
+            positions = range(end - 1, start - 1, -1) if descending or order_by is None else range(start, end)
+            result: List[Proposition] = []
+            for pos in positions:
+                prop_id = self._conf_index[pos][1]
+                if exclude_flagged and prop_id in self._flagged: continue
+                result.append(self._props[prop_id])
+                if limit is not None and len(result) >= limit: break
+            return result
+
+        # Eşitlik filtreleri: en küçük kümeden başlayarak kesişim al
+        candidate_sets.sort(key=len)
+        candidates = set(candidate_sets[0])
+        for other in candidate_sets[1:]:
+            candidates &= other
+            if not candidates: return []
+        matched = [prop_id for prop_id in candidates
+                   if lo <= self._indexed_conf[prop_id] <= hi and not (exclude_flagged and prop_id in self._flagged)]
+        if order_by == "confidence":
+            sort_key = lambda pid: (self._indexed_conf[pid], pid)
+            if limit is not None and limit < len(matched):
+                matched = heapq.nlargest(limit, matched, key=sort_key) if descending else heapq.nsmallest(limit, matched, key=sort_key)
+            else:
+                matched.sort(key=sort_key, reverse=descending)
+        elif limit is not None:
+            matched = matched[:limit]
+        return [self._props[prop_id] for prop_id in matched]
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE KnowledgeBase Module (Era Version)...")
+    if Proposition:
+        from aee_core_classes_era import EpistemicData
+        kb_test = KnowledgeBase()
+        samples = [("sky", "blue", "news.com", 0.9), ("sky", "green", "user_blog", 0.3), ("sky", "grey", "news.com", 0.75),
+                   ("water", "liquid", "textbook", 0.95), ("policy", "good", "user_blog", 0.5)]
+        for subj, val, src, conf in samples:
+            ed = EpistemicData(source_id=src, initial_confidence=conf)
+            prop = Proposition(f"{subj} is {val}", f"{subj} is {val}", ed, subject_lemma=subj, relation_lemma="be", value_lemma=val)
+            kb_test[prop.prop_id] = prop
+        blog_prop = kb_test.query(source_id="user_blog", value="green")[0]
+        blog_prop.epistemic_data.bias_flags.append("SOURCE_MONOCULTURE"); kb_test.refresh(blog_prop.prop_id)
+
+        print("\nsubject='sky', min_confidence=0.7:")
+        for prop in kb_test.query(subject="sky", min_confidence=0.7): print(f"  {prop}")
+        print("source_id='user_blog', flagged=True:")
+        for prop in kb_test.query(source_id="user_blog", flagged=True): print(f"  {prop}")
+        print("Top 2 by confidence:")
+        for prop in kb_test.query(limit=2): print(f"  {prop}")
+    else: print("Could not run tests due to import error.")
+    print("\nKnowledgeBase module testing complete.")
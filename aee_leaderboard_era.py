@@ -0,0 +1,146 @@
+# aee_leaderboard_era.py
+# AEE Era Sürümü: En çok çelişilen ve en yüksek güvenli önermeler için canlı sıralama indeksi.
+# Her güncellemeden sonra tüm KB'yi sıralamak yerine iki yığın (heap) tutulur; linker yeni
+# bağlantı ekledikçe ve updater güveni değiştirdikçe (aee_events_era olayları) ilgili önerme
+# yeni anahtarıyla yığına eklenir. Eski kayıtlar silinmez, sorgu sırasında geçersiz sayılıp
+# atlanır (lazy deletion): yalnızca önermenin en son eklenen kaydı (sıra numarası) geçerlidir.
+# Geçersiz kayıtlar çoğalınca yığın yeniden kurulur.
+
+import heapq
+import itertools
+from typing import Any, Dict, List, Optional, Tuple
+
+# Era sürümündeki sınıfları import et
+try:
+    from aee_core_classes_era import Proposition
+    from aee_events_era import subscribe, unsubscribe, EVENT_PROP_EVICTED
+except ImportError:
+    print("Leaderboard Error: Could not import dependencies from aee_core_classes_era.py or aee_events_era.py.")
+    Proposition = None
+
+# --- Sabitler ---
+DEFAULT_TOP_K = 10
+COMPACT_MIN_HEAP_SIZE = 1024 # Bu boyutun altındaki yığınlar hiç sıkıştırılmaz
+COMPACT_STALE_RATIO = 2 # Yığın canlı kayıt sayısının bu katını aşınca geçersiz kayıtlar atılır
+
+class ContestedClaimsLeaderboard:
+    """
+    Önermeleri (çelişki sayısı, güven) ve güvene göre sıralı tutan canlı indeks.
+    attach(kb) ile KB olaylarına abone olur; top_contradicted(k) / top_confident(k) sorguları
+    yığının yalnızca tepesine bakar (O(k log n), geçersiz kayıtların atılması amortize).
+    Olay yayınlamayan değişikliklerden sonra (örn: kontrol noktasından yükleme) rebuild(kb) çağrılmalıdır.
+    """
+
+    def __init__(self, kb: Optional[Dict[str, Proposition]] = None):
+        self._props: Dict[str, Proposition] = {}
+        self._contradiction_keys: Dict[str, Tuple[int, float, int]] = {} # prop_id -> (çelişki sayısı, güven, geçerli kaydın sırası)
+        self._confidence_keys: Dict[str, Tuple[float, int]] = {} # prop_id -> (güven, geçerli kaydın sırası)
+        self._contradiction_heap: List[Tuple[int, float, int, str]] = [] # (-çelişki, -güven, sıra, prop_id)
+        self._confidence_heap: List[Tuple[float, int, str]] = [] # (-güven, sıra, prop_id)
+        self._sequence = itertools.count()
+        self._kb: Optional[Dict[str, Proposition]] = None
+        if kb is not None: self.attach(kb)
+
+    # --- KB Bağlantısı ---
+    def attach(self, kb: Dict[str, Proposition]):
+        """ İndeksi KB'nin mevcut durumundan kurar ve sonraki değişiklik olaylarına abone olur. """
+        if self._kb is kb: return # Zaten bağlı ve güncel
+        if self._kb is not None: self.detach()
+        self.rebuild(kb); self._kb = kb
+        subscribe(kb, self.on_event)
+
+    def detach(self):
+        if self._kb is not None: unsubscribe(self._kb, self.on_event); self._kb = None
+
+    def rebuild(self, kb: Dict[str, Proposition]):
+        self._props.clear(); self._contradiction_keys.clear(); self._confidence_keys.clear()
+        self._contradiction_heap = []; self._confidence_heap = []
+        for prop in kb.values(): self.observe(prop)
+
+    def on_event(self, event_type: str, prop: Proposition, data: Dict[str, Any]):
+        if event_type == EVENT_PROP_EVICTED: self.remove(prop.prop_id)
+        else: self.observe(prop) # Bağlantı ve güven olayları
+
+    # --- İndeks Bakımı ---
+    def observe(self, prop: Proposition):
+        """ Önermenin güncel anahtarlarını hesaplar; değiştiyse yığınlara yeni kayıt ekler. """
+        prop_id = prop.prop_id; ep_data = prop.epistemic_data
+        confidence = ep_data.computed_confidence; contradiction_count = len(ep_data.contradicts)
+        self._props[prop_id] = prop
+        current_key = self._confidence_keys.get(prop_id)
+        if current_key is None or current_key[0] != confidence:
+            sequence = next(self._sequence); self._confidence_keys[prop_id] = (confidence, sequence)
+            heapq.heappush(self._confidence_heap, (-confidence, sequence, prop_id))
+        current_key = self._contradiction_keys.get(prop_id)
+        if contradiction_count == 0: self._contradiction_keys.pop(prop_id, None) # Eski kayıt geçersiz kalır
+        elif current_key is None or current_key[:2] != (contradiction_count, confidence):
+            sequence = next(self._sequence); self._contradiction_keys[prop_id] = (contradiction_count, confidence, sequence)
+            heapq.heappush(self._contradiction_heap, (-contradiction_count, -confidence, sequence, prop_id))
+        self._compact()
+
+    def remove(self, prop_id: str):
+        """ Önermeyi indeksten çıkarır; yığındaki kayıtları geçersiz kalır (aynı anahtarla tekrar gözlense bile). """
+        self._props.pop(prop_id, None); self._contradiction_keys.pop(prop_id, None); self._confidence_keys.pop(prop_id, None)
+
+    def _is_current_confidence(self, entry: Tuple[float, int, str]) -> bool:
+        current_key = self._confidence_keys.get(entry[2])
+        return current_key is not None and current_key[1] == entry[1]
+
+    def _is_current_contradiction(self, entry: Tuple[int, float, int, str]) -> bool:
+        current_key = self._contradiction_keys.get(entry[3])
+        return current_key is not None and current_key[2] == entry[2]
+
+    def _compact(self):
+        if len(self._confidence_heap) > max(COMPACT_MIN_HEAP_SIZE, COMPACT_STALE_RATIO * len(self._confidence_keys)):
+            self._confidence_heap = [entry for entry in self._confidence_heap if self._is_current_confidence(entry)]
+            heapq.heapify(self._confidence_heap)
+        if len(self._contradiction_heap) > max(COMPACT_MIN_HEAP_SIZE, COMPACT_STALE_RATIO * len(self._contradiction_keys)):
+            self._contradiction_heap = [entry for entry in self._contradiction_heap if self._is_current_contradiction(entry)]
+            heapq.heapify(self._contradiction_heap)
+
+    # --- Sorgular ---
+    def _top(self, heap: List[tuple], is_current, k: int) -> List[Proposition]:
+        """ Tepeden geçerli ilk k kaydı alır; geçersizler atılır, geçerliler yığına geri konur. """
+        valid_entries: List[tuple] = []
+        while heap and len(valid_entries) < k:
+            entry = heapq.heappop(heap)
+            if is_current(entry): valid_entries.append(entry)
+        for entry in valid_entries: heapq.heappush(heap, entry)
+        return [self._props[entry[-1]] for entry in valid_entries]
+
+    def top_contradicted(self, k: int = DEFAULT_TOP_K) -> List[Proposition]:
+        """ En çok çelişilen k önerme (eşitlikte yüksek güven önce). """
+        return self._top(self._contradiction_heap, self._is_current_contradiction, k)
+
+    def top_confident(self, k: int = DEFAULT_TOP_K) -> List[Proposition]:
+        """ En yüksek güvenli k önerme. """
+        return self._top(self._confidence_heap, self._is_current_confidence, k)
+
+    def __len__(self) -> int: return len(self._props)
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE Leaderboard Module (Era Version)...")
+    if Proposition:
+        from aee_core_classes_era import EpistemicData
+        from aee_events_era import emit, EVENT_LINK_ADDED, EVENT_CONFIDENCE_CHANGED
+        kb_test: Dict[str, Proposition] = {}
+        for i in range(6):
+            prop = Proposition(f"claim {i}", f"claim {i}", EpistemicData(source_id=f"src{i}", initial_confidence=0.4 + 0.1 * i), prop_id=f"p{i}")
+            kb_test[prop.prop_id] = prop
+        board = ContestedClaimsLeaderboard(kb_test)
+        def contradict(a: str, b: str): # Linker'ın yaptığı gibi: bağlantı + olay
+            for x, y in ((a, b), (b, a)):
+                kb_test[x].epistemic_data.contradicts.append(y); emit(kb_test, EVENT_LINK_ADDED, kb_test[x], linked_id=y, kind="contradicts")
+        contradict("p0", "p1"); contradict("p0", "p2"); contradict("p3", "p4")
+        ep_data = kb_test["p5"].epistemic_data; old = ep_data.computed_confidence; ep_data.computed_confidence = 0.2
+        emit(kb_test, EVENT_CONFIDENCE_CHANGED, kb_test["p5"], old=old, new=0.2)
+        p0_data = kb_test["p0"].epistemic_data
+        for confidence in (0.95, p0_data.computed_confidence): # A -> B -> A: eski A kaydı tekrar geçerli sayılmamalı
+            p0_data.computed_confidence = confidence; board.observe(kb_test["p0"])
+        board.remove("p1"); board.observe(kb_test["p1"]) # Çıkar + aynı anahtarla tekrar gözle
+        print(f"Top contradicted: {[(p.prop_id, len(p.epistemic_data.contradicts), round(p.epistemic_data.computed_confidence, 2)) for p in board.top_contradicted(3)]}")
+        print(f"Top confident   : {[(p.prop_id, round(p.epistemic_data.computed_confidence, 2)) for p in board.top_confident(3)]}")
+        board.detach()
+    else: print("Could not run tests due to import error.")
+    print("\nLeaderboard module testing complete.")
@@ -2,8 +2,12 @@
 # AEE Era Sürümü: Önermeler arasındaki bağlantıları bulur.
 # Genişletilmiş zıtlıklar, basit eşanlamlı/ilişki kontrolü içerir.
 
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from datetime import datetime
+from functools import lru_cache
 import pprint
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 
 # Era sürümündeki sınıfları import et
 try:
@@ -12,6 +16,18 @@ except ImportError:
      print("Linker Error: Could not import Proposition class from aee_core_classes_era.py.")
      Proposition = None
 
+try:
+    from aee_events_era import emit, has_listeners, EVENT_LINK_ADDED, EVENT_PROP_INSERTED
+except ImportError:
+    print("Linker Error: Could not import aee_events_era.py.")
+    emit = None
+
+try:
+    from aee_cycles_era import SupportCycleDetector
+except ImportError:
+    print("Linker Warning: Could not import aee_cycles_era.py; incremental cycle detection is unavailable.")
+    SupportCycleDetector = None
+
 # --- Genişletilmiş Zıtlıklar ve Eşanlamlılar Sözlüğü (Era.2b) ---
 
 # Daha fazla zıtlık ekleyelim
@@ -32,9 +48,12 @@ opposites = {
 }
 # Çift yönlü yap
 bidirectional_opposites = {}
-for k, v in opposites.items():
-    bidirectional_opposites.setdefault(k, v) # İlk eşleşmeyi koru
-    bidirectional_opposites.setdefault(v, k) # Tersini de ekle (varsa üzerine yazma)
+def _build_bidirectional_opposites(pairs: Dict[str, str]):
+    bidirectional_opposites.clear()
+    for k, v in pairs.items():
+        bidirectional_opposites.setdefault(k, v) # İlk eşleşmeyi koru
+        bidirectional_opposites.setdefault(v, k) # Tersini de ekle (varsa üzerine yazma)
+_build_bidirectional_opposites(opposites)
 
 # Basit eşanlamlılar (Destek kontrolünde kullanılabilir)
 synonyms = {
@@ -43,10 +62,13 @@ synonyms = {
     "essential": "important", "beneficial": "helpful", "harmful":"dangerous"
 }
 # Çift yönlü yap
-bidirectional_synonyms = synonyms.copy()
-for k, v in synonyms.items():
-    bidirectional_synonyms.setdefault(k, v)
-    bidirectional_synonyms.setdefault(v, k)
+bidirectional_synonyms = {}
+def _build_bidirectional_synonyms(pairs: Dict[str, str]):
+    bidirectional_synonyms.clear(); bidirectional_synonyms.update(pairs)
+    for k, v in pairs.items():
+        bidirectional_synonyms.setdefault(k, v)
+        bidirectional_synonyms.setdefault(v, k)
+_build_bidirectional_synonyms(synonyms)
 
 # İlişkisel Çelişki Kuralları (Basit)
 # Örn: (Subject, Relation, Value)
@@ -65,57 +87,197 @@ def print_prop_debug_info(p: Proposition, prefix=""):
             f"S:'{p.subject_lemma}', R:'{p.relation_lemma}', V:'{p.value_lemma}', "
             f"Neg:{p.is_negated}")
 
+# --- Üçlü Çifti Sınıflandırma (Era) ---
+# Karar yalnızca iki (subject, relation, value, is_negated) üçlüsüne bağlıdır; gerçek derlemlerde aynı
+# çiftler sürekli tekrarlandığı için kararlar sınırlı bir LRU önbellekte tutulur.
+LINK_SUPPORT = "support"; LINK_CONTRADICTION = "contradiction"
+VERDICT_CACHE_SIZE = 65536 # Önbellekteki en fazla üçlü çifti
+TripleKey = Tuple[Optional[str], Optional[str], Optional[str], bool]
+
+def classify_pair_era(new_key: TripleKey, old_key: TripleKey) -> Optional[Tuple[str, str]]:
+    """
+    İki önerme üçlüsünü karşılaştırır; (LINK_SUPPORT | LINK_CONTRADICTION, gerekçe) veya bağlantı yoksa None döndürür.
+    Sonuçlar önbelleklenir (bkz. get_verdict_cache_stats); sözlükler değişince reload_lexicons çağrılmalıdır.
+    """
+    return _classify_pair_cached(new_key, old_key)
+
+@lru_cache(maxsize=VERDICT_CACHE_SIZE)
+def _classify_pair_cached(new_key: TripleKey, old_key: TripleKey) -> Optional[Tuple[str, str]]:
+    new_subj, new_rel, new_val, new_neg = new_key; old_subj, old_rel, old_val, old_neg = old_key
+
+    # 1. Aynı Özne ve İlişki Durumu: Değeri veya Negasyonu kontrol et
+    if new_subj is not None and new_subj == old_subj and new_rel is not None and new_rel == old_rel:
+        nv = new_val.strip() if isinstance(new_val, str) else new_val
+        ov = old_val.strip() if isinstance(old_val, str) else old_val
+
+        # 1a. Doğrudan Çelişki
+        if nv == ov and new_neg != old_neg: return LINK_CONTRADICTION, "Direct Contradiction"
+        # 1b. Zıt Kavram Çelişkisi
+        elif (bidirectional_opposites.get(nv) == ov or bidirectional_opposites.get(ov) == nv) and new_neg == old_neg: return LINK_CONTRADICTION, f"Opposing Concept ('{nv}' vs '{ov}')"
+        # 1c. Destek (Aynı veya Eşanlamlı Değer)
+        elif new_neg == old_neg and (nv == ov or bidirectional_synonyms.get(nv) == ov or bidirectional_synonyms.get(ov) == nv): return LINK_SUPPORT, "Support (Same/Synonym Value)"
+
+    # 2. İlişkisel Çelişki Durumu (Aynı Özne ve Değer, farklı ilişki)
+    # Örn: X > Y vs X < Y (Burada Y değer oluyor)
+    elif new_subj is not None and new_subj == old_subj and new_val is not None and new_val == old_val and new_neg == old_neg:
+         # TODO: Bu kısım daha genel hale getirilmeli. Şimdilik basit karşılaştırmalar.
+         # Örneğin: 'bigger' vs 'smaller' gibi ilişkiler
+         if bidirectional_opposites.get(new_rel) == old_rel or bidirectional_opposites.get(old_rel) == new_rel:
+              return LINK_CONTRADICTION, f"Opposing Relation ('{new_rel}' vs '{old_rel}') for same Subj/Val"
+
+    # 3. TODO: Daha karmaşık ilişkiler (Entailment vb.) buraya eklenebilir.
+    return None
+
+def get_verdict_cache_stats() -> Dict[str, Any]:
+    """ Karar önbelleğinin isabet istatistiklerini döndürür (bu süreç için, son temizlemeden beri). """
+    info = _classify_pair_cached.cache_info(); lookups = info.hits + info.misses
+    return {"hits": info.hits, "misses": info.misses, "hit_rate": info.hits / lookups if lookups else 0.0,
+            "size": info.currsize, "max_size": info.maxsize}
+
+def clear_verdict_cache():
+    _classify_pair_cached.cache_clear()
+
+def reload_lexicons(new_opposites: Optional[Dict[str, str]] = None, new_synonyms: Optional[Dict[str, str]] = None):
+    """
+    Zıtlık ve/veya eşanlamlı sözlüklerini değiştirir, çift yönlü tabloları yeniden kurar
+    ve eski sözlüklerle verilmiş kararları geçersiz kılmak için önbelleği temizler.
+    """
+    if new_opposites is not None:
+        opposites.clear(); opposites.update(new_opposites); _build_bidirectional_opposites(opposites)
+    if new_synonyms is not None:
+        synonyms.clear(); synonyms.update(new_synonyms); _build_bidirectional_synonyms(synonyms)
+    clear_verdict_cache()
+
 # --- Bağlantı Bulma Fonksiyonu (Era) ---
-def find_and_link_evidence_era(new_prop: Proposition, kb: Dict[str, Proposition]):
+def find_and_link_evidence_era(new_prop: Proposition, kb: Dict[str, Proposition],
+                               cycle_detector: Optional[SupportCycleDetector] = None,
+                               candidates: Optional[Iterable[Proposition]] = None):
     """
     Era Sürümü: Önermeler arası bağlantıları bulur (Genişletilmiş Zıtlıklar, Eşanlamlılar, İlişkiler).
+    Çift kararları classify_pair_era ile (önbellekli) verilir.
+    cycle_detector verilirse her yeni destek bağlantısı eklenmeden önce döngü kontrolü yapılır.
+    candidates verilirse tüm KB yerine yalnızca bu önermelerle karşılaştırılır (örn: aynı özne kovası);
+    olaylar yine kb'ye yayınlanır.
     """
     if not kb or not Proposition: return
     new_subj=new_prop.subject_lemma; new_rel=new_prop.relation_lemma; new_val=new_prop.value_lemma; new_neg=new_prop.is_negated; new_id=new_prop.prop_id
     if not all([new_subj, new_rel, new_val]): return
+    new_key = (new_subj, new_rel, new_val, new_neg)
 
-    for old_prop_id, old_prop in kb.items():
+    for old_prop in (kb.values() if candidates is None else candidates):
+        old_prop_id = old_prop.prop_id
         if new_id == old_prop_id: continue
-        old_subj=old_prop.subject_lemma; old_rel=old_prop.relation_lemma; old_val=old_prop.value_lemma; old_neg=old_prop.is_negated
+        if old_prop.subject_lemma != new_subj: continue # Tüm kurallar aynı özneyi gerektirir; önbelleğe sorulmaz
 
         # --- Eşleşme Kontrolleri ---
-        is_contradiction = False
-        is_support = False
+        verdict = classify_pair_era(new_key, (old_prop.subject_lemma, old_prop.relation_lemma, old_prop.value_lemma, old_prop.is_negated))
+        if verdict is None: continue
+        link_kind, reason = verdict
+        print(f"[Linker Found]: {reason} ({new_id[:4]} vs {old_prop_id[:4]})")
+        is_contradiction = link_kind == LINK_CONTRADICTION
+        is_support = link_kind == LINK_SUPPORT
+
+        # --- Bağlantıları Güncelle ---
+        if is_contradiction:
+            if old_prop_id not in new_prop.epistemic_data.contradicts: new_prop.epistemic_data.contradicts.append(old_prop_id); emit(kb, EVENT_LINK_ADDED, new_prop, linked_id=old_prop_id, kind="contradicts")
+            if new_id not in old_prop.epistemic_data.contradicts: old_prop.epistemic_data.contradicts.append(new_id); emit(kb, EVENT_LINK_ADDED, old_prop, linked_id=new_id, kind="contradicts")
+        elif is_support:
+            if cycle_detector is not None: cycle_detector.on_support_edge(new_prop, old_prop, kb)
+            if old_prop_id not in new_prop.epistemic_data.supports: new_prop.epistemic_data.supports.append(old_prop_id); emit(kb, EVENT_LINK_ADDED, new_prop, linked_id=old_prop_id, kind="supports")
+            if new_id not in old_prop.epistemic_data.supports: old_prop.epistemic_data.supports.append(new_id); emit(kb, EVENT_LINK_ADDED, old_prop, linked_id=new_id, kind="supports")
+        if is_contradiction or is_support:
+            link_time = datetime.now() # Saklama politikası için son referans zamanı
+            new_prop.epistemic_data.last_referenced = link_time; old_prop.epistemic_data.last_referenced = link_time
+
 
-        # 1. Aynı Özne ve İlişki Durumu: Değeri veya Negasyonu kontrol et
-        if new_subj is not None and new_subj == old_subj and new_rel is not None and new_rel == old_rel:
-            nv = new_val.strip() if isinstance(new_val, str) else new_val
-            ov = old_val.strip() if isinstance(old_val, str) else old_val
+# --- Özne Parçalı (Sharded) Paralel Linkleme ---
+# Süreçler arası taşınan hafif kayıt: (prop_id, subject, relation, value, is_negated, supports, contradicts)
+LinkRecord = Tuple[str, Optional[str], Optional[str], Optional[str], bool, List[str], List[str]]
+SHARDS_PER_WORKER = 4 # İş dengesi için işçi başına düşen parça sayısı
 
-            # 1a. Doğrudan Çelişki
-            if nv == ov and new_neg != old_neg: is_contradiction = True; print(f"[Linker Found]: Direct Contradiction ({new_id[:4]} vs {old_prop_id[:4]})")
-            # 1b. Zıt Kavram Çelişkisi
-            elif (bidirectional_opposites.get(nv) == ov or bidirectional_opposites.get(ov) == nv) and new_neg == old_neg: is_contradiction = True; print(f"[Linker Found]: Opposing Concept ('{nv}' vs '{ov}') ({new_id[:4]} vs {old_prop_id[:4]})")
-            # 1c. Destek (Aynı veya Eşanlamlı Değer)
-            elif new_neg == old_neg and (nv == ov or bidirectional_synonyms.get(nv) == ov or bidirectional_synonyms.get(ov) == nv): is_support = True; print(f"[Linker Found]: Support (Same/Synonym Value) ({new_id[:4]} vs {old_prop_id[:4]})")
+def get_subject_shard(subject_lemma: Optional[str], num_shards: int) -> int:
+    """ Özneyi süreçler arasında kararlı bir hash (crc32) ile bir parçaya atar. """
+    return zlib.crc32((subject_lemma or "").encode("utf-8")) % num_shards
 
-        # 2. İlişkisel Çelişki Durumu (Aynı Özne ve Değer, farklı ilişki)
-        # Örn: X > Y vs X < Y (Burada Y değer oluyor)
-        elif new_subj is not None and new_subj == old_subj and new_val is not None and new_val == old_val and new_neg == old_neg:
-             rel_key_new = (new_rel, new_val) # (ilişki, değer)
-             rel_key_old = (old_rel, old_val) # (ilişki, değer) - değerler aynı
+def _to_link_record(prop: Proposition) -> LinkRecord:
+    ep_data = prop.epistemic_data
+    return (prop.prop_id, prop.subject_lemma, prop.relation_lemma, prop.value_lemma, prop.is_negated,
+            list(ep_data.supports), list(ep_data.contradicts))
 
-             # TODO: Bu kısım daha genel hale getirilmeli. Şimdilik basit karşılaştırmalar.
-             # Örneğin: 'bigger' vs 'smaller' gibi ilişkiler
-             if bidirectional_opposites.get(new_rel) == old_rel or bidirectional_opposites.get(old_rel) == new_rel:
-                  is_contradiction = True; print(f"[Linker Found]: Opposing Relation ('{new_rel}' vs '{old_rel}') for same Subj/Val ({new_id[:4]} vs {old_prop_id[:4]})")
+def _link_shard_worker(existing_records: List[LinkRecord], new_records: List[LinkRecord]) -> Dict[str, Tuple[List[str], List[str]]]:
+    """
+    Tek bir parçayı (ayrı süreçte) seri olarak linkler ve bağlantı listeleri değişen
+    önermelerin son supports/contradicts listelerini döndürür.
+    """
+    from aee_core_classes_era import EpistemicData
+    shard_kb: Dict[str, Proposition] = {}
+    original_sizes: Dict[str, Tuple[int, int]] = {}
+    def build_prop(record: LinkRecord) -> Proposition:
+        prop_id, subj, rel, val, neg, supports, contradicts = record
+        ep_data = EpistemicData(source_id="", supports=supports, contradicts=contradicts)
+        return Proposition("", "", ep_data, prop_id=prop_id, subject_lemma=subj, relation_lemma=rel, value_lemma=val, is_negated=neg)
+    for record in existing_records:
+        shard_kb[record[0]] = build_prop(record); original_sizes[record[0]] = (len(record[5]), len(record[6]))
+    for record in new_records:
+        new_prop = build_prop(record)
+        find_and_link_evidence_era(new_prop, shard_kb)
+        shard_kb[new_prop.prop_id] = new_prop
+    # Bağlantılar yalnızca eklenir; uzunluğu değişmeyen liste değişmemiştir
+    return {prop_id: (prop.epistemic_data.supports, prop.epistemic_data.contradicts)
+            for prop_id, prop in shard_kb.items()
+            if original_sizes.get(prop_id) != (len(prop.epistemic_data.supports), len(prop.epistemic_data.contradicts))}
+
+def link_propositions_sharded(new_props: List[Proposition], kb: Dict[str, Proposition], num_workers: int = 4,
+                              num_shards: Optional[int] = None) -> int:
+    """
+    Era Sürümü (Paralel): Yeni önermeleri KB'ye linkleyerek ekler.
+    find_and_link_evidence_era yalnızca aynı subject_lemma'ya sahip önermeleri bağladığından,
+    yeni ve mevcut önermeler özne hash'ine göre parçalara ayrılır ve her parça ayrı bir süreçte linklenir.
+    Parça içi sıra seri sırayla aynı tutulduğu için sonuç seri linklemeyle birebir aynıdır.
+    Not: KB'yi yerinde günceller; eklenen yeni önerme sayısını döndürür.
+    """
+    if not Proposition: return 0
+    num_shards = num_shards or max(1, num_workers * SHARDS_PER_WORKER)
 
+    # Seri döngüdeki gibi: KB'de zaten olan veya listede tekrar eden ID'ler atlanır
+    props_to_add: List[Proposition] = []; seen_ids: Set[str] = set()
+    for prop in new_props:
+        if prop.prop_id in kb or prop.prop_id in seen_ids: continue
+        seen_ids.add(prop.prop_id); props_to_add.append(prop)
+    if not props_to_add: return 0
 
-        # 3. TODO: Daha karmaşık ilişkiler (Entailment vb.) buraya eklenebilir.
+    new_by_shard: Dict[int, List[LinkRecord]] = {}
+    for prop in props_to_add:
+        new_by_shard.setdefault(get_subject_shard(prop.subject_lemma, num_shards), []).append(_to_link_record(prop))
+    # Yalnızca yeni önerme içeren parçalardaki mevcut önermeler gönderilir (KB ekleme sırası korunur)
+    existing_by_shard: Dict[int, List[LinkRecord]] = {shard: [] for shard in new_by_shard}
+    for prop in kb.values():
+        shard = get_subject_shard(prop.subject_lemma, num_shards)
+        if shard in existing_by_shard: existing_by_shard[shard].append(_to_link_record(prop))
 
+    shard_ids = sorted(new_by_shard.keys())
+    print(f"  Sharded linking: {len(props_to_add)} new props across {len(shard_ids)} shards ({num_workers} workers)...")
+    if num_workers > 1 and len(shard_ids) > 1:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            shard_results = list(executor.map(_link_shard_worker, [existing_by_shard[s] for s in shard_ids], [new_by_shard[s] for s in shard_ids]))
+    else:
+        shard_results = [_link_shard_worker(existing_by_shard[s], new_by_shard[s]) for s in shard_ids]
 
-        # --- Bağlantıları Güncelle ---
-        if is_contradiction:
-            if old_prop_id not in new_prop.epistemic_data.contradicts: new_prop.epistemic_data.contradicts.append(old_prop_id)
-            if new_id not in old_prop.epistemic_data.contradicts: old_prop.epistemic_data.contradicts.append(new_id)
-        elif is_support:
-            if old_prop_id not in new_prop.epistemic_data.supports: new_prop.epistemic_data.supports.append(old_prop_id)
-            if new_id not in old_prop.epistemic_data.supports: old_prop.epistemic_data.supports.append(new_id)
+    # Sonuçları birleştir: parçalar ayrık olduğu için her ID tek bir sonuçta yer alır
+    for prop in props_to_add:
+        emit(kb, EVENT_PROP_INSERTED, prop); kb[prop.prop_id] = prop
+    link_time = datetime.now()
+    notify = has_listeners(kb)
+    for result in shard_results:
+        for prop_id, (supports, contradicts) in result.items():
+            ep_data = kb[prop_id].epistemic_data
+            if len(supports) + len(contradicts) > len(ep_data.supports) + len(ep_data.contradicts): ep_data.last_referenced = link_time
+            # Bağlantılar yalnızca eklendiği için yeniler listelerin sonundadır
+            added_links = [(linked_id, "supports") for linked_id in supports[len(ep_data.supports):]] + \
+                          [(linked_id, "contradicts") for linked_id in contradicts[len(ep_data.contradicts):]] if notify else []
+            ep_data.supports[:] = supports; ep_data.contradicts[:] = contradicts
+            for linked_id, kind in added_links: emit(kb, EVENT_LINK_ADDED, kb[prop_id], linked_id=linked_id, kind=kind)
+    return len(props_to_add)
 
 
 # --- Test Bloğu ---
@@ -148,6 +310,9 @@ if __name__ == "__main__":
              supports_str = ', '.join([pid[:4] for pid in prop_obj.epistemic_data.supports]) if prop_obj.epistemic_data.supports else "None"
              contradicts_str = ', '.join([pid[:4] for pid in prop_obj.epistemic_data.contradicts]) if prop_obj.epistemic_data.contradicts else "None"
              print(f"ID: {prop_id[:8]} ({prop_obj.subject_lemma} {prop_obj.relation_lemma} {prop_obj.value_lemma}) | Supports: [{supports_str}] | Contradicts: [{contradicts_str}]")
+        print(f"\nVerdict cache: {get_verdict_cache_stats()}")
+        reload_lexicons(new_synonyms={**synonyms, "quick": "speedy"}) # Önbellek temizlenir
+        print(f"After reload_lexicons: {get_verdict_cache_stats()}")
 
     else: print("Could not run tests due to import error.")
     print("\nEnhanced Linker module testing complete.")
\ No newline at end of file
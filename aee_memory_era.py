@@ -0,0 +1,162 @@
+# aee_memory_era.py
+# AEE Era Sürümü: Bellek muhasebesi ve bellek bütçesi modu.
+# tracemalloc ile aşama bazında tepe bellek ölçümü, KB boyut tahmini ve bütçe aşıldığında
+# bekleyen önermeleri geçici diske taşıyan (spill) liste benzeri depo.
+
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Any, Iterator
+
+# Era sürümündeki sınıfları import et
+try:
+    from aee_core_classes_era import Proposition
+except ImportError:
+    print("Memory Error: Could not import Proposition class from aee_core_classes_era.py.")
+    Proposition = None
+
+# --- Sabitler ---
+BYTES_PER_MB = 1024 * 1024
+SPILL_CHECK_INTERVAL = 256 # Bütçe kontrolü her N eklemede bir yapılır
+
+class MemoryTracker:
+    """
+    tracemalloc ile aşama (phase) bazında tepe bellek kullanımını ölçer.
+    Kullanım: tracker.start(); tracker.mark_phase("extract"); ...; tracker.mark_phase("link"); ...; tracker.stop()
+    """
+
+    def __init__(self, budget_mb: Optional[float] = None):
+        self.budget_bytes: Optional[int] = int(budget_mb * BYTES_PER_MB) if budget_mb is not None else None
+        self.phase_peaks: Dict[str, int] = {}
+        self.phase_durations: Dict[str, float] = {}
+        self._current_phase: Optional[str] = None
+        self._phase_start = 0.0
+        self._started_here = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(); self._started_here = True
+
+    def mark_phase(self, phase_name: Optional[str]):
+        """ Önceki aşamanın tepe değerini kaydeder ve yeni aşamayı başlatır (None: yalnızca bitir). """
+        if not tracemalloc.is_tracing(): return
+        if self._current_phase is not None:
+            _, peak = tracemalloc.get_traced_memory()
+            self.phase_peaks[self._current_phase] = max(peak, self.phase_peaks.get(self._current_phase, 0))
+            self.phase_durations[self._current_phase] = self.phase_durations.get(self._current_phase, 0.0) + time.time() - self._phase_start
+        self._current_phase = phase_name; self._phase_start = time.time()
+        tracemalloc.reset_peak()
+
+    def stop(self):
+        self.mark_phase(None)
+        if self._started_here: tracemalloc.stop(); self._started_here = False
+
+    def current_bytes(self) -> int:
+        return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+
+    def over_budget(self) -> bool:
+        return self.budget_bytes is not None and self.current_bytes() > self.budget_bytes
+
+    def report(self) -> Dict[str, Any]:
+        return {"budget_mb": self.budget_bytes / BYTES_PER_MB if self.budget_bytes is not None else None,
+                "phase_peak_mb": {phase: peak / BYTES_PER_MB for phase, peak in self.phase_peaks.items()},
+                "phase_seconds": dict(self.phase_durations)}
+
+def estimate_kb_size(kb: Dict[str, Proposition]) -> Dict[str, Any]:
+    """
+    KB boyutunu tahmin eder: önerme, bağlantı ve işaret sayıları ile önerme nesnelerinin,
+    listelerinin ve metinlerinin yaklaşık (sığ getsizeof toplamı) bayt karşılığı.
+    """
+    estimate = {"propositions": len(kb), "support_links": 0, "contradiction_links": 0, "bias_flags": 0, "approx_mb": 0.0}
+    if not Proposition or not kb: return estimate
+    total_bytes = sys.getsizeof(kb)
+    for prop in kb.values():
+        ep_data = prop.epistemic_data
+        estimate["support_links"] += len(ep_data.supports); estimate["contradiction_links"] += len(ep_data.contradicts)
+        estimate["bias_flags"] += len(ep_data.bias_flags)
+        total_bytes += (sys.getsizeof(prop) + sys.getsizeof(prop.__dict__) + sys.getsizeof(ep_data) + sys.getsizeof(ep_data.__dict__) +
+                        sys.getsizeof(ep_data.supports) + sys.getsizeof(ep_data.contradicts) + sys.getsizeof(ep_data.bias_flags) +
+                        sys.getsizeof(prop.text_span) + sys.getsizeof(prop.sentence_text) + sys.getsizeof(prop.sentence_refs) +
+                        sys.getsizeof(prop.prop_id))
+    estimate["approx_mb"] = total_bytes / BYTES_PER_MB
+    return estimate
+
+class SpillStore:
+    """
+    Linklemeyi bekleyen önermeler için liste benzeri depo. Bellek bütçesi aşıldığında bellekteki
+    önermeler geçici bir dizine pickle segmentleri olarak yazılır; yineleme (iteration) sırasında
+    segmentler sırayla okunur, ekleme sırası korunur.
+    """
+
+    def __init__(self, tracker: Optional[MemoryTracker] = None, spill_dir: Optional[str] = None):
+        self.tracker = tracker
+        self._buffer: List[Proposition] = []
+        self._segments: List[str] = []
+        self._spilled_count = 0
+        self._spill_dir = spill_dir; self._owns_dir = False
+        self._appends_since_check = 0
+
+    def append(self, prop: Proposition):
+        self._buffer.append(prop)
+        self._appends_since_check += 1
+        if self._appends_since_check >= SPILL_CHECK_INTERVAL:
+            self._appends_since_check = 0
+            if self.tracker and self.tracker.over_budget(): self.spill()
+
+    def spill(self):
+        """ Bellekteki önermeleri yeni bir disk segmentine yazar ve belleği boşaltır. """
+        if not self._buffer: return
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="aee_spill_"); self._owns_dir = True
+        segment_path = os.path.join(self._spill_dir, f"segment_{len(self._segments):05d}.pkl")
+        with open(segment_path, "wb") as segment_file: pickle.dump(self._buffer, segment_file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._segments.append(segment_path); self._spilled_count += len(self._buffer)
+        print(f"  Memory budget exceeded: spilled {len(self._buffer)} pending propositions to disk (segment {len(self._segments)}).")
+        self._buffer = []
+
+    def __iter__(self) -> Iterator[Proposition]:
+        for segment_path in self._segments:
+            with open(segment_path, "rb") as segment_file: yield from pickle.load(segment_file)
+        yield from self._buffer
+
+    def __len__(self) -> int:
+        return self._spilled_count + len(self._buffer)
+
+    @property
+    def spilled_count(self) -> int: return self._spilled_count
+
+    @property
+    def segment_count(self) -> int: return len(self._segments)
+
+    def close(self):
+        """ Geçici segment dosyalarını siler. """
+        if self._owns_dir and self._spill_dir: shutil.rmtree(self._spill_dir, ignore_errors=True)
+        else:
+            for segment_path in self._segments:
+                if os.path.exists(segment_path): os.remove(segment_path)
+        self._segments = []; self._spilled_count = 0; self._buffer = []
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE Memory Module (Era Version)...")
+    if Proposition:
+        from aee_core_classes_era import EpistemicData
+        tracker = MemoryTracker(budget_mb=1)
+        tracker.start(); tracker.mark_phase("extract")
+        pending = SpillStore(tracker)
+        for i in range(5000):
+            ed = EpistemicData(source_id=f"src{i % 7}")
+            pending.append(Proposition(f"claim {i}" * 5, f"claim {i}" * 5, ed, subject_lemma=f"s{i % 50}", relation_lemma="be", value_lemma="v"))
+        tracker.mark_phase("link")
+        kb_test = {prop.prop_id: prop for prop in pending}
+        tracker.stop()
+        print(f"Pending: {len(pending)} | Spilled: {pending.spilled_count} in {pending.segment_count} segments")
+        print(f"Tracker report: {tracker.report()}")
+        print(f"KB size estimate: {estimate_kb_size(kb_test)}")
+        pending.close()
+    else: print("Could not run tests due to import error.")
+    print("\nMemory module testing complete.")
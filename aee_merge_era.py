@@ -0,0 +1,130 @@
+# aee_merge_era.py
+# AEE Era Sürümü: Bağımsız oluşturulmuş KB'lerin (parçaların) birleştirilmesi.
+# Derlem makineler arasında bölünüp her parça ayrı linklendiğinde parçalar arası bağlantılar
+# hiç keşfedilmez ve kaynak güvenilirlikleri her parçada ayrı hesaplanır. merge_knowledge_bases
+# parçaları sırayla birleştirir: parça içi bağlantılar korunur, her yeni önerme yalnızca daha
+# önce birleştirilmiş önermelerin aynı özne kovasıyla (linker kuralları yalnızca aynı özneyi
+# bağlar) karşılaştırılır. Ardından bias tespiti ve güncelleme birleşik KB üzerinde çalışır;
+# böylece kaynak istatistikleri (çelişkiler, güven yayılımı) tüm parçalardan birlikte hesaplanır.
+
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Set, Union, Any
+
+# Era sürümündeki modülleri import et
+try:
+    from aee_core_classes_era import Proposition
+    from aee_checkpoint_era import load_checkpoint
+    from aee_linker_era import find_and_link_evidence_era
+    from aee_dedup_era import build_dedup_index, get_dedup_key, merge_duplicate_proposition
+    from aee_bias_detector import run_bias_detection_v3
+    from aee_updater_era import run_updates_era, ConfidenceLedger, RELIABILITY_MODEL_BINARY
+    from aee_events_era import emit, EVENT_PROP_INSERTED
+except ImportError as e:
+    print(f"Merge Error: Could not import dependencies ({e}).")
+    Proposition = None
+
+# Parça: bellekteki KB veya kontrol noktası dosyası (aee_checkpoint_era biçimi)
+KBShard = Union[Dict[str, Proposition], str]
+
+def _count_links(props: Sequence[Proposition]) -> int:
+    return sum(len(prop.epistemic_data.supports) + len(prop.epistemic_data.contradicts) for prop in props)
+
+def _load_shard(shard: KBShard) -> Dict[str, Proposition]:
+    if isinstance(shard, str): return load_checkpoint(shard)[0]
+    return shard
+
+def merge_knowledge_bases(shards: Sequence[KBShard], kb: Optional[Dict[str, Proposition]] = None, dedup: bool = False,
+                          run_updates: bool = True, reliability_model: str = RELIABILITY_MODEL_BINARY,
+                          update_workers: int = 1, ledger: Optional[ConfidenceLedger] = None,
+                          stats: Optional[Dict[str, Any]] = None) -> Dict[str, Proposition]:
+    """
+    Era Sürümü: Linklenmiş KB parçalarını tek bir KB'de birleştirir (kb verilirse onun içine).
+    - Parçalar sırayla eklenir; önermeler taşınır (nesneler kopyalanmaz, bağlantıları yerinde güncellenir).
+    - KB'de zaten olan prop_id'ler (örn: aynı parça iki kez) atlanır; parça içi bağlantıları mevcut kayda işaret eder.
+    - dedup: Özdeş aynı-kaynak önermeler (source, subject, relation, value, negation) ilk görülen kayıtta
+      toplanır; atılan kopyanın kimliği parça içi bağlantılardan silinir. Kopyanın komşuları kanonik kayıtla
+      aynı üçlüye sahip olduğundan kanonik kayda zaten bağlıdır veya parçalar arası linklemede bağlanır.
+    - Parçalar arası linkleme yalnızca yeni önerme x önceki parçaların aynı özne kovası çiftlerine bakar.
+    - run_updates: Birleşik KB üzerinde bias tespiti ve run_updates_era (kaynak güvenilirlikleri tüm parçalardan).
+    stats verilirse birleştirme sayaçları stats["merge"] altına yazılır.
+    """
+    merged: Dict[str, Proposition] = kb if kb is not None else {}
+    if not Proposition: return merged
+    start_time = time.time()
+    subject_buckets: Dict[Optional[str], List[Proposition]] = defaultdict(list)
+    for prop in merged.values(): subject_buckets[prop.subject_lemma].append(prop)
+    dedup_index = build_dedup_index(merged) if dedup else None
+    merge_stats: Dict[str, Any] = {"shards": 0, "propositions_in": 0, "added": 0, "duplicates_merged": 0,
+                                   "existing_ids_skipped": 0, "cross_links": 0}
+
+    for shard_number, shard in enumerate(shards, start=1):
+        shard_kb = _load_shard(shard)
+        merge_stats["shards"] += 1; merge_stats["propositions_in"] += len(shard_kb)
+        # 1. Mevcut kimlikleri ve (dedup) kopyaları ayıkla
+        new_props: List[Proposition] = []; dropped_ids: Set[str] = set()
+        for prop in shard_kb.values():
+            if prop.prop_id in merged: merge_stats["existing_ids_skipped"] += 1; continue
+            if dedup_index is not None:
+                key = get_dedup_key(prop); canonical = dedup_index.get(key)
+                if canonical is not None:
+                    merge_duplicate_proposition(canonical, prop); dropped_ids.add(prop.prop_id)
+                    merge_stats["duplicates_merged"] += 1; continue
+                dedup_index[key] = prop
+            new_props.append(prop)
+        if dropped_ids:
+            for prop in new_props:
+                ep_data = prop.epistemic_data
+                ep_data.supports[:] = [linked_id for linked_id in ep_data.supports if linked_id not in dropped_ids]
+                ep_data.contradicts[:] = [linked_id for linked_id in ep_data.contradicts if linked_id not in dropped_ids]
+
+        # 2. Parçalar arası linkleme: parça içi çiftler zaten linkli, yalnızca önceki kovalarla karşılaştırılır
+        links_before = _count_links(new_props)
+        for prop in new_props:
+            bucket = subject_buckets.get(prop.subject_lemma, ())
+            emit(merged, EVENT_PROP_INSERTED, prop)
+            if bucket: find_and_link_evidence_era(prop, merged, candidates=bucket)
+            merged[prop.prop_id] = prop
+        for prop in new_props: subject_buckets[prop.subject_lemma].append(prop) # Parça bittikten sonra kovaya girer
+        merge_stats["added"] += len(new_props)
+        # Parçalar arası her bağlantı yeni önermenin listesine bir kez eklenir
+        shard_cross_links = _count_links(new_props) - links_before
+        merge_stats["cross_links"] += shard_cross_links
+        print(f"  Merged shard {shard_number}: {len(new_props)} added, {shard_cross_links} cross-shard links.")
+
+    print(f"Merge complete: {merge_stats['added']} propositions from {merge_stats['shards']} shards, "
+          f"{merge_stats['duplicates_merged']} duplicates merged, {merge_stats['cross_links']} cross-shard links.")
+    if run_updates and merged:
+        # Parçalarda hesaplanmış bias bayrakları ve güvenler birleşik KB için geçersiz: baştan hesaplanır
+        for prop in merged.values():
+            prop.epistemic_data.bias_flags.clear()
+            prop.epistemic_data.computed_confidence = prop.epistemic_data.initial_confidence
+        run_bias_detection_v3(merged)
+        run_updates_era(merged, ledger=ledger, reliability_model=reliability_model, update_workers=update_workers)
+    merge_stats["seconds"] = time.time() - start_time
+    if stats is not None: stats["merge"] = merge_stats
+    return merged
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE Merge Module (Era Version)...")
+    if Proposition:
+        from aee_core_classes_era import EpistemicData
+        def build_shard(rows) -> Dict[str, Proposition]:
+            shard_kb: Dict[str, Proposition] = {}
+            for source_id, subject, value, negated in rows:
+                prop = Proposition(f"{subject} {value}", f"{subject} {value}", EpistemicData(source_id=source_id), subject_lemma=subject,
+                                   relation_lemma="be", value_lemma=value, is_negated=negated)
+                find_and_link_evidence_era(prop, shard_kb); shard_kb[prop.prop_id] = prop
+            return shard_kb
+        shard_a = build_shard([("news.com", "sky", "blue", False), ("wiki", "water", "wet", False)])
+        shard_b = build_shard([("blog", "sky", "blue", True), ("news.com", "sky", "blue", False), ("wiki", "ice", "cold", False)])
+        merge_stats_test: Dict[str, Any] = {}
+        merged_test = merge_knowledge_bases([shard_a, shard_b], dedup=True, stats=merge_stats_test)
+        print(f"Stats: {merge_stats_test['merge']}")
+        for prop in merged_test.values():
+            print(f"  {prop.subject_lemma} {'not ' if prop.is_negated else ''}{prop.value_lemma} ({prop.epistemic_data.source_id}): "
+                  f"x{prop.epistemic_data.occurrence_count}, {len(prop.epistemic_data.supports)} supports, "
+                  f"{len(prop.epistemic_data.contradicts)} contradicts, reliability {prop.epistemic_data.reliability_score}")
+    else: print("Could not run tests due to import error.")
+    print("\nMerge module testing complete.")
@@ -0,0 +1,204 @@
+# aee_namespaces_era.py
+# AEE Era Sürümü: Tek süreçte, tek bir yüklü spaCy modelini paylaşan birden fazla adlandırılmış KB.
+# Her ad alanı (namespace: kiracı/derlem) kendi önermelerini, bağlantılarını, kaynak
+# güvenilirliklerini, defterini ve doküman deposunu tutar; model (aee_extractor_era.NLP_MODEL)
+# süreç başına bir kez yüklenir. İşler ad alanları arasında sırayla (round-robin) çalıştırılır,
+# böylece büyük bir kiracı diğerlerini bekletmez. Çok çekirdekli kullanımda model fork'tan önce
+# yüklenip gc.freeze ile dondurulur; işçi süreçler model sayfalarını copy-on-write paylaşır.
+
+import gc
+import multiprocessing
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+# Era sürümündeki modülleri import et
+try:
+    from aee_core_classes_era import Proposition
+    import aee_extractor_era
+    from aee_corpus_era import DocumentStore
+    from aee_updater_era import ConfidenceLedger
+    from aee_neardup_era import NearDuplicateIndex
+    from aee_cycles_era import SupportCycleDetector
+    from aee_checkpoint_era import save_checkpoint, load_checkpoint
+    from aee_era_main import run_aee_era_pipeline
+except ImportError as e:
+    print(f"Namespaces Error: Could not import dependencies ({e}).")
+    Proposition = None
+
+# --- Sabitler ---
+_WARMUP_TEXT = "The model is loaded. It is shared by every namespace."
+# Çalıştırma durumu tutan pipeline seçenekleri: ad alanları arasında paylaşılamaz (default_options'ta yasak)
+_STATEFUL_OPTIONS = ("kb", "ledger", "document_store", "near_duplicate_index", "cycle_detector", "temporal_index",
+                     "leaderboard", "change_feed", "snapshot_store", "stats")
+# fork edilen işçide kopyası güncellenip ebeveyne geri taşınamayan seçenekler (run_forked reddeder)
+_FORK_UNSAFE_OPTIONS = ("change_feed", "temporal_index")
+
+def preload_shared_model() -> bool:
+    """
+    Paylaşılan spaCy modelinin yüklü olduğunu doğrular, tembel (lazy) ilk çağrı ayırmalarının
+    fork'tan önce yapılması için kısa bir metni işler ve mevcut nesneleri gc.freeze ile kalıcı
+    nesil (permanent generation) altına alır. Böylece işçi süreçlerde çöp toplayıcı model
+    nesnelerine dokunmaz ve sayfalar kopyalanmadan paylaşılır. Ebeveyn süreç işçiler başladıktan
+    sonra gc.unfreeze çağırmalıdır (run_forked bunu yapar). Model yüklüyse True döndürür.
+    """
+    if Proposition is None or aee_extractor_era.NLP_MODEL is None: return False
+    aee_extractor_era.NLP_MODEL(_WARMUP_TEXT)
+    gc.collect(); gc.freeze()
+    return True
+
+@dataclass
+class Namespace:
+    """Bir ad alanının yalıtılmış durumu: KB, defter, doküman deposu, bekleyen işler ve pipeline seçenekleri."""
+    name: str
+    kb: Dict[str, Proposition] = field(default_factory=dict)
+    ledger: Optional[ConfidenceLedger] = None
+    document_store: Optional[DocumentStore] = None
+    near_duplicate_index: Optional[NearDuplicateIndex] = None
+    cycle_detector: Optional[SupportCycleDetector] = None
+    options: Dict[str, Any] = field(default_factory=dict) # run_aee_era_pipeline'a ek argümanlar
+    pending: Deque[List[Dict[str, str]]] = field(default_factory=deque)
+    stats: Dict[str, Any] = field(default_factory=lambda: {"jobs": 0, "items": 0, "seconds": 0.0})
+
+    def pipeline_kwargs(self) -> Dict[str, Any]:
+        kwargs = dict(self.options)
+        kwargs.update({"kb": self.kb, "ledger": self.ledger, "document_store": self.document_store})
+        if self.near_duplicate_index is not None: kwargs["near_duplicate_index"] = self.near_duplicate_index
+        if self.cycle_detector is not None: kwargs["cycle_detector"] = self.cycle_detector
+        return kwargs
+
+class NamespacePool:
+    """
+    Adlandırılmış KB'leri ve iş kuyruklarını yönetir. submit(ad, girdiler) bir işi kuyruğa ekler;
+    run_round_robin() her turda iş bekleyen her ad alanından birer iş çalıştırır.
+    run_forked(n) ad alanlarını n işçi sürece dağıtır (her ad alanı tek bir süreçte kalır).
+    """
+
+    def __init__(self, default_options: Optional[Dict[str, Any]] = None):
+        shared_state = sorted(set(default_options or {}) & set(_STATEFUL_OPTIONS))
+        if shared_state: # Sığ kopyalanan nesne her ad alanında aynı olurdu; yalıtım bozulur
+            raise ValueError(f"Stateful options cannot be shared through default_options: {', '.join(shared_state)}. "
+                             "Pass them per namespace to create_namespace().")
+        self.default_options = dict(default_options or {})
+        self.namespaces: Dict[str, Namespace] = {}
+        self._next_turn = 0 # Sıradaki turun başlayacağı ad alanı (adil dönüş)
+
+    def create_namespace(self, name: str, **options: Any) -> Namespace:
+        """ Yeni ad alanı oluşturur; options varsayılan pipeline seçeneklerinin üzerine yazılır. """
+        if name in self.namespaces: raise ValueError(f"Namespace '{name}' already exists.")
+        merged_options = {**self.default_options, **options}
+        namespace = Namespace(name=name, ledger=ConfidenceLedger(), options=merged_options)
+        if merged_options.get("text_offsets"): namespace.document_store = DocumentStore() # doc_id'ler ad alanları arasında çakışmasın
+        if merged_options.get("near_duplicates"): namespace.near_duplicate_index = NearDuplicateIndex()
+        if merged_options.get("incremental_cycles"): namespace.cycle_detector = SupportCycleDetector()
+        self.namespaces[name] = namespace
+        return namespace
+
+    def get_kb(self, name: str) -> Dict[str, Proposition]:
+        return self.namespaces[name].kb
+
+    def submit(self, name: str, inputs: List[Dict[str, str]]):
+        """ Ad alanına bir iş (girdi listesi) ekler; ad alanı yoksa varsayılan seçeneklerle oluşturulur. """
+        namespace = self.namespaces.get(name) or self.create_namespace(name)
+        namespace.pending.append(list(inputs))
+
+    def pending_jobs(self) -> int:
+        return sum(len(namespace.pending) for namespace in self.namespaces.values())
+
+    def _run_job(self, namespace: Namespace, inputs: List[Dict[str, str]]):
+        print(f"\n=== Namespace '{namespace.name}': job {namespace.stats['jobs'] + 1} ({len(inputs)} items) ===")
+        start_time = time.time()
+        run_aee_era_pipeline(inputs, **namespace.pipeline_kwargs())
+        namespace.stats["jobs"] += 1; namespace.stats["items"] += len(inputs); namespace.stats["seconds"] += time.time() - start_time
+
+    def run_round_robin(self, max_jobs: Optional[int] = None, names: Optional[List[str]] = None) -> int:
+        """
+        Bekleyen işleri ad alanları arasında sırayla çalıştırır: her turda iş bekleyen her ad alanından
+        en fazla bir iş. max_jobs verilirse o kadar işten sonra durur (sonraki çağrı kaldığı ad alanından devam eder).
+        Çalıştırılan iş sayısını döndürür.
+        """
+        order = [name for name in self.namespaces if names is None or name in names]
+        jobs_run = 0
+        while order and any(self.namespaces[name].pending for name in order):
+            start = self._next_turn % len(order)
+            for turn in range(len(order)):
+                if max_jobs is not None and jobs_run >= max_jobs: return jobs_run
+                position = (start + turn) % len(order)
+                namespace = self.namespaces[order[position]]
+                if not namespace.pending: continue
+                self._run_job(namespace, namespace.pending.popleft()); jobs_run += 1
+                self._next_turn = position + 1 # max_jobs ile kesilirse sonraki çağrı bir sonraki ad alanından başlar
+        return jobs_run
+
+    # --- Çok Süreçli Çalıştırma (fork) ---
+    def _worker(self, names: List[str], workdir: str):
+        self.run_round_robin(names=names)
+        for name in names: # Sonuçlar ebeveyne kontrol noktası olarak döner
+            namespace = self.namespaces[name]
+            meta: Dict[str, Any] = {"ledger": namespace.ledger.as_rows(), "stats": namespace.stats,
+                                    "pipeline_stats": namespace.options.get("stats")}
+            if namespace.near_duplicate_index is not None: meta["near_duplicate_signatures"] = namespace.near_duplicate_index.as_rows()
+            if namespace.document_store is not None: meta["documents"] = namespace.document_store.as_rows()
+            save_checkpoint(os.path.join(workdir, f"{name}.ckpt.json.gz"), namespace.kb.values(), stage="namespace", meta=meta,
+                            resolve_texts=False) # Dokümanlar meta ile taşınır; önermeler ofset modunda kalır
+
+    def run_forked(self, num_workers: int, workdir: str) -> int:
+        """
+        Ad alanlarını num_workers fork edilmiş sürece dağıtır (model fork'tan önce preload_shared_model ile
+        yüklenir). Her işçi kendi ad alanlarının işlerini round-robin çalıştırır ve KB'leri workdir altına
+        yazar; ebeveyn bunları kendi ad alanlarına geri yükler. Yakın-kopya imzaları, doküman metinleri ve
+        pipeline stats sözlüğü de geri taşınır; döngü dedektörü ve leaderboard yüklenen KB'den yeniden kurulur,
+        snapshot_store'a yeni sürüm yayınlanır. change_feed veya temporal_index kullanan ad alanları reddedilir.
+        fork yoksa işler bu süreçte çalıştırılır.
+        Çalıştırılan iş sayısını döndürür.
+        """
+        total_jobs = self.pending_jobs()
+        busy_names = [name for name, namespace in self.namespaces.items() if namespace.pending]
+        if num_workers <= 1 or len(busy_names) <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+            return self.run_round_robin()
+        for name in busy_names: # Örn: change_feed'in işçideki kopyası ebeveynin de yazacağı sıra numaralarını kullanır
+            unsafe = [option for option in _FORK_UNSAFE_OPTIONS if self.namespaces[name].options.get(option) is not None]
+            if unsafe: raise ValueError(f"Namespace '{name}' uses {', '.join(unsafe)}, which cannot run in a forked worker. Use run_round_robin().")
+        preload_shared_model()
+        os.makedirs(workdir, exist_ok=True)
+        assignments = [busy_names[worker::num_workers] for worker in range(min(num_workers, len(busy_names)))]
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=self._worker, args=(names, workdir), name=f"aee-namespaces-{i}") for i, names in enumerate(assignments)]
+        try:
+            for worker in workers: worker.start()
+        finally:
+            gc.unfreeze() # Dondurma yalnızca işçiler için; ebeveynin nesneleri (eski KB'ler dahil) yine toplanabilmeli
+        for worker in workers: worker.join()
+        failed = [worker.name for worker in workers if worker.exitcode != 0]
+        if failed: raise RuntimeError(f"Namespace workers failed: {', '.join(failed)}")
+        for name in busy_names:
+            namespace = self.namespaces[name]
+            kb_loaded, meta = load_checkpoint(os.path.join(workdir, f"{name}.ckpt.json.gz"))
+            namespace.kb.clear(); namespace.kb.update(kb_loaded) # Aynı dict nesnesi korunur
+            namespace.ledger = ConfidenceLedger.from_rows(meta.get("ledger", {}))
+            namespace.stats = meta.get("stats", namespace.stats); namespace.pending.clear()
+            if namespace.near_duplicate_index is not None: namespace.near_duplicate_index.add_rows(meta.get("near_duplicate_signatures", {}))
+            if namespace.document_store is not None: namespace.document_store.add_rows(meta.get("documents", {}))
+            if namespace.cycle_detector is not None: # İşçide eklenen destek bağlantıları ebeveyn dedektöründe yok
+                namespace.cycle_detector = SupportCycleDetector(namespace.cycle_detector.max_search_nodes)
+                namespace.cycle_detector.build(namespace.kb)
+            if namespace.options.get("leaderboard") is not None: namespace.options["leaderboard"].rebuild(namespace.kb)
+            if namespace.options.get("snapshot_store") is not None: namespace.options["snapshot_store"].publish(namespace.kb)
+            if namespace.options.get("stats") is not None:
+                namespace.options["stats"].clear(); namespace.options["stats"].update(meta.get("pipeline_stats") or {})
+        return total_jobs
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE Namespaces Module (Era Version)...")
+    if Proposition and aee_extractor_era.NLP_MODEL is not None:
+        pool = NamespacePool()
+        pool.submit("tenant_a", [{"source_id": "news.com", "text": "The sky is blue."}])
+        pool.submit("tenant_a", [{"source_id": "user_blog", "text": "The sky is not blue."}])
+        pool.submit("tenant_b", [{"source_id": "wiki", "text": "Water is wet."}])
+        print(f"Jobs run: {pool.run_round_robin()}")
+        for name, namespace in pool.namespaces.items(): print(f"  {name}: {len(namespace.kb)} propositions, stats {namespace.stats}")
+    else: print("Could not run tests: spaCy model or dependencies not available.")
+    print("\nNamespaces module testing complete.")
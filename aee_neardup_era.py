@@ -0,0 +1,173 @@
+# aee_neardup_era.py
+# AEE Era Sürümü: Ayrıştırmadan önce yakın-kopya (near-duplicate) girdi metinlerini tespit eder.
+# Metinlerin kelime shingle kümelerinden MinHash imzaları çıkarılır; LSH bant indeksi ile aday
+# dokümanlar bulunur ve tahmini Jaccard benzerliği eşiği geçen metin yakın-kopya sayılır.
+# Yakın-kopyalar ya atlanır ya da kaynak kimlikleri kanonik dokümanın önermelerine eklenir.
+
+import random
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, Any
+
+# Era sürümündeki sınıfları import et
+try:
+    from aee_core_classes_era import Proposition
+except ImportError:
+    print("NearDup Error: Could not import Proposition class from aee_core_classes_era.py.")
+    Proposition = None
+
+# numpy isteğe bağlıdır; varsa imzalar vektörel hesaplanır (sonuç saf Python ile aynıdır)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# --- Sabitler ---
+DEFAULT_NUM_PERM = 64 # MinHash permütasyon sayısı (imza uzunluğu)
+DEFAULT_SHINGLE_SIZE = 5 # Kelime shingle uzunluğu
+DEFAULT_SIMILARITY_THRESHOLD = 0.8 # Tahmini Jaccard benzerliği eşiği
+NEAR_DUP_SKIP = "skip"; NEAR_DUP_MERGE = "merge"
+DUPLICATE_SOURCES_KEY = "duplicate_sources" # other_metadata anahtarı
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_UINT64_MASK = (1 << 64) - 1 # numpy uint64 taşmasıyla aynı sonucu vermek için
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# --- MinHash ---
+def get_shingle_hashes(text: str, shingle_size: int = DEFAULT_SHINGLE_SIZE) -> set:
+    """ Metni küçük harfli kelimelere böler ve kelime shingle'larının 32-bit hash kümesini döndürür. """
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) < shingle_size: # Kısa metin: tek shingle
+        return {zlib.crc32(" ".join(tokens).encode("utf-8"))} if tokens else set()
+    return {zlib.crc32(" ".join(tokens[i:i + shingle_size]).encode("utf-8")) for i in range(len(tokens) - shingle_size + 1)}
+
+def choose_lsh_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """ b * r = num_perm olacak şekilde, LSH eşiği (1/b)^(1/r) verilen eşiğe en yakın (bant, satır) çiftini seçer. """
+    best = (num_perm, 1); best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows: continue
+        bands = num_perm // rows
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if error < best_error: best = (bands, rows); best_error = error
+    return best
+
+class NearDuplicateIndex:
+    """
+    MinHash imzaları için LSH indeksi. check_and_add(doc_key, text), metin daha önce eklenen
+    bir dokümana eşik üzerinde benziyorsa o dokümanın anahtarını döndürür (metin eklenmez);
+    aksi halde metni kanonik doküman olarak ekler ve None döndürür.
+    Aynı indeks birden fazla pipeline çalıştırmasında kullanılabilir (sürekli veri girişi).
+    """
+
+    def __init__(self, threshold: float = DEFAULT_SIMILARITY_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM,
+                 shingle_size: int = DEFAULT_SHINGLE_SIZE, seed: int = 1):
+        self.threshold = threshold; self.num_perm = num_perm; self.shingle_size = shingle_size
+        self.bands, self.rows = choose_lsh_bands(num_perm, threshold)
+        rng = random.Random(seed) # Deterministik permütasyonlar: imzalar çalıştırmalar arasında karşılaştırılabilir
+        self._perms = [(rng.randrange(1, _MAX_HASH), rng.randrange(0, _MAX_HASH)) for _ in range(num_perm)]
+        if np is not None:
+            self._perm_a = np.array([a for a, _ in self._perms], dtype=np.uint64).reshape(-1, 1)
+            self._perm_b = np.array([b for _, b in self._perms], dtype=np.uint64).reshape(-1, 1)
+        self._buckets: List[Dict[Tuple[int, ...], List[str]]] = [defaultdict(list) for _ in range(self.bands)]
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """ Metnin MinHash imzasını döndürür; kelime içermeyen metin için None. """
+        shingle_hashes = get_shingle_hashes(text, self.shingle_size)
+        if not shingle_hashes: return None
+        if np is not None:
+            hashes = np.fromiter(shingle_hashes, dtype=np.uint64, count=len(shingle_hashes)).reshape(1, -1)
+            permuted = ((self._perm_a * hashes + self._perm_b) % np.uint64(_MERSENNE_PRIME)) & np.uint64(_MAX_HASH)
+            return tuple(int(value) for value in permuted.min(axis=1))
+        return tuple(min((((a * h + b) & _UINT64_MASK) % _MERSENNE_PRIME) & _MAX_HASH for h in shingle_hashes) for a, b in self._perms)
+
+    @staticmethod
+    def estimate_similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+    def _band_keys(self, sig: Tuple[int, ...]):
+        for band in range(self.bands): yield band, sig[band * self.rows:(band + 1) * self.rows]
+
+    def find_duplicate(self, sig: Tuple[int, ...]) -> Optional[Tuple[str, float]]:
+        """ İmzaya eşik üzerinde en çok benzeyen kanonik dokümanı (anahtar, benzerlik) döndürür. """
+        candidates = set()
+        for band, band_key in self._band_keys(sig): candidates.update(self._buckets[band].get(band_key, ()))
+        best: Optional[Tuple[str, float]] = None
+        for doc_key in candidates:
+            similarity = self.estimate_similarity(sig, self._signatures[doc_key])
+            if similarity >= self.threshold and (best is None or similarity > best[1]): best = (doc_key, similarity)
+        return best
+
+    def add(self, doc_key: str, sig: Tuple[int, ...]):
+        """ İmzayı doc_key ile ekler; anahtar zaten varsa eski imzanın kova kayıtları önce silinir. """
+        if doc_key in self._signatures: self.remove(doc_key)
+        self._signatures[doc_key] = sig
+        for band, band_key in self._band_keys(sig): self._buckets[band][band_key].append(doc_key)
+
+    def check_and_add(self, doc_key: str, text: str) -> Optional[str]:
+        sig = self.signature(text)
+        if sig is None: return None
+        duplicate = self.find_duplicate(sig)
+        if duplicate is not None: return duplicate[0]
+        self.add(doc_key, sig)
+        return None
+
+    def remove(self, doc_key: str):
+        """ Kanonik dokümanın imzasını indeksten çıkarır (örn: önermeleri saklama politikasıyla çıkarıldığında). """
+        sig = self._signatures.pop(doc_key, None)
+        if sig is None: return
+        for band, band_key in self._band_keys(sig):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is None: continue
+            if doc_key in bucket: bucket.remove(doc_key)
+            if not bucket: del self._buckets[band][band_key]
+
+    def __contains__(self, doc_key: object) -> bool: return doc_key in self._signatures
+
+    def as_rows(self) -> Dict[str, List[int]]:
+        """ Kanonik doküman imzalarını ekleme sırasıyla {doc_key: imza} olarak döndürür (kontrol noktasına yazmak için). """
+        return {doc_key: list(sig) for doc_key, sig in self._signatures.items()}
+
+    def add_rows(self, rows: Dict[str, List[int]]):
+        """ as_rows çıktısındaki, indekste henüz olmayan imzaları sırayla ekler. """
+        for doc_key, sig in rows.items():
+            if doc_key not in self._signatures: self.add(doc_key, tuple(sig))
+
+    def __len__(self) -> int: return len(self._signatures)
+
+def attach_duplicate_sources(kb: Dict[str, Proposition], duplicate_sources_by_doc: Dict[str, List[str]]) -> int:
+    """
+    Birleştirme modu: yakın-kopya dokümanların kaynak kimliklerini, cümle referansı kanonik
+    dokümana ait olan önermelerin other_metadata["duplicate_sources"] listesine ekler.
+    Güncellenen önerme sayısını döndürür.
+    """
+    if not duplicate_sources_by_doc: return 0
+    updated_count = 0
+    for prop in kb.values():
+        extra_sources: List[str] = []
+        for doc_id, _, _ in prop.sentence_refs:
+            extra_sources.extend(duplicate_sources_by_doc.get(doc_id, ()))
+        if not extra_sources: continue
+        existing = prop.epistemic_data.other_metadata.setdefault(DUPLICATE_SOURCES_KEY, [])
+        for source_id in extra_sources:
+            if source_id not in existing and source_id != prop.epistemic_data.source_id: existing.append(source_id)
+        updated_count += 1
+    return updated_count
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE Near-Duplicate Module (Era Version)...")
+    base_text = ("The central bank raised interest rates by half a point on Tuesday, citing persistent inflation "
+                 "and a strong labour market. Analysts had expected a smaller increase. Markets fell sharply after the announcement. "
+                 "The bank said further increases were likely if price growth did not slow over the coming months, "
+                 "while the finance ministry welcomed the decision and promised to keep spending under control this year.")
+    repost = base_text.replace("a smaller increase", "a smaller rise")
+    unrelated = "Water boils at one hundred degrees Celsius at sea level. Ice melts at zero degrees."
+    index = NearDuplicateIndex()
+    print(f"LSH bands x rows: {index.bands} x {index.rows} (threshold {index.threshold})")
+    for key, text in (("wire#0", base_text), ("blog#1", repost), ("science#2", unrelated)):
+        sig = index.signature(text); match = index.find_duplicate(sig) if len(index) else None
+        print(f"  {key}: duplicate of {match[0]} (similarity {match[1]:.2f})" if match else f"  {key}: canonical")
+        if not match: index.add(key, sig)
+    print("\nNear-duplicate module testing complete.")
@@ -0,0 +1,156 @@
+# aee_retention_era.py
+# AEE Era Sürümü: Uzun süre çalışan kurulumlar için KB saklama (retention) politikaları.
+# Maksimum önerme sayısı ve maksimum yaş sınırı; düşük güvenli veya en uzun süredir
+# referans almayan önermeler önce çıkarılır. Çıkarılan önermelerin defter satırları, döngü
+# dedektörü kayıtları ve artık hiçbir önermenin başvurmadığı dokümanların metinleri/imzaları
+# da bırakılır; böylece sürekli veri girişinde bellek sabit kalır.
+
+import heapq
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Any
+
+# Era sürümündeki sınıfları import et
+try:
+    from aee_core_classes_era import Proposition
+    from aee_updater_era import refresh_source_reliabilities_era, ConfidenceLedger, RELIABILITY_MODEL_BINARY
+    from aee_corpus_era import DocumentStore
+    from aee_neardup_era import NearDuplicateIndex
+    from aee_cycles_era import SupportCycleDetector
+    from aee_events_era import emit, has_listeners, EVENT_PROP_EVICTED, EVENT_LINK_REMOVED
+except ImportError:
+    print("Retention Error: Could not import dependencies from aee_core_classes_era.py or aee_updater_era.py.")
+    Proposition = None
+
+# --- Çıkarma (Eviction) Sıraları ---
+EVICT_LOWEST_CONFIDENCE = "lowest_confidence"
+EVICT_LEAST_RECENTLY_REFERENCED = "least_recently_referenced"
+
+@dataclass
+class RetentionPolicy:
+    """KB için saklama politikası. None olan sınırlar uygulanmaz."""
+    max_propositions: Optional[int] = None # KB'de tutulacak en fazla önerme sayısı
+    max_age: Optional[timedelta] = None # EpistemicData.timestamp'e göre en fazla yaş
+    eviction_order: str = EVICT_LOWEST_CONFIDENCE # Sayı sınırı aşıldığında hangi önermeler önce çıkarılır
+
+def _eviction_sort_key(prop: Proposition, eviction_order: str):
+    ep_data = prop.epistemic_data
+    if eviction_order == EVICT_LEAST_RECENTLY_REFERENCED:
+        return (ep_data.last_referenced or ep_data.timestamp, ep_data.computed_confidence)
+    return (ep_data.computed_confidence, ep_data.timestamp)
+
+# --- Çıkarma İşlemi ---
+def evict_propositions(kb: Dict[str, Proposition], prop_ids: Set[str]) -> Set[str]:
+    """
+    Verilen önermeleri KB'den çıkarır ve diğer önermelerin supports/contradicts listelerinde
+    kalan sarkan (dangling) ID'leri temizler. Etkilenen kaynak ID'lerini döndürür.
+    Not: Bu fonksiyon KB'yi yerinde değiştirir.
+    """
+    affected_sources: Set[str] = set()
+    if not Proposition: return affected_sources
+    neighbour_ids: Set[str] = set()
+    for prop_id in prop_ids:
+        prop = kb.pop(prop_id, None)
+        if not prop: continue
+        emit(kb, EVENT_PROP_EVICTED, prop)
+        affected_sources.add(prop.epistemic_data.source_id)
+        # Linker bağlantıları çift yönlü ekler; komşular bu iki listeden bulunur
+        neighbour_ids.update(prop.epistemic_data.supports); neighbour_ids.update(prop.epistemic_data.contradicts)
+    for neighbour_id in neighbour_ids:
+        neighbour = kb.get(neighbour_id)
+        if not neighbour: continue
+        ep_data = neighbour.epistemic_data
+        removed_links = [(pid, kind) for kind, link_ids in (("supports", ep_data.supports), ("contradicts", ep_data.contradicts))
+                         for pid in link_ids if pid in prop_ids] if has_listeners(kb) else []
+        ep_data.supports[:] = [pid for pid in ep_data.supports if pid not in prop_ids]
+        ep_data.contradicts[:] = [pid for pid in ep_data.contradicts if pid not in prop_ids]
+        for linked_id, kind in removed_links: emit(kb, EVENT_LINK_REMOVED, neighbour, linked_id=linked_id, kind=kind)
+        affected_sources.add(ep_data.source_id)
+    return affected_sources
+
+def release_evicted_state(kb: Dict[str, Proposition], evicted_ids: Set[str], evicted_doc_ids: Set[str],
+                          ledger: Optional[ConfidenceLedger] = None, document_store: Optional[DocumentStore] = None,
+                          near_duplicate_index: Optional[NearDuplicateIndex] = None,
+                          cycle_detector: Optional[SupportCycleDetector] = None) -> int:
+    """
+    Çıkarılan önermelere ait yan durumları bırakır: defter satırları silinir, döngü dedektörü kalan KB'den
+    yeniden kurulur. evicted_doc_ids içinden KB'de artık hiçbir önermenin başvurmadığı dokümanlar
+    document_store'dan ve near_duplicate_index'ten çıkarılır (depo başka KB'lerle paylaşılıyor olabilir;
+    bu yüzden yalnızca çıkarılan önermelerin dokümanlarına bakılır). Bırakılan doküman sayısını döndürür.
+    """
+    if ledger is not None:
+        for prop_id in evicted_ids: ledger.remove(prop_id)
+    if cycle_detector is not None: cycle_detector.prune(kb)
+    if not evicted_doc_ids or (document_store is None and near_duplicate_index is None): return 0
+    referenced_doc_ids = {doc_id for prop in kb.values() for doc_id, _, _ in prop.sentence_refs}
+    released_doc_ids = evicted_doc_ids - referenced_doc_ids
+    for doc_id in released_doc_ids:
+        if document_store is not None: document_store.remove(doc_id)
+        if near_duplicate_index is not None: near_duplicate_index.remove(doc_id)
+    return len(released_doc_ids)
+
+# --- Ana Saklama Fonksiyonu ---
+def apply_retention_policy(kb: Dict[str, Proposition], policy: RetentionPolicy, now: Optional[datetime] = None,
+                           reliability_model: str = RELIABILITY_MODEL_BINARY, ledger: Optional[ConfidenceLedger] = None,
+                           document_store: Optional[DocumentStore] = None,
+                           near_duplicate_index: Optional[NearDuplicateIndex] = None,
+                           cycle_detector: Optional[SupportCycleDetector] = None) -> Dict[str, Any]:
+    """
+    Saklama politikasını KB'ye uygular: önce yaş sınırını aşan önermeler, ardından sayı sınırını
+    aşan kısım eviction_order'a göre çıkarılır. Etkilenen kaynakların güvenilirlik skorları
+    pipeline'ın reliability_model'i ile yeniden hesaplanır. ledger / document_store / near_duplicate_index /
+    cycle_detector verilirse çıkarılanlara ait kayıtlar da bırakılır (bkz. release_evicted_state).
+    Güvene göre sıralama computed_confidence kullandığından güncelleme adımından sonra çağrılmalıdır.
+    Çıkarma sayılarını içeren bir özet döndürür.
+    """
+    report: Dict[str, Any] = {"evicted_by_age": 0, "evicted_by_count": 0, "affected_sources": set(), "released_documents": 0}
+    if not Proposition or not kb or not policy: return report
+    now = now or datetime.now()
+    to_evict: Set[str] = set()
+
+    if policy.max_age is not None:
+        cutoff = now - policy.max_age
+        to_evict.update(prop_id for prop_id, prop in kb.items() if prop.epistemic_data.timestamp < cutoff)
+        report["evicted_by_age"] = len(to_evict)
+
+    if policy.max_propositions is not None:
+        overflow = len(kb) - len(to_evict) - policy.max_propositions
+        if overflow > 0:
+            remaining = (prop for prop_id, prop in kb.items() if prop_id not in to_evict)
+            victims = heapq.nsmallest(overflow, remaining, key=lambda p: _eviction_sort_key(p, policy.eviction_order))
+            to_evict.update(prop.prop_id for prop in victims)
+            report["evicted_by_count"] = len(victims)
+
+    if to_evict:
+        evicted_doc_ids = {doc_id for prop_id in to_evict for doc_id, _, _ in kb[prop_id].sentence_refs}
+        affected_sources = evict_propositions(kb, to_evict)
+        refresh_source_reliabilities_era(kb, affected_sources, reliability_model=reliability_model)
+        report["affected_sources"] = affected_sources
+        report["released_documents"] = release_evicted_state(kb, to_evict, evicted_doc_ids, ledger, document_store,
+                                                             near_duplicate_index, cycle_detector)
+    print(f"  Retention: Evicted {len(to_evict)} propositions "
+          f"(age: {report['evicted_by_age']}, count: {report['evicted_by_count']}). KB size: {len(kb)}")
+    return report
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE Retention Module (Era Version)...")
+    if Proposition:
+        from aee_core_classes_era import EpistemicData
+        kb_test: Dict[str, Proposition] = {}
+        base_time = datetime(2024, 1, 1)
+        for i in range(10):
+            ed = EpistemicData(source_id=f"src{i % 3}", initial_confidence=0.1 * (i + 1), timestamp=base_time + timedelta(days=i))
+            prop = Proposition(f"claim {i}", f"claim {i}", ed, subject_lemma="x", relation_lemma="be", value_lemma=f"v{i}")
+            kb_test[prop.prop_id] = prop
+        ids = list(kb_test.keys())
+        kb_test[ids[0]].epistemic_data.supports.append(ids[5]); kb_test[ids[5]].epistemic_data.supports.append(ids[0])
+        kb_test[ids[1]].epistemic_data.contradicts.append(ids[6]); kb_test[ids[6]].epistemic_data.contradicts.append(ids[1])
+
+        policy = RetentionPolicy(max_propositions=6, max_age=timedelta(days=8))
+        report = apply_retention_policy(kb_test, policy, now=base_time + timedelta(days=9))
+        print(f"Report: {report}")
+        for prop in kb_test.values():
+            print(f"  {prop} | Supports: {len(prop.epistemic_data.supports)} | Contradicts: {len(prop.epistemic_data.contradicts)}")
+    else: print("Could not run tests due to import error.")
+    print("\nRetention module testing complete.")
@@ -0,0 +1,175 @@
+# aee_snapshot_era.py
+# AEE Era Sürümü: Güncellemeler sırasında okuyucular için değişmez (immutable) KB anlık görüntüleri.
+# Yazıcı (pipeline/updater) canlı KB üzerinde çalışır; okuyucular yayınlanmış son sürümü okur.
+# Yeni sürüm, değişmeyen satırları önceki sürümle paylaşarak (copy-on-write) oluşturulur ve
+# tek bir referans atamasıyla atomik olarak yayınlanır.
+
+import operator
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Any, Mapping
+
+# Era sürümündeki sınıfları import et
+try:
+    from aee_core_classes_era import Proposition
+except ImportError:
+    print("Snapshot Error: Could not import Proposition class from aee_core_classes_era.py.")
+    Proposition = None
+
+@dataclass(frozen=True)
+class EpistemicView:
+    """EpistemicData'nın değişmez kopyası (listeler tuple olarak tutulur)."""
+    source_id: str
+    timestamp: datetime
+    initial_confidence: float
+    computed_confidence: float
+    source_type: Optional[str]
+    reliability_score: Optional[float]
+    supports: Tuple[str, ...]
+    contradicts: Tuple[str, ...]
+    bias_flags: Tuple[str, ...]
+    plausibility_score: Optional[float]
+    validation_notes: Tuple[str, ...]
+    occurrence_count: int
+    last_referenced: Optional[datetime]
+    other_metadata: Mapping[str, Any]
+
+@dataclass(frozen=True)
+class PropositionView:
+    """Proposition'ın değişmez görünümü. Metin alanları kopyalanmaz, aynı str nesneleri paylaşılır."""
+    text_span: str
+    sentence_text: str
+    epistemic_data: EpistemicView
+    prop_id: str
+    subject_lemma: Optional[str]
+    relation_lemma: Optional[str]
+    value_lemma: Optional[str]
+    is_negated: bool
+    sentence_refs: Tuple[Tuple[str, int, int], ...]
+
+    def __str__(self):
+        return Proposition.__str__(self) if Proposition else self.prop_id
+
+def _make_epistemic_view(prop: Proposition) -> EpistemicView:
+    ep_data = prop.epistemic_data
+    return EpistemicView(
+        source_id=ep_data.source_id, timestamp=ep_data.timestamp,
+        initial_confidence=ep_data.initial_confidence, computed_confidence=ep_data.computed_confidence,
+        source_type=ep_data.source_type, reliability_score=ep_data.reliability_score,
+        supports=tuple(ep_data.supports), contradicts=tuple(ep_data.contradicts), bias_flags=tuple(ep_data.bias_flags),
+        plausibility_score=ep_data.plausibility_score, validation_notes=tuple(ep_data.validation_notes),
+        occurrence_count=ep_data.occurrence_count, last_referenced=ep_data.last_referenced,
+        other_metadata=MappingProxyType(dict(ep_data.other_metadata)))
+
+def _same_items(view_items: Tuple[Any, ...], live_items: Iterable[Any]) -> bool:
+    """ Görünümdeki tuple ile canlı listeyi kopya oluşturmadan eleman eleman karşılaştırır. """
+    return len(view_items) == len(live_items) and all(map(operator.eq, view_items, live_items))
+
+def _is_unchanged(prop: Proposition, previous: PropositionView) -> bool:
+    """ Canlı önerme önceki görünümle aynı mı? Yeni nesne ayırmadan alan alan karşılaştırır. """
+    ep_data = prop.epistemic_data; ep_view = previous.epistemic_data
+    return (ep_view.computed_confidence == ep_data.computed_confidence and ep_view.reliability_score == ep_data.reliability_score
+            and ep_view.occurrence_count == ep_data.occurrence_count and ep_view.last_referenced == ep_data.last_referenced
+            and ep_view.initial_confidence == ep_data.initial_confidence and ep_view.plausibility_score == ep_data.plausibility_score
+            and ep_view.source_id == ep_data.source_id and ep_view.timestamp == ep_data.timestamp
+            and ep_view.source_type == ep_data.source_type
+            and _same_items(ep_view.supports, ep_data.supports) and _same_items(ep_view.contradicts, ep_data.contradicts)
+            and _same_items(ep_view.bias_flags, ep_data.bias_flags) and _same_items(ep_view.validation_notes, ep_data.validation_notes)
+            and ep_view.other_metadata == ep_data.other_metadata
+            and previous.text_span == prop.text_span and previous.sentence_text == prop.sentence_text
+            and previous.subject_lemma == prop.subject_lemma and previous.relation_lemma == prop.relation_lemma
+            and previous.value_lemma == prop.value_lemma and previous.is_negated == prop.is_negated
+            and _same_items(previous.sentence_refs, prop.sentence_refs))
+
+def make_proposition_view(prop: Proposition, previous: Optional[PropositionView] = None) -> PropositionView:
+    """
+    Önermenin değişmez görünümünü oluşturur. previous verilir ve hiçbir alan değişmemişse
+    aynı görünüm nesnesi yeniden kullanılır (yapısal paylaşım); karşılaştırma canlı alanlar
+    üzerinde yapıldığından değişmeyen satırlar için hiçbir kopya oluşturulmaz.
+    """
+    if previous is not None and _is_unchanged(prop, previous): return previous
+    return PropositionView(
+        text_span=prop.text_span, sentence_text=prop.sentence_text, epistemic_data=_make_epistemic_view(prop), prop_id=prop.prop_id,
+        subject_lemma=prop.subject_lemma, relation_lemma=prop.relation_lemma, value_lemma=prop.value_lemma,
+        is_negated=prop.is_negated, sentence_refs=tuple(prop.sentence_refs))
+
+class KBSnapshot:
+    """
+    KB'nin belirli bir sürümünün salt okunur görünümü. Explainer ve utils fonksiyonlarının
+    kullandığı dict okuma arayüzünü (get, items, values, keys, in, [], len) sunar.
+    """
+
+    def __init__(self, rows: Dict[str, PropositionView], version: int):
+        self._rows = rows
+        self.version = version
+        self.created_at = datetime.now()
+        self.propositions: Mapping[str, PropositionView] = MappingProxyType(rows)
+
+    def __getitem__(self, prop_id: str) -> PropositionView: return self._rows[prop_id]
+    def __contains__(self, prop_id: object) -> bool: return prop_id in self._rows
+    def __iter__(self) -> Iterator[str]: return iter(self._rows)
+    def __len__(self) -> int: return len(self._rows)
+    def get(self, prop_id: str, default: Optional[PropositionView] = None) -> Optional[PropositionView]: return self._rows.get(prop_id, default)
+    def keys(self): return self.propositions.keys()
+    def values(self): return self.propositions.values()
+    def items(self): return self.propositions.items()
+
+class SnapshotStore:
+    """
+    Yayınlanmış KB sürümlerini tutar. Okuyucular `current` ile o anki sürümü alır ve bir istek
+    boyunca onu kullanır; yazıcılar canlı KB'yi güncelledikten sonra publish() çağırır.
+    """
+
+    def __init__(self):
+        self._current = KBSnapshot({}, version=0)
+        self._publish_lock = threading.Lock() # Aynı anda tek yayıncı
+
+    @property
+    def current(self) -> KBSnapshot:
+        return self._current
+
+    def publish(self, kb: Dict[str, Proposition], changed_ids: Optional[Iterable[str]] = None) -> KBSnapshot:
+        """
+        Canlı KB'den yeni bir sürüm oluşturur ve atomik olarak yayınlar.
+        changed_ids verilirse yalnızca bu önermeler yeniden oluşturulur (KB'de olmayanlar silinir),
+        diğer satırlar önceki sürümden olduğu gibi paylaşılır.
+        """
+        with self._publish_lock:
+            previous = self._current
+            if changed_ids is None:
+                previous_rows = previous._rows
+                rows = {prop_id: make_proposition_view(prop, previous_rows.get(prop_id)) for prop_id, prop in kb.items()}
+            else:
+                rows = dict(previous._rows)
+                for prop_id in changed_ids:
+                    prop = kb.get(prop_id)
+                    if prop is None: rows.pop(prop_id, None)
+                    else: rows[prop_id] = make_proposition_view(prop, rows.get(prop_id))
+            snapshot = KBSnapshot(rows, version=previous.version + 1)
+            self._current = snapshot # Atomik referans değişimi: okuyucular ya eski ya yeni sürümü görür
+        return snapshot
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE Snapshot Module (Era Version)...")
+    if Proposition:
+        from aee_core_classes_era import EpistemicData
+        kb_test: Dict[str, Proposition] = {}
+        for val, conf in (("blue", 0.8), ("green", 0.3)):
+            ed = EpistemicData(source_id="news.com", initial_confidence=conf)
+            prop = Proposition(f"sky is {val}", f"The sky is {val}.", ed, subject_lemma="sky", relation_lemma="be", value_lemma=val)
+            kb_test[prop.prop_id] = prop
+        store = SnapshotStore()
+        snap_v1 = store.publish(kb_test)
+        # Yazıcı canlı KB'yi güncellerken okuyucu v1'i görmeye devam eder
+        first_id, second_id = list(kb_test.keys())
+        kb_test[first_id].epistemic_data.computed_confidence = 0.42
+        kb_test[first_id].epistemic_data.bias_flags.append("SOURCE_MONOCULTURE")
+        print(f"Reader (v{snap_v1.version}) during update: {snap_v1[first_id]} | Flags: {snap_v1[first_id].epistemic_data.bias_flags}")
+        snap_v2 = store.publish(kb_test, changed_ids=[first_id])
+        print(f"Reader (v{store.current.version}) after publish: {snap_v2[first_id]} | Flags: {snap_v2[first_id].epistemic_data.bias_flags}")
+        print(f"Unchanged row shared between versions: {snap_v1[second_id] is snap_v2[second_id]}")
+    else: print("Could not run tests due to import error.")
+    print("\nSnapshot module testing complete.")
@@ -0,0 +1,163 @@
+# aee_stages_era.py
+# AEE Era Sürümü: Sınırlı kuyruklarla birbirine bağlanan işlem hattı aşamaları (pipelining).
+# Her aşama ayrı bir iş parçacığında (thread) çalışır ve girdisini bir önceki aşamanın sınırlı
+# kuyruğundan alır; kuyruk dolduğunda üretici bekler (backpressure), böylece bekleyen iş miktarı
+# ve bellek sınırlı kalır. Son aşama (sink) çağıran iş parçacığında çalışır.
+# Her aşama tek iş parçacığıyla çalıştığı için öğe sırası korunur (linkleme sonucu seri mod ile aynıdır).
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# --- Sabitler ---
+DEFAULT_STAGE_QUEUE_SIZE = 64 # Aşamalar arası kuyruk kapasitesi (öğe)
+_QUEUE_POLL_SECONDS = 0.1 # Durdurma sinyalini kontrol etmek için bekleme aralığı
+_STAGE_DONE = object() # Akış sonu işareti
+
+class StageMetrics:
+    """Bir aşamanın sayaçları: işlenen öğeler, meşgul süre, girdi/çıktı bekleme süreleri, çıktı kuyruğu derinliği."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items_in = 0; self.items_out = 0
+        self.busy_seconds = 0.0
+        self.wait_input_seconds = 0.0 # Girdi kuyruğu boşken bekleme (açlık)
+        self.wait_output_seconds = 0.0 # Çıktı kuyruğu doluyken bekleme (backpressure)
+        self.max_queue_depth = 0; self._depth_total = 0; self._depth_samples = 0
+
+    def sample_depth(self, depth: int):
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+        self._depth_total += depth; self._depth_samples += 1
+
+    def report(self, wall_seconds: float) -> Dict[str, Any]:
+        return {"items_in": self.items_in, "items_out": self.items_out, "busy_seconds": self.busy_seconds,
+                "utilization": self.busy_seconds / wall_seconds if wall_seconds > 0 else 0.0,
+                "wait_input_seconds": self.wait_input_seconds, "wait_output_seconds": self.wait_output_seconds,
+                "max_queue_depth": self.max_queue_depth,
+                "mean_queue_depth": self._depth_total / self._depth_samples if self._depth_samples else 0.0}
+
+def _put(out_queue: queue.Queue, item: Any, metrics: StageMetrics, stop_event: threading.Event) -> bool:
+    """ Öğeyi kuyruğa koyar; kuyruk doluysa bekler. Durdurma istenirse False döndürür. """
+    metrics.sample_depth(out_queue.qsize())
+    wait_start = time.perf_counter()
+    while not stop_event.is_set():
+        try:
+            out_queue.put(item, timeout=_QUEUE_POLL_SECONDS)
+            metrics.wait_output_seconds += time.perf_counter() - wait_start
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _get(in_queue: queue.Queue, metrics: StageMetrics, stop_event: threading.Event) -> Any:
+    """ Kuyruktan öğe alır; durdurma istenirse akış sonu işaretini döndürür. """
+    wait_start = time.perf_counter()
+    while not stop_event.is_set():
+        try:
+            item = in_queue.get(timeout=_QUEUE_POLL_SECONDS)
+            metrics.wait_input_seconds += time.perf_counter() - wait_start
+            return item
+        except queue.Empty:
+            continue
+    return _STAGE_DONE
+
+def _run_stage(stage_fn: Callable[[Any], Iterable[Any]], inputs: Iterable[Any], out_queue: queue.Queue,
+               metrics: StageMetrics, stop_event: threading.Event, errors: List[BaseException]):
+    """ Aşama iş parçacığı: her girdi için stage_fn'in ürettiği çıktıları sıradaki kuyruğa aktarır. """
+    try:
+        input_iter = iter(inputs)
+        while not stop_event.is_set():
+            busy_start = time.perf_counter()
+            try:
+                item = next(input_iter)
+            except StopIteration:
+                break
+            metrics.items_in += 1
+            outputs = iter(stage_fn(item))
+            while True:
+                try:
+                    output = next(outputs) # Üretici fonksiyonlarda iş burada yapılır
+                except StopIteration:
+                    break
+                metrics.busy_seconds += time.perf_counter() - busy_start
+                if not _put(out_queue, output, metrics, stop_event): return
+                metrics.items_out += 1
+                busy_start = time.perf_counter()
+            metrics.busy_seconds += time.perf_counter() - busy_start
+    except BaseException as e:
+        errors.append(e); stop_event.set()
+    finally:
+        # Akış sonu işareti her durumda iletilir (alt aşama sonsuza kadar beklemesin)
+        while True:
+            try:
+                out_queue.put(_STAGE_DONE, timeout=_QUEUE_POLL_SECONDS); break
+            except queue.Full:
+                if stop_event.is_set(): break
+
+def _queue_iter(in_queue: queue.Queue, metrics: StageMetrics, stop_event: threading.Event):
+    while True:
+        item = _get(in_queue, metrics, stop_event)
+        if item is _STAGE_DONE: return
+        yield item
+
+def run_staged_pipeline(source: Iterable[Any], stages: List[Tuple[str, Callable[[Any], Iterable[Any]]]],
+                        sink: Callable[[Any], None], sink_name: str = "sink",
+                        queue_size: int = DEFAULT_STAGE_QUEUE_SIZE) -> Dict[str, Any]:
+    """
+    source -> stages[0] -> kuyruk -> stages[1] -> kuyruk -> ... -> sink zincirini çalıştırır.
+    Her aşama fonksiyonu bir girdi öğesi alır ve sıfır veya daha fazla çıktı üretir (üretici olabilir).
+    İlk aşama source'u kendi iş parçacığında tüketir; sink çağıran iş parçacığında çalışır.
+    Herhangi bir aşamadaki hata tüm aşamaları durdurur ve çağırana yeniden yükseltilir.
+    Aşama başına sayaçları ve duvar saati süresini içeren rapor döndürür.
+    """
+    stop_event = threading.Event(); errors: List[BaseException] = []
+    metrics = [StageMetrics(name) for name, _ in stages]
+    queues = [queue.Queue(maxsize=max(1, queue_size)) for _ in stages]
+    threads: List[threading.Thread] = []
+    wall_start = time.perf_counter()
+    for position, (name, stage_fn) in enumerate(stages):
+        inputs = source if position == 0 else _queue_iter(queues[position - 1], metrics[position], stop_event)
+        thread = threading.Thread(target=_run_stage, name=f"aee-stage-{name}", daemon=True,
+                                  args=(stage_fn, inputs, queues[position], metrics[position], stop_event, errors))
+        threads.append(thread); thread.start()
+
+    sink_metrics = StageMetrics(sink_name)
+    try:
+        for item in _queue_iter(queues[-1], sink_metrics, stop_event):
+            busy_start = time.perf_counter()
+            sink_metrics.items_in += 1
+            sink(item)
+            sink_metrics.busy_seconds += time.perf_counter() - busy_start
+    except BaseException as e:
+        errors.append(e); stop_event.set()
+    finally:
+        for thread in threads: thread.join()
+    if errors: raise errors[0]
+
+    wall_seconds = time.perf_counter() - wall_start
+    report: Dict[str, Any] = {"wall_seconds": wall_seconds, "queue_size": queue_size, "stages": {}}
+    for stage_metrics in metrics + [sink_metrics]:
+        report["stages"][stage_metrics.name] = stage_metrics.report(wall_seconds)
+    return report
+
+def format_stage_report(report: Dict[str, Any]) -> str:
+    """ Aşama raporunu tek satırlık özet olarak biçimlendirir. """
+    parts = [f"{name}: util {stage['utilization']:.0%}, max out-queue {stage['max_queue_depth']}, blocked {stage['wait_output_seconds']:.2f}s"
+             for name, stage in report["stages"].items()]
+    return f"Stages ({report['wall_seconds']:.2f}s wall) -> " + " | ".join(parts)
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE Stages Module (Era Version)...")
+    def slow_parse(number: int):
+        time.sleep(0.002); yield number
+    def expand(number: int):
+        return [number * 10, number * 10 + 1]
+    collected: List[int] = []
+    def slow_sink(value: int):
+        time.sleep(0.001); collected.append(value)
+    stage_report = run_staged_pipeline(range(100), [("parse", slow_parse), ("extract", expand)], slow_sink, sink_name="link", queue_size=8)
+    print(f"Order preserved: {collected == [v for n in range(100) for v in (n * 10, n * 10 + 1)]} ({len(collected)} items)")
+    print(format_stage_report(stage_report))
+    print("\nStages module testing complete.")
@@ -0,0 +1,194 @@
+# aee_sweep_era.py
+# AEE Era Sürümü: Updater sabitleri için vektörel parametre taraması (parameter sweep).
+# Sabit bir bağlantı grafı (linkler, bias bayrakları, kaynak güvenilirlikleri) üzerinde
+# update_proposition_confidence_era'nın güven formülü, bir ayar listesinin tamamı için tek
+# geçişte hesaplanır: sonuç (ayar x önerme) güven matrisidir. Yeniden çıkarım/linkleme yapılmaz.
+#
+# Güncelleme KB sırasıyla yerinde (Gauss-Seidel) yapıldığından bir önerme, kendinden önceki
+# komşularının yeni, sonraki komşularının eski güvenini okur. Önermeler bu bağımlılığa göre
+# dalgalara (level) ayrılır; aynı dalgadaki tüm önermeler ve tüm ayarlar tek numpy işlemiyle
+# hesaplanır. numpy yoksa aynı formül saf Python ile ayar ayar hesaplanır.
+
+import itertools
+import math
+from typing import Dict, List, Sequence, Tuple, Any
+
+# Era sürümündeki modülleri import et
+try:
+    from aee_core_classes_era import Proposition
+    import aee_updater_era
+    from aee_updater_era import calculate_source_reliability_era, MIN_CONFIDENCE, MAX_CONFIDENCE
+except ImportError:
+    print("Sweep Error: Could not import dependencies from aee_core_classes_era.py or aee_updater_era.py.")
+    Proposition = None
+
+# numpy isteğe bağlıdır; yoksa aynı formül saf Python ile hesaplanır
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# --- Sabitler ---
+# Taranabilen aee_updater_era sabitleri; ayarda verilmeyen değer modüldeki güncel değerden alınır
+SWEEP_PARAMETERS = ("SUPPORT_WEIGHT", "CONTRADICTION_WEIGHT", "RELIABILITY_DAMPENING_FACTOR", "BIAS_PENALTY_MULTIPLIER",
+                    "CIRCULAR_SUPPORT_PENALTY_MULTIPLIER", "PLAUSIBILITY_WEIGHT_FACTOR", "OCCURRENCE_WEIGHT")
+SWEEP_BASELINE_INITIAL = "initial" # Henüz güncellenmemiş komşular initial_confidence ile okunur (sıfırdan tek pipeline çalıştırması)
+SWEEP_BASELINE_CURRENT = "current" # Mevcut computed_confidence ile okunur (bu KB üzerinde run_updates_era'yı yeniden çalıştırmak)
+_CIRCULAR_FLAG = "CIRCULAR_SUPPORT"
+
+def parameter_grid(**axes: Sequence[float]) -> List[Dict[str, float]]:
+    """ Eksenlerin kartezyen çarpımı: parameter_grid(SUPPORT_WEIGHT=[0.05, 0.1], CONTRADICTION_WEIGHT=[0.3, 0.4]) -> 4 ayar. """
+    unknown = [name for name in axes if name not in SWEEP_PARAMETERS]
+    if unknown: raise ValueError(f"Unknown sweep parameters: {', '.join(unknown)}")
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(axes[name] for name in names))]
+
+def _resolve_settings(settings: Sequence[Dict[str, float]]) -> List[Dict[str, float]]:
+    resolved: List[Dict[str, float]] = []
+    for setting in settings:
+        unknown = [name for name in setting if name not in SWEEP_PARAMETERS]
+        if unknown: raise ValueError(f"Unknown sweep parameters: {', '.join(unknown)}")
+        resolved.append({name: float(setting.get(name, getattr(aee_updater_era, name))) for name in SWEEP_PARAMETERS})
+    return resolved
+
+def _collect_graph(kb: Dict[str, Proposition], baseline: str) -> Dict[str, Any]:
+    """ Güncellemenin okuduğu, ayarlardan bağımsız önerme özelliklerini ve bağlantı kenarlarını çıkarır. """
+    prop_ids = list(kb); position = {prop_id: index for index, prop_id in enumerate(prop_ids)}
+    reliability_cache: Dict[str, float] = {}
+    graph: Dict[str, Any] = {"prop_ids": prop_ids, "initial": [], "reliability": [], "occurrence": [], "circular": [],
+                             "biased": [], "plausibility": [], "baseline": [], "supports": [], "contradicts": []}
+    for index, prop in enumerate(kb.values()):
+        ep_data = prop.epistemic_data; reliability = ep_data.reliability_score
+        if reliability is None: # Güvenilirlik henüz yazılmamışsa updater'ın ikili modeliyle hesaplanır
+            if ep_data.source_id not in reliability_cache:
+                reliability_cache[ep_data.source_id] = calculate_source_reliability_era(ep_data.source_id, kb)
+            reliability = reliability_cache[ep_data.source_id]
+        graph["initial"].append(ep_data.initial_confidence); graph["reliability"].append(reliability)
+        graph["occurrence"].append(getattr(ep_data, 'occurrence_count', 1))
+        graph["circular"].append(_CIRCULAR_FLAG in ep_data.bias_flags)
+        graph["biased"].append(any(flag != _CIRCULAR_FLAG for flag in ep_data.bias_flags))
+        graph["plausibility"].append(ep_data.plausibility_score)
+        graph["baseline"].append(ep_data.initial_confidence if baseline == SWEEP_BASELINE_INITIAL else ep_data.computed_confidence)
+        for kind in ("supports", "contradicts"): # KB'de olmayan bağlantılar updater'daki gibi atlanır
+            graph[kind].append([position[linked_id] for linked_id in getattr(ep_data, kind) if linked_id in position])
+    return graph
+
+def _sweep_python(graph: Dict[str, Any], settings: List[Dict[str, float]]) -> List[List[float]]:
+    """ Saf Python: her ayar için update_proposition_confidence_era'nın KB sırasıyla seri uygulanması. """
+    matrix: List[List[float]] = []
+    for setting in settings:
+        confidences = list(graph["baseline"]); dampening = setting["RELIABILITY_DAMPENING_FACTOR"]
+        for index, initial in enumerate(graph["initial"]):
+            current = initial * (1 - dampening) + (initial * graph["reliability"][index]) * dampening
+            if graph["occurrence"][index] > 1:
+                current += min(1.0, setting["OCCURRENCE_WEIGHT"] * math.log(graph["occurrence"][index])) * (1 - current)
+            current += sum(setting["SUPPORT_WEIGHT"] * confidences[j] * (1 - current) for j in graph["supports"][index])
+            current -= sum(setting["CONTRADICTION_WEIGHT"] * confidences[j] * current for j in graph["contradicts"][index])
+            if graph["circular"][index]: current *= setting["CIRCULAR_SUPPORT_PENALTY_MULTIPLIER"]
+            if graph["biased"][index]: current *= setting["BIAS_PENALTY_MULTIPLIER"]
+            plausibility = graph["plausibility"][index]
+            if plausibility is not None:
+                current *= plausibility * setting["PLAUSIBILITY_WEIGHT_FACTOR"] + (1 - setting["PLAUSIBILITY_WEIGHT_FACTOR"])
+            confidences[index] = max(MIN_CONFIDENCE, min(MAX_CONFIDENCE, current))
+        matrix.append(confidences)
+    return matrix
+
+def _compute_update_levels(graph: Dict[str, Any]) -> List[int]:
+    """
+    Dalga numaraları: bir önerme, kendinden önce gelen (yeni değeri okunan) komşularının en
+    büyük dalgasından bir sonraki dalgadadır. Aynı dalgadaki önermeler birbirini okumaz.
+    """
+    levels: List[int] = []
+    for index in range(len(graph["initial"])):
+        earlier = [levels[j] for kind in ("supports", "contradicts") for j in graph[kind][index] if j < index]
+        levels.append(max(earlier) + 1 if earlier else 0)
+    return levels
+
+def _sweep_numpy(graph: Dict[str, Any], settings: List[Dict[str, float]]) -> "np.ndarray":
+    num_props = len(graph["initial"])
+    param = {name: np.array([setting[name] for setting in settings]).reshape(-1, 1) for name in SWEEP_PARAMETERS}
+    initial = np.array(graph["initial"], dtype=float); reliability = np.array(graph["reliability"], dtype=float)
+    occurrence = np.array(graph["occurrence"], dtype=float); baseline = np.array(graph["baseline"], dtype=float)
+    circular = np.array(graph["circular"], dtype=bool); biased = np.array(graph["biased"], dtype=bool)
+    plausibility = np.array([np.nan if p is None else p for p in graph["plausibility"]], dtype=float)
+    levels = np.array(_compute_update_levels(graph), dtype=np.int64)
+
+    # Önermeler dalgalarına göre gruplanır; local: önermenin kendi dalgasındaki sırası
+    num_levels = int(levels.max()) + 1 if num_props else 0
+    prop_order = np.argsort(levels, kind="stable"); level_bounds = np.searchsorted(levels[prop_order], np.arange(num_levels + 1))
+    local = np.empty(num_props, dtype=np.int64); local[prop_order] = np.arange(num_props) - level_bounds[levels[prop_order]]
+
+    # Kenarlar: sonraki komşuların (eski değer) katkısı ayardan bağımsızdır ve bir kez toplanır;
+    # önceki komşulara giden kenarlar kaynak önermenin dalgasına göre gruplanır
+    edges: Dict[str, Tuple[Any, Any, Any]] = {}; later_sums: Dict[str, Any] = {}
+    for kind in ("supports", "contradicts"):
+        src = np.array([i for i, linked in enumerate(graph[kind]) for _ in linked], dtype=np.int64)
+        dst = np.array([j for linked in graph[kind] for j in linked], dtype=np.int64)
+        earlier = dst < src
+        later_sums[kind] = np.bincount(src[~earlier], weights=baseline[dst[~earlier]], minlength=num_props)
+        src, dst = src[earlier], dst[earlier]; edge_order = np.argsort(levels[src], kind="stable")
+        src, dst = src[edge_order], dst[edge_order]
+        edges[kind] = (src, dst, np.searchsorted(levels[src], np.arange(num_levels + 1)))
+
+    matrix = np.empty((len(settings), num_props))
+    for level in range(num_levels):
+        idx = prop_order[level_bounds[level]:level_bounds[level + 1]]
+        current = initial[idx] * (1 - param["RELIABILITY_DAMPENING_FACTOR"]) + (initial[idx] * reliability[idx]) * param["RELIABILITY_DAMPENING_FACTOR"]
+        repeated = occurrence[idx] > 1
+        if repeated.any():
+            effect = np.minimum(1.0, param["OCCURRENCE_WEIGHT"] * np.log(np.where(repeated, occurrence[idx], 1.0)))
+            current = current + np.where(repeated, effect * (1 - current), 0.0)
+        neighbour_sums = {}
+        for kind in ("supports", "contradicts"):
+            src, dst, edge_bounds = edges[kind]; start, end = edge_bounds[level], edge_bounds[level + 1]
+            sums = np.tile(later_sums[kind][idx], (len(settings), 1))
+            if end > start: np.add.at(sums, (slice(None), local[src[start:end]]), matrix[:, dst[start:end]])
+            neighbour_sums[kind] = sums
+        current = current + param["SUPPORT_WEIGHT"] * neighbour_sums["supports"] * (1 - current)
+        current = current - param["CONTRADICTION_WEIGHT"] * neighbour_sums["contradicts"] * current
+        current = np.where(circular[idx], current * param["CIRCULAR_SUPPORT_PENALTY_MULTIPLIER"], current)
+        current = np.where(biased[idx], current * param["BIAS_PENALTY_MULTIPLIER"], current)
+        has_plausibility = ~np.isnan(plausibility[idx])
+        multiplier = np.nan_to_num(plausibility[idx]) * param["PLAUSIBILITY_WEIGHT_FACTOR"] + (1 - param["PLAUSIBILITY_WEIGHT_FACTOR"])
+        current = np.where(has_plausibility, current * multiplier, current)
+        matrix[:, idx] = np.clip(current, MIN_CONFIDENCE, MAX_CONFIDENCE)
+    return matrix
+
+def sweep_confidences(kb: Dict[str, Proposition], settings: Sequence[Dict[str, float]],
+                      baseline: str = SWEEP_BASELINE_INITIAL) -> Tuple[List[str], Any]:
+    """
+    Era Sürümü: Her ayar için güncelleme adımının vereceği computed_confidence değerlerini hesaplar.
+    settings: {SABİT_ADI: değer} sözlükleri (bkz. SWEEP_PARAMETERS, parameter_grid); eksik sabitler
+    aee_updater_era'daki değerden alınır. KB linklenmiş ve güncellenmiş olmalıdır (bağlantılar, bias
+    bayrakları ve reliability_score sabit kabul edilir; KB değiştirilmez).
+    baseline: "initial" (varsayılan) sıfırdan yapılan tek pipeline çalıştırmasını, "current" ise bu KB
+    üzerinde run_updates_era'nın yeniden çalıştırılmasını taklit eder.
+    (önerme kimlikleri KB sırasıyla, güven matrisi [ayar][önerme]) döndürür; numpy yoksa matris liste listesidir.
+    """
+    if baseline not in (SWEEP_BASELINE_INITIAL, SWEEP_BASELINE_CURRENT): raise ValueError(f"Unknown sweep baseline: {baseline}")
+    if not Proposition: return [], []
+    resolved = _resolve_settings(settings); graph = _collect_graph(kb, baseline)
+    if np is None: return graph["prop_ids"], _sweep_python(graph, resolved)
+    return graph["prop_ids"], _sweep_numpy(graph, resolved)
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE Sweep Module (Era Version)...")
+    if Proposition:
+        from aee_core_classes_era import EpistemicData
+        from aee_linker_era import find_and_link_evidence_era
+        from aee_updater_era import run_updates_era
+        kb_test: Dict[str, Proposition] = {}
+        for source_id, value, negated in (("news.com", "blue", False), ("blog", "blue", True), ("wiki", "blue", False), ("wiki", "wet", False)):
+            prop = Proposition(f"sky {value}", f"sky {value}", EpistemicData(source_id=source_id, initial_confidence=0.7), subject_lemma="sky",
+                               relation_lemma="be", value_lemma=value, is_negated=negated)
+            find_and_link_evidence_era(prop, kb_test); kb_test[prop.prop_id] = prop
+        run_updates_era(kb_test)
+        grid = parameter_grid(SUPPORT_WEIGHT=[0.05, 0.10, 0.20], CONTRADICTION_WEIGHT=[0.2, 0.35])
+        prop_ids, matrix = sweep_confidences(kb_test, grid)
+        default_row = grid.index({"SUPPORT_WEIGHT": 0.10, "CONTRADICTION_WEIGHT": 0.35})
+        print(f"Sweep: {len(grid)} settings x {len(prop_ids)} propositions")
+        print(f"Default setting reproduces the updater: {all(abs(matrix[default_row][i] - kb_test[pid].epistemic_data.computed_confidence) < 1e-9 for i, pid in enumerate(prop_ids))}")
+        for setting, row in zip(grid, matrix): print(f"  {setting}: {[round(float(c), 3) for c in row]}")
+    else: print("Could not run tests due to import error.")
+    print("\nSweep module testing complete.")
@@ -0,0 +1,149 @@
+# aee_temporal_era.py
+# AEE Era Sürümü: Zaman pencereli linkleme (time-windowed linking).
+# Haber akışlarında yıllar önceki bir iddia bugünkü iddiayı aynı ağırlıkla desteklememeli veya
+# çürütmemeli; tüm geçmişle karşılaştırma da maliyeti sınırsız büyütür. TemporalLinkIndex her
+# özne için önermeleri EpistemicData.timestamp'e göre sıralı tutar; yeni önerme yalnızca
+# |Δt| <= window aralığındaki adaylarla (bisect ile bulunur) karşılaştırılır.
+# Pencere sonsuz büyüklükteyse sonuç tam linklemeyle aynıdır (adaylar KB ekleme sırasıyla verilir).
+
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple, Any
+
+# Era sürümündeki sınıfları import et
+try:
+    from aee_core_classes_era import Proposition
+    from aee_linker_era import find_and_link_evidence_era, classify_pair_era
+    from aee_cycles_era import SupportCycleDetector
+except ImportError:
+    print("Temporal Error: Could not import dependencies from aee_core_classes_era.py, aee_linker_era.py or aee_cycles_era.py.")
+    Proposition = None
+
+def parse_item_timestamp(value: Any) -> Optional[datetime]:
+    """
+    Girdi öğesinin "timestamp" alanını (ISO 8601 metni, datetime veya Unix saniyesi) datetime'a çevirir.
+    KB zaman damgaları saat dilimsiz yerel zamandır (datetime.now()); saat dilimli değerler yerel zamana
+    çevrilip saat dilimi bilgisi atılır, böylece saklama politikası karşılaştırmaları çalışır.
+    Geçersiz değerde değeri içeren bir ValueError fırlatılır.
+    """
+    if value is None: return None
+    try:
+        if isinstance(value, datetime): parsed = value
+        elif isinstance(value, (int, float)) and not isinstance(value, bool): parsed = datetime.fromtimestamp(value)
+        else: parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except (ValueError, TypeError, OverflowError, OSError) as e:
+        raise ValueError(f"Invalid timestamp {value!r} (expected ISO 8601 text or Unix seconds): {e}") from None
+    if parsed.tzinfo is not None: parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+class TemporalLinkIndex:
+    """
+    Özne başına zaman sıralı aday listeleri. link(new_prop, kb) yeni önermeyi yalnızca pencere içindeki
+    adaylarla linkler ve indekse ekler. Aynı nesne sürekli veri girişinde çalıştırmalar arasında kullanılabilir
+    (mevcut KB için önce build); KB'den çıkarılan önermeler prune(kb) ile atılır.
+    measure_skipped_links=True ise pencere dışında kalan aynı-özne çiftlerinin kaç bağlantı üreteceği
+    (önbellekli karar ile, bağlantı eklenmeden) sayılır; bu, pencerenin bağlantı sayısına etkisini gösterir.
+    """
+
+    def __init__(self, window: timedelta, measure_skipped_links: bool = False):
+        self.window_seconds = window.total_seconds(); self.measure_skipped_links = measure_skipped_links
+        self._sequence = 0 # Ekleme sırası: pencere içindeki adaylar KB sırasıyla karşılaştırılır
+        self._keys: Dict[str, List[Tuple[float, int]]] = {} # özne -> sıralı (zaman, sıra)
+        self._props: Dict[str, List[Proposition]] = {} # özne -> _keys ile paralel önermeler
+        self.stats: Dict[str, Any] = {"linked": 0, "subject_candidates": 0, "window_candidates": 0, "links_added": 0,
+                                      "links_outside_window": 0, "link_seconds": 0.0}
+
+    # --- İndeks Bakımı ---
+    def add(self, prop: Proposition):
+        subject = prop.subject_lemma
+        if not subject: return # Linker öznesiz önermeleri hiçbir önermeyle eşleştirmez
+        key = (prop.epistemic_data.timestamp.timestamp(), self._sequence); self._sequence += 1
+        keys = self._keys.setdefault(subject, []); props = self._props.setdefault(subject, [])
+        position = bisect_right(keys, key) # Akışlar çoğunlukla zaman sıralı: genelde sona eklenir
+        keys.insert(position, key); props.insert(position, prop)
+
+    def build(self, kb: Dict[str, Proposition]):
+        """ Mevcut KB'nin önermelerini KB sırasıyla indekse ekler. """
+        for prop in kb.values(): self.add(prop)
+
+    def prune(self, kb: Dict[str, Proposition]) -> int:
+        """ KB'de artık olmayan (örn: saklama politikasıyla çıkarılmış) önermeleri atar; atılan sayıyı döndürür. """
+        removed_count = 0
+        for subject in list(self._keys):
+            keep = [index for index, prop in enumerate(self._props[subject]) if kb.get(prop.prop_id) is prop]
+            removed_count += len(self._keys[subject]) - len(keep)
+            if not keep: del self._keys[subject]; del self._props[subject]; continue
+            self._keys[subject] = [self._keys[subject][index] for index in keep]
+            self._props[subject] = [self._props[subject][index] for index in keep]
+        return removed_count
+
+    # --- Aday Arama ve Linkleme ---
+    def candidates(self, prop: Proposition, kb: Dict[str, Proposition]) -> List[Proposition]:
+        """ Aynı özneli, zaman farkı pencere içinde olan ve hâlâ KB'de bulunan önermeler (KB ekleme sırasıyla). """
+        keys = self._keys.get(prop.subject_lemma)
+        if not keys: return []
+        center = prop.epistemic_data.timestamp.timestamp()
+        start = bisect_left(keys, (center - self.window_seconds, -1))
+        end = bisect_right(keys, (center + self.window_seconds, self._sequence))
+        self.stats["subject_candidates"] += len(keys); self.stats["window_candidates"] += end - start
+        if self.measure_skipped_links: self._count_skipped_links(prop, keys, start, end, kb)
+        in_window = [(keys[index][1], self._props[prop.subject_lemma][index]) for index in range(start, end)]
+        in_window.sort(key=lambda entry: entry[0])
+        return [candidate for _, candidate in in_window if kb.get(candidate.prop_id) is candidate]
+
+    def _count_skipped_links(self, prop: Proposition, keys: List[Tuple[float, int]], start: int, end: int, kb: Dict[str, Proposition]):
+        if not all([prop.subject_lemma, prop.relation_lemma, prop.value_lemma]): return
+        new_key = (prop.subject_lemma, prop.relation_lemma, prop.value_lemma, prop.is_negated)
+        props = self._props[prop.subject_lemma]
+        for index in list(range(0, start)) + list(range(end, len(keys))):
+            old_prop = props[index]
+            if kb.get(old_prop.prop_id) is not old_prop: continue
+            if classify_pair_era(new_key, (old_prop.subject_lemma, old_prop.relation_lemma, old_prop.value_lemma, old_prop.is_negated)):
+                self.stats["links_outside_window"] += 1
+
+    def link(self, new_prop: Proposition, kb: Dict[str, Proposition], cycle_detector: Optional[SupportCycleDetector] = None):
+        """ find_and_link_evidence_era'nın pencereli karşılığı: adaylarla linkler ve önermeyi indekse ekler. """
+        link_start = time.perf_counter()
+        ep_data = new_prop.epistemic_data; links_before = len(ep_data.supports) + len(ep_data.contradicts)
+        find_and_link_evidence_era(new_prop, kb, cycle_detector, candidates=self.candidates(new_prop, kb))
+        self.add(new_prop)
+        self.stats["linked"] += 1; self.stats["links_added"] += len(ep_data.supports) + len(ep_data.contradicts) - links_before
+        self.stats["link_seconds"] += time.perf_counter() - link_start
+
+    def report(self) -> Dict[str, Any]:
+        """ İstatistikler + türetilmiş oranlar: elenen karşılaştırma oranı ve saniyede linklenen önerme. """
+        report = dict(self.stats); report["window_seconds"] = self.window_seconds
+        subject_candidates = report["subject_candidates"]
+        report["comparisons_skipped_fraction"] = 1 - report["window_candidates"] / subject_candidates if subject_candidates else 0.0
+        report["props_per_second"] = report["linked"] / report["link_seconds"] if report["link_seconds"] else 0.0
+        return report
+
+def format_window_report(report: Dict[str, Any]) -> str:
+    line = (f"Time-windowed linking (±{report['window_seconds'] / 86400:g} days): {report['linked']} props, "
+            f"{report['window_candidates']} of {report['subject_candidates']} same-subject comparisons "
+            f"({report['comparisons_skipped_fraction']:.1%} skipped), {report['links_added']} links, "
+            f"{report['props_per_second']:.0f} props/s")
+    if report["links_outside_window"]: line += f", {report['links_outside_window']} links outside the window not created"
+    return line + "."
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE Temporal Module (Era Version)...")
+    if Proposition:
+        from aee_core_classes_era import EpistemicData
+        kb_test: Dict[str, Proposition] = {}
+        index = TemporalLinkIndex(timedelta(days=30), measure_skipped_links=True)
+        base_time = parse_item_timestamp("2020-01-01T00:00:00")
+        print(f"Aware timestamp as local time: {parse_item_timestamp('2020-01-01T00:00:00Z')}")
+        for day, source_id, value, negated in ((0, "news.com", "open", False), (400, "blog", "open", True),
+                                               (410, "wiki", "open", True), (2, "archive", "open", False)): # Son öğe sırasız gelir
+            prop = Proposition(f"border {value}", f"border {value}", EpistemicData(source_id=source_id, timestamp=base_time + timedelta(days=day)),
+                               subject_lemma="border", relation_lemma="be", value_lemma=value, is_negated=negated)
+            index.link(prop, kb_test); kb_test[prop.prop_id] = prop
+        for prop in kb_test.values():
+            print(f"  {prop.epistemic_data.source_id:9s} {prop.epistemic_data.timestamp.date()}: "
+                  f"{len(prop.epistemic_data.supports)} supports, {len(prop.epistemic_data.contradicts)} contradicts")
+        print(format_window_report(index.report()))
+    else: print("Could not run tests due to import error.")
+    print("\nTemporal module testing complete.")
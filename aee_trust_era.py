@@ -0,0 +1,133 @@
+# aee_trust_era.py
+# AEE Era Sürümü: Kaynak düzeyinde güven yayılımı (trust propagation).
+# Önerme bağlantılarından kaynak x kaynak uyum (supports) / çelişki (contradicts) matrisi
+# çıkarılır ve her kaynağın güveni, komşu kaynakların güvenine göre yinelemeli olarak
+# yakınsayana kadar güncellenir. Tek bir çelişki, çok sayıda uyumu olan büyük bir kaynağı
+# spam bir bloğun seviyesine düşürmez.
+#
+# Güncelleme kuralı (kaynak i için; güvenilir kaynaklarla uyum/çelişki daha ağır basar):
+#   t_i = (s * prior + Σ_j A_ij * t_j) / (s + Σ_j (A_ij + C_ij) * t_j)
+# A: uyum sayıları, C: çelişki sayıları, s: önsel (prior) güç.
+
+from array import array
+from typing import Dict, List, Optional, Tuple, Any
+
+# Era sürümündeki sınıfları import et
+try:
+    from aee_core_classes_era import Proposition
+except ImportError:
+    print("Trust Error: Could not import Proposition class from aee_core_classes_era.py.")
+    Proposition = None
+
+# numpy isteğe bağlıdır; yoksa aynı kural saf Python ile hesaplanır
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# --- Sabitler ---
+TRUST_PRIOR = 0.6 # Bağlantısı olmayan kaynağın güveni (DEFAULT_SOURCE_RELIABILITY ile aynı)
+TRUST_PRIOR_STRENGTH = 2.0 # Önselin kaç bağlantı değerinde sayıldığı
+TRUST_TOLERANCE = 1e-6
+TRUST_MAX_ITERATIONS = 100
+
+def build_source_link_arrays(kb: Dict[str, Proposition]) -> Tuple[List[str], array, array, array]:
+    """
+    KB bağlantılarını kaynak indeksli kenar dizilerine dönüştürür: (kaynak listesi, satır, sütun, çelişki mi).
+    Aynı kaynağın kendi önermeleri arasındaki destekler uyum kanıtı sayılmaz; kendi içindeki çelişkiler sayılır.
+    Bağlantılar simetrik tutulduğu için her kenar iki yönde de yer alır.
+    """
+    source_index: Dict[str, int] = {}
+    rows = array('i'); cols = array('i'); is_contradiction = array('b')
+    for prop in kb.values():
+        source_index.setdefault(prop.epistemic_data.source_id, len(source_index))
+    for prop in kb.values():
+        ep_data = prop.epistemic_data; row = source_index[ep_data.source_id]
+        for link_ids, contradiction in ((ep_data.supports, 0), (ep_data.contradicts, 1)):
+            for linked_id in link_ids:
+                linked_prop = kb.get(linked_id)
+                if linked_prop is None: continue
+                col = source_index[linked_prop.epistemic_data.source_id]
+                if col == row and not contradiction: continue
+                rows.append(row); cols.append(col); is_contradiction.append(contradiction)
+    return list(source_index.keys()), rows, cols, is_contradiction
+
+def _propagate_numpy(n: int, rows: array, cols: array, is_contradiction: array, prior: float, prior_strength: float,
+                     tolerance: float, max_iterations: int) -> Tuple[List[float], int]:
+    row_idx = np.frombuffer(rows, dtype=np.int32) if len(rows) else np.zeros(0, dtype=np.int32)
+    col_idx = np.frombuffer(cols, dtype=np.int32) if len(cols) else np.zeros(0, dtype=np.int32)
+    contra = np.frombuffer(is_contradiction, dtype=np.int8).astype(bool) if len(is_contradiction) else np.zeros(0, dtype=bool)
+    agree_rows, agree_cols = row_idx[~contra], col_idx[~contra]
+    contra_rows, contra_cols = row_idx[contra], col_idx[contra]
+    trust = np.full(n, prior, dtype=np.float64)
+    iterations = 0
+    for iterations in range(1, max_iterations + 1):
+        agreement = np.bincount(agree_rows, weights=trust[agree_cols], minlength=n)
+        contradiction = np.bincount(contra_rows, weights=trust[contra_cols], minlength=n)
+        new_trust = (prior_strength * prior + agreement) / (prior_strength + agreement + contradiction)
+        delta = float(np.max(np.abs(new_trust - trust))) if n else 0.0
+        trust = new_trust
+        if delta < tolerance: break
+    return trust.tolist(), iterations
+
+def _propagate_python(n: int, rows: array, cols: array, is_contradiction: array, prior: float, prior_strength: float,
+                      tolerance: float, max_iterations: int) -> Tuple[List[float], int]:
+    # Kenarları (satır, sütun) başına uyum/çelişki sayılarına indir
+    edge_counts: Dict[Tuple[int, int], List[int]] = {}
+    for row, col, contradiction in zip(rows, cols, is_contradiction):
+        edge_counts.setdefault((row, col), [0, 0])[contradiction] += 1
+    edges = [(row, col, counts[0], counts[1]) for (row, col), counts in edge_counts.items()]
+    trust = [prior] * n
+    iterations = 0
+    for iterations in range(1, max_iterations + 1):
+        agreement = [0.0] * n; contradiction = [0.0] * n
+        for row, col, agree_count, contra_count in edges:
+            agreement[row] += agree_count * trust[col]; contradiction[row] += contra_count * trust[col]
+        new_trust = [(prior_strength * prior + agreement[i]) / (prior_strength + agreement[i] + contradiction[i]) for i in range(n)]
+        delta = max((abs(new - old) for new, old in zip(new_trust, trust)), default=0.0)
+        trust = new_trust
+        if delta < tolerance: break
+    return trust, iterations
+
+def compute_source_trust(kb: Dict[str, Proposition], prior: float = TRUST_PRIOR, prior_strength: float = TRUST_PRIOR_STRENGTH,
+                         tolerance: float = TRUST_TOLERANCE, max_iterations: int = TRUST_MAX_ITERATIONS,
+                         stats: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
+    """
+    Kaynak güvenlerini yinelemeli yayılımla hesaplar ve {source_id: trust [0-1]} döndürür.
+    numpy varsa seyrek kenar dizileri üzerinde bincount ile vektörel çalışır.
+    stats verilirse kaynak/kenar/yineleme sayıları yazılır.
+    """
+    if not Proposition or not kb: return {}
+    source_ids, rows, cols, is_contradiction = build_source_link_arrays(kb)
+    propagate = _propagate_numpy if np is not None else _propagate_python
+    trust, iterations = propagate(len(source_ids), rows, cols, is_contradiction, prior, prior_strength, tolerance, max_iterations)
+    if stats is not None:
+        stats.update({"sources": len(source_ids), "edges": len(rows), "iterations": iterations, "vectorized": np is not None})
+    return dict(zip(source_ids, trust))
+
+# --- Test Bloğu ---
+if __name__ == "__main__":
+    print("Testing AEE Trust Module (Era Version)...")
+    if Proposition:
+        from aee_core_classes_era import EpistemicData
+        kb_test: Dict[str, Proposition] = {}
+        def add(source_id: str, value: str, negated: bool = False) -> Proposition:
+            prop = Proposition(f"x is {value}", f"x is {value}", EpistemicData(source_id=source_id), subject_lemma=f"s_{value}",
+                               relation_lemma="be", value_lemma=value, is_negated=negated)
+            kb_test[prop.prop_id] = prop; return prop
+        def link(a: Proposition, b: Proposition, kind: str):
+            getattr(a.epistemic_data, kind).append(b.prop_id); getattr(b.epistemic_data, kind).append(a.prop_id)
+        # Büyük haber kaynağı: 20 iddia, 3 kaynakla uyumlu, spam blog ile bir çelişki
+        for i in range(20):
+            news_prop = add("big_news.com", f"v{i}")
+            for other in ("wiki", "textbook", "report_Y"): link(news_prop, add(other, f"v{i}"), "supports")
+        spam_props = [add("spam_blog", f"v{i}", negated=True) for i in range(3)]
+        news_first = [p for p in kb_test.values() if p.epistemic_data.source_id == "big_news.com"][0]
+        link(news_first, spam_props[0], "contradicts")
+        for spam_prop in spam_props[1:]: link(spam_prop, add("wiki", spam_prop.value_lemma), "contradicts")
+        trust_stats: Dict[str, Any] = {}
+        trust_scores = compute_source_trust(kb_test, stats=trust_stats)
+        for source_id, trust in sorted(trust_scores.items(), key=lambda item: -item[1]): print(f"  {source_id:14s} trust={trust:.3f}")
+        print(f"Stats: {trust_stats}")
+    else: print("Could not run tests due to import error.")
+    print("\nTrust module testing complete.")
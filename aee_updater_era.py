@@ -3,8 +3,10 @@
 # v1.0.1 (Era): Bias flag kontrolü için debug print eklendi.
 
 import math
-from typing import Dict, List, Optional, Set
+from array import array
+from typing import Dict, List, Optional, Set, Sequence, Tuple
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     from aee_core_classes_era import Proposition
@@ -12,22 +14,138 @@ except ImportError:
     print("Updater Error: Could not import Proposition class from aee_core_classes_era.py.")
     Proposition = None
 
+try:
+    from aee_trust_era import compute_source_trust
+except ImportError:
+    print("Updater Warning: Could not import aee_trust_era.py; only the binary reliability model is available.")
+    compute_source_trust = None
+
+try:
+    from aee_events_era import emit, EVENT_CONFIDENCE_CHANGED, EVENT_RELIABILITY_CHANGED, EVENT_FLAG_SET
+except ImportError:
+    print("Updater Error: Could not import aee_events_era.py.")
+    emit = None
+
+try:
+    from aee_cycles_era import SupportCycleDetector
+except ImportError:
+    print("Updater Warning: Could not import aee_cycles_era.py; only full circular support detection is available.")
+    SupportCycleDetector = None
+
 # --- Sabitler ---
 DEFAULT_SOURCE_RELIABILITY = 0.6; RELIABLE_SOURCE_SCORE = 0.75; UNRELIABLE_SOURCE_SCORE = 0.35
 MIN_CONFIDENCE = 0.01; MAX_CONFIDENCE = 0.99; MIN_RELIABILITY = 0.1; MAX_RELIABILITY = 1.0
 SUPPORT_WEIGHT = 0.10; CONTRADICTION_WEIGHT = 0.35; RELIABILITY_DAMPENING_FACTOR = 0.5
 BIAS_PENALTY_MULTIPLIER = 0.85; CIRCULAR_SUPPORT_PENALTY_MULTIPLIER = 0.75
 PLAUSIBILITY_WEIGHT_FACTOR = 1.0
+OCCURRENCE_WEIGHT = 0.05 # Tekilleştirilmiş önermelerde tekrar sayısının (log) güvene etkisi
+RELIABILITY_MODEL_BINARY = "binary" # Kaynakta herhangi bir çelişki varsa güvenilmez (0.35), yoksa güvenilir (0.75)
+RELIABILITY_MODEL_TRUST = "trust" # Kaynak x kaynak uyum/çelişki grafında güven yayılımı (aee_trust_era)
+MIN_UPDATE_BATCH_SIZE = 256 # Paralel güncellemede küçük bileşenler en az bu kadar önermelik gruplarla gönderilir
+
+# (prop_id, source_id, initial, computed, occurrence_count, supports, contradicts, bias_flags, plausibility)
+UpdateRecord = Tuple[str, str, float, float, int, List[str], List[str], List[str], Optional[float]]
+
+# --- Güven Katkı Defteri (Ledger) ---
+# Her sütun, güncelleme adımının güvene kattığı farktır (delta); satır toplamı computed_confidence'a eşittir.
+LEDGER_COLUMNS = ("initial", "reliability", "occurrence", "support", "contradiction",
+                  "circular_penalty", "bias_penalty", "plausibility", "clamp")
+
+class ConfidenceLedger:
+    """
+    update_proposition_confidence_era'nın hesapladığı katkıları önerme başına sabit genişlikte
+    satırlar olarak tek bir array('d') içinde tutar. "Neden bu güven?" sorgusu O(1)'dir.
+    """
+
+    def __init__(self):
+        self._values = array('d')
+        self._rows: Dict[str, int] = {}
+        self._row_ids: List[str] = [] # satır -> prop_id (silmede son satır boşluğa taşınır)
+
+    def record(self, prop_id: str, contributions: Sequence[float]):
+        row = self._rows.get(prop_id); width = len(LEDGER_COLUMNS)
+        if row is None:
+            self._rows[prop_id] = len(self._rows); self._row_ids.append(prop_id); self._values.extend(contributions)
+        else:
+            self._values[row * width:(row + 1) * width] = array('d', contributions)
+
+    def get(self, prop_id: str) -> Optional[Dict[str, float]]:
+        """ Önermenin katkılarını {sütun: delta} olarak döndürür; kayıt yoksa None. """
+        row = self._rows.get(prop_id)
+        if row is None: return None
+        width = len(LEDGER_COLUMNS)
+        return dict(zip(LEDGER_COLUMNS, self._values[row * width:(row + 1) * width]))
+
+    def remove(self, prop_id: str):
+        """ Önermenin satırını siler (örn: saklama politikasıyla çıkarıldığında); son satır boşalan yere taşınır. """
+        row = self._rows.pop(prop_id, None)
+        if row is None: return
+        width = len(LEDGER_COLUMNS); last_row = len(self._row_ids) - 1
+        if row != last_row:
+            moved_id = self._row_ids[last_row]
+            self._values[row * width:(row + 1) * width] = self._values[last_row * width:(last_row + 1) * width]
+            self._rows[moved_id] = row; self._row_ids[row] = moved_id
+        self._row_ids.pop(); del self._values[last_row * width:]
+
+    def __contains__(self, prop_id: object) -> bool: return prop_id in self._rows
+    def __len__(self) -> int: return len(self._rows)
+
+    def as_rows(self) -> Dict[str, List[float]]:
+        """ Defteri {prop_id: [katkılar]} olarak döndürür (kontrol noktasına yazmak için). """
+        width = len(LEDGER_COLUMNS)
+        return {prop_id: list(self._values[row * width:(row + 1) * width]) for prop_id, row in self._rows.items()}
+
+    @classmethod
+    def from_rows(cls, rows: Dict[str, Sequence[float]]) -> "ConfidenceLedger":
+        ledger = cls()
+        for prop_id, contributions in rows.items(): ledger.record(prop_id, contributions)
+        return ledger
 
 # --- Güvenilirlik Hesaplama ---
+def set_reliability_score_era(prop: Proposition, reliability: float, kb: Dict[str, Proposition]):
+    """ reliability_score'u yazar; değiştiyse KB dinleyicilerine reliability_changed yayınlar. """
+    previous_reliability = prop.epistemic_data.reliability_score
+    prop.epistemic_data.reliability_score = reliability
+    if reliability != previous_reliability: emit(kb, EVENT_RELIABILITY_CHANGED, prop, old=previous_reliability, new=reliability)
+
 def calculate_source_reliability_era(source_id: str, kb: Dict[str, Proposition]) -> float:
     # ... (Aynı) ...
     if not Proposition: return DEFAULT_SOURCE_RELIABILITY
     props_from_source = [p for p in kb.values() if p.epistemic_data.source_id == source_id]
     if not props_from_source: return DEFAULT_SOURCE_RELIABILITY
+    return _binary_source_reliability(props_from_source)
+
+def _binary_source_reliability(props_from_source: List[Proposition]) -> float:
     has_any_contradiction = any(hasattr(prop.epistemic_data, 'contradicts') and prop.epistemic_data.contradicts for prop in props_from_source)
     return UNRELIABLE_SOURCE_SCORE if has_any_contradiction else RELIABLE_SOURCE_SCORE
 
+def calculate_trust_reliabilities_era(kb: Dict[str, Proposition], stats: Optional[Dict[str, object]] = None) -> Dict[str, float]:
+    """ "trust" modeli: kaynaklar arası güven yayılımı, [MIN_RELIABILITY, MAX_RELIABILITY] aralığına sıkıştırılmış. """
+    return {source_id: max(MIN_RELIABILITY, min(MAX_RELIABILITY, trust)) for source_id, trust in compute_source_trust(kb, stats=stats).items()}
+
+def refresh_source_reliabilities_era(kb: Dict[str, Proposition], source_ids: Set[str],
+                                     reliability_model: str = RELIABILITY_MODEL_BINARY) -> Dict[str, float]:
+    """
+    Yalnızca verilen kaynakların güvenilirliğini tek geçişte yeniden hesaplar ve
+    bu kaynaklardan gelen önermelerin reliability_score alanını günceller
+    (örn: önerme çıkarıldıktan/silindikten sonra). KB'de önermesi kalmayan kaynaklar atlanır.
+    reliability_model run_updates_era ile aynıdır; "trust" modelinde güven tüm kaynak grafında
+    yayıldığından KB'deki tüm kaynaklar yenilenir.
+    """
+    if not Proposition or not source_ids: return {}
+    trust_scores: Optional[Dict[str, float]] = None
+    if reliability_model == RELIABILITY_MODEL_TRUST and compute_source_trust:
+        trust_scores = calculate_trust_reliabilities_era(kb)
+    props_by_source: Dict[str, List[Proposition]] = defaultdict(list)
+    for prop in kb.values():
+        if trust_scores is not None or prop.epistemic_data.source_id in source_ids: props_by_source[prop.epistemic_data.source_id].append(prop)
+    refreshed_scores: Dict[str, float] = {}
+    for source_id, props_from_source in props_by_source.items():
+        reliability = trust_scores[source_id] if trust_scores is not None else _binary_source_reliability(props_from_source)
+        for prop in props_from_source: set_reliability_score_era(prop, reliability, kb)
+        refreshed_scores[source_id] = reliability
+    return refreshed_scores
+
 # --- Döngü Tespiti ---
 def detect_circular_support_era(kb: Dict[str, Proposition]):
      # ... (Aynı) ...
@@ -51,7 +169,7 @@ def detect_circular_support_era(kb: Dict[str, Proposition]):
                             # print(f"       Cycle: {' -> '.join([p[:8] for p in cycle_nodes])}")
                             for node_id_in_cycle in cycle_nodes:
                                 node_prop = kb.get(node_id_in_cycle)
-                                if node_prop and circular_support_flag not in node_prop.epistemic_data.bias_flags: node_prop.epistemic_data.bias_flags.append(circular_support_flag); flagged_props_count += 1
+                                if node_prop and circular_support_flag not in node_prop.epistemic_data.bias_flags: node_prop.epistemic_data.bias_flags.append(circular_support_flag); flagged_props_count += 1; emit(kb, EVENT_FLAG_SET, node_prop, flag=circular_support_flag)
                         except ValueError: pass
                         return True
                 recursion_stack.remove(current_node_id); path.pop(); return False
@@ -60,12 +178,18 @@ def detect_circular_support_era(kb: Dict[str, Proposition]):
 
 
 # --- Güven Güncelleme (Era - Debug Eklendi) ---
-def update_proposition_confidence_era(prop: Proposition, kb: Dict[str, Proposition], source_reliability_scores: Dict[str, float]):
+def update_proposition_confidence_era(prop: Proposition, kb: Dict[str, Proposition], source_reliability_scores: Dict[str, float],
+                                      ledger: Optional[ConfidenceLedger] = None):
     if not Proposition: return
     ep_data = prop.epistemic_data; initial_conf = ep_data.initial_confidence
     source_reliability = source_reliability_scores.get(ep_data.source_id, DEFAULT_SOURCE_RELIABILITY)
     adjusted_initial_conf = initial_conf * (1 - RELIABILITY_DAMPENING_FACTOR) + (initial_conf * source_reliability) * RELIABILITY_DAMPENING_FACTOR
     current_confidence = adjusted_initial_conf
+    # Tekrar Etkisi: Aynı kaynaktaki tekrarlar azalan getiriyle (log) güveni artırır
+    occurrence_count = getattr(ep_data, 'occurrence_count', 1); occurrence_effect = 0.0
+    if occurrence_count > 1:
+        occurrence_effect = min(1.0, OCCURRENCE_WEIGHT * math.log(occurrence_count)) * (1 - current_confidence)
+        current_confidence += occurrence_effect
     total_support_effect = 0.0
     if ep_data.supports:
         for supporter_id in ep_data.supports:
@@ -78,6 +202,7 @@ def update_proposition_confidence_era(prop: Proposition, kb: Dict[str, Propositi
             contradictor_prop = kb.get(contradictor_id)
             if contradictor_prop: total_contradiction_effect += CONTRADICTION_WEIGHT * contradictor_prop.epistemic_data.computed_confidence * current_confidence
     current_confidence -= total_contradiction_effect
+    circular_penalty_effect = 0.0; bias_penalty_effect = 0.0
 
     # !!! YENİ DEBUG PRINT !!!
     print(f"    !!! Checking Bias Flags for Prop {prop.prop_id[:8]} !!! Current Flags: {ep_data.bias_flags}")
@@ -85,9 +210,11 @@ def update_proposition_confidence_era(prop: Proposition, kb: Dict[str, Propositi
     if ep_data.bias_flags: # Bu kontrol neden False dönüyor?
         print(f"    -> Applying penalty for Bias Flags: {ep_data.bias_flags} to Prop {prop.prop_id[:8]}")
         if "CIRCULAR_SUPPORT" in ep_data.bias_flags:
+            circular_penalty_effect = current_confidence * (CIRCULAR_SUPPORT_PENALTY_MULTIPLIER - 1)
             current_confidence *= CIRCULAR_SUPPORT_PENALTY_MULTIPLIER
             print(f"      -> Applied CIRCULAR_SUPPORT penalty. Confidence now: {current_confidence:.3f}")
         if any(flag != "CIRCULAR_SUPPORT" for flag in ep_data.bias_flags):
+             bias_penalty_effect = current_confidence * (BIAS_PENALTY_MULTIPLIER - 1)
              current_confidence *= BIAS_PENALTY_MULTIPLIER
              print(f"      -> Applied general BIAS penalty. Confidence now: {current_confidence:.3f}")
     # else: # Debug: Neden girmediğini gör
@@ -95,30 +222,149 @@ def update_proposition_confidence_era(prop: Proposition, kb: Dict[str, Propositi
 
 
     # Plausibility Skoru Etkisi
-    plausibility = ep_data.plausibility_score
+    plausibility = ep_data.plausibility_score; plausibility_effect = 0.0
     if plausibility is not None:
         # print(f"    Applying Plausibility ({plausibility:.2f}) to Prop {prop.prop_id[:8]}. Confidence before: {current_confidence:.3f}")
-        current_confidence *= (plausibility * PLAUSIBILITY_WEIGHT_FACTOR + (1-PLAUSIBILITY_WEIGHT_FACTOR))
+        plausibility_multiplier = (plausibility * PLAUSIBILITY_WEIGHT_FACTOR + (1-PLAUSIBILITY_WEIGHT_FACTOR))
+        plausibility_effect = current_confidence * (plausibility_multiplier - 1)
+        current_confidence *= plausibility_multiplier
         # print(f"      -> Confidence after plausibility: {current_confidence:.3f}")
 
+    previous_confidence = ep_data.computed_confidence
     ep_data.computed_confidence = max(MIN_CONFIDENCE, min(MAX_CONFIDENCE, current_confidence))
+    if ep_data.computed_confidence != previous_confidence:
+        emit(kb, EVENT_CONFIDENCE_CHANGED, prop, old=previous_confidence, new=ep_data.computed_confidence)
+    if ledger is not None: # LEDGER_COLUMNS sırasıyla
+        ledger.record(prop.prop_id, (initial_conf, adjusted_initial_conf - initial_conf, occurrence_effect, total_support_effect,
+                                     -total_contradiction_effect, circular_penalty_effect, bias_penalty_effect, plausibility_effect,
+                                     ep_data.computed_confidence - current_confidence))
+
+# --- Bileşen Bazlı Paralel Güncelleme ---
+def find_link_components(kb: Dict[str, Proposition]) -> List[List[str]]:
+    """
+    supports/contradicts bağlantılarının oluşturduğu zayıf bağlı bileşenleri union-find ile bulur.
+    Her bileşen KB sırasıyla, bileşenler de ilk önermelerinin KB sırasıyla döndürülür.
+    """
+    parent: Dict[str, str] = {prop_id: prop_id for prop_id in kb}
+    def find(prop_id: str) -> str:
+        while parent[prop_id] != prop_id:
+            parent[prop_id] = parent[parent[prop_id]]; prop_id = parent[prop_id] # Yol yarılama
+        return prop_id
+    for prop_id, prop in kb.items():
+        for linked_id in prop.epistemic_data.supports + prop.epistemic_data.contradicts:
+            if linked_id not in parent: continue # KB'den çıkarılmış önermeye kalan bağlantı
+            root_a, root_b = find(prop_id), find(linked_id)
+            if root_a != root_b: parent[root_b] = root_a
+    components: Dict[str, List[str]] = {}
+    for prop_id in kb: components.setdefault(find(prop_id), []).append(prop_id)
+    return list(components.values())
+
+def batch_components(components: List[List[str]], min_batch_size: int = MIN_UPDATE_BATCH_SIZE) -> List[List[str]]:
+    """ Büyük bileşenleri tek başına, tekil ve küçük bileşenleri birleştirerek en az min_batch_size'lık gruplar oluşturur. """
+    batches: List[List[str]] = []; current_batch: List[str] = []
+    for component in components:
+        if len(component) >= min_batch_size: batches.append(component); continue
+        current_batch.extend(component)
+        if len(current_batch) >= min_batch_size: batches.append(current_batch); current_batch = []
+    if current_batch: batches.append(current_batch)
+    return batches
+
+def _to_update_record(prop: Proposition) -> UpdateRecord:
+    ep_data = prop.epistemic_data
+    return (prop.prop_id, ep_data.source_id, ep_data.initial_confidence, ep_data.computed_confidence, ep_data.occurrence_count,
+            list(ep_data.supports), list(ep_data.contradicts), list(ep_data.bias_flags), ep_data.plausibility_score)
+
+def _update_batch_worker(records: List[UpdateRecord], source_reliability_scores: Dict[str, float],
+                         record_ledger: bool) -> Tuple[Dict[str, float], Dict[str, List[float]]]:
+    """
+    Bir grup bileşeni (ayrı süreçte) seri olarak günceller; {prop_id: computed_confidence} ve defter satırlarını döndürür.
+    Bileşenler birbirinden bağımsız olduğundan, bileşen içi KB sırası korunduğu sürece sonuç seri güncellemeyle aynıdır.
+    """
+    from aee_core_classes_era import EpistemicData
+    batch_kb: Dict[str, Proposition] = {}
+    for prop_id, source_id, initial, computed, count, supports, contradicts, bias_flags, plausibility in records:
+        ep_data = EpistemicData(source_id=source_id, initial_confidence=initial, supports=supports, contradicts=contradicts,
+                                bias_flags=bias_flags, plausibility_score=plausibility, occurrence_count=count)
+        ep_data.computed_confidence = computed # Henüz güncellenmemiş komşular önceki değerle okunur
+        batch_kb[prop_id] = Proposition("", "", ep_data, prop_id=prop_id)
+    batch_ledger = ConfidenceLedger() if record_ledger else None
+    for prop in batch_kb.values():
+        update_proposition_confidence_era(prop, batch_kb, source_reliability_scores, batch_ledger)
+    confidences = {prop_id: prop.epistemic_data.computed_confidence for prop_id, prop in batch_kb.items()}
+    return confidences, batch_ledger.as_rows() if batch_ledger is not None else {}
+
+def update_confidences_by_component(kb: Dict[str, Proposition], source_reliability_scores: Dict[str, float],
+                                    ledger: Optional[ConfidenceLedger] = None, num_workers: int = 4,
+                                    min_batch_size: int = MIN_UPDATE_BATCH_SIZE) -> int:
+    """
+    Era Sürümü (Paralel): Önerme güvenlerini bağlantı bileşenleri üzerinden süreç havuzunda günceller.
+    Bir önermenin güveni yalnızca bağlantılı önermelere ve kaynak güvenilirliğine bağlı olduğundan
+    bileşenler bağımsızdır. Güvenilirlikler ve döngü bayrakları önceden tüm KB üzerinde hesaplanmış olmalıdır.
+    Sonuç (defter dahil) seri güncellemeyle birebir aynıdır. İşlenen grup sayısını döndürür.
+    """
+    if not Proposition or not kb: return 0
+    components = find_link_components(kb)
+    batches = batch_components(components, min_batch_size)
+    print(f"  Component-parallel update: {len(components)} components in {len(batches)} batches ({num_workers} workers)...")
+    batch_records = [[_to_update_record(kb[prop_id]) for prop_id in batch] for batch in batches]
+    batch_scores = [{source_id: source_reliability_scores[source_id] for source_id in {record[1] for record in records}
+                     if source_id in source_reliability_scores} for records in batch_records]
+    record_ledger = ledger is not None
+    if num_workers > 1 and len(batches) > 1:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            batch_results = list(executor.map(_update_batch_worker, batch_records, batch_scores, [record_ledger] * len(batches)))
+    else:
+        batch_results = [_update_batch_worker(records, scores, record_ledger) for records, scores in zip(batch_records, batch_scores)]
+
+    # Sonuçları birleştir; defter satırları seri güncellemedeki gibi KB sırasıyla yazılır
+    ledger_rows: Dict[str, List[float]] = {}
+    for confidences, rows in batch_results:
+        for prop_id, confidence in confidences.items():
+            ep_data = kb[prop_id].epistemic_data; previous_confidence = ep_data.computed_confidence
+            ep_data.computed_confidence = confidence
+            if confidence != previous_confidence: emit(kb, EVENT_CONFIDENCE_CHANGED, kb[prop_id], old=previous_confidence, new=confidence)
+        ledger_rows.update(rows)
+    if ledger is not None:
+        for prop_id in kb: ledger.record(prop_id, ledger_rows[prop_id])
+    return len(batches)
 
 # --- Toplu Güncelleme Fonksiyonu (Era) ---
-def run_updates_era(kb: Dict[str, Proposition]) -> Dict[str, Proposition]:
+def run_updates_era(kb: Dict[str, Proposition], ledger: Optional[ConfidenceLedger] = None,
+                    reliability_model: str = RELIABILITY_MODEL_BINARY, update_workers: int = 1,
+                    cycle_detector: Optional[SupportCycleDetector] = None) -> Dict[str, Proposition]:
+    """
+    ledger verilirse her önermenin güven katkıları deftere kaydedilir (explainer bunu doğrudan okur).
+    reliability_model: "binary" (varsayılan) veya "trust" (kaynaklar arası güven yayılımı).
+    update_workers > 1: Güven güncellemesi bağlantı bileşenlerine bölünüp süreç havuzunda yapılır (sonuç seri ile aynıdır).
+    cycle_detector: Döngüler linkleme sırasında artımlı olarak işaretlendiyse tam DFS taraması atlanır;
+      dedektör tam tarama istediyse (arama sınırı aşıldı / toplu linkleme) cycle_detector.rescan yapılır.
+    """
     # ... (Fonksiyonun geri kalanı aynı) ...
     if not Proposition or not kb: print("Knowledge Base is empty or Proposition class not available."); return kb
     print("\nRunning Era Updates (Reliability, Cycle Detection & Confidence Refinement)...")
     print("  Calculating source reliabilities...")
     source_ids = set(p.epistemic_data.source_id for p in kb.values()); source_reliability_scores: Dict[str, float] = {}
-    for source_id in source_ids:
-        reliability = calculate_source_reliability_era(source_id, kb); source_reliability_scores[source_id] = reliability
-        for prop in kb.values():
-             if prop.epistemic_data.source_id == source_id: prop.epistemic_data.reliability_score = reliability
-    detect_circular_support_era(kb)
+    if reliability_model == RELIABILITY_MODEL_TRUST and compute_source_trust:
+        trust_stats: Dict[str, object] = {}
+        source_reliability_scores = calculate_trust_reliabilities_era(kb, stats=trust_stats)
+        print(f"  Trust propagation: {trust_stats.get('sources')} sources, {trust_stats.get('edges')} edges, {trust_stats.get('iterations')} iterations.")
+        for prop in kb.values(): set_reliability_score_era(prop, source_reliability_scores[prop.epistemic_data.source_id], kb)
+    else:
+        for source_id in source_ids:
+            reliability = calculate_source_reliability_era(source_id, kb); source_reliability_scores[source_id] = reliability
+            for prop in kb.values():
+                 if prop.epistemic_data.source_id == source_id: set_reliability_score_era(prop, reliability, kb)
+    if cycle_detector is None: detect_circular_support_era(kb)
+    elif cycle_detector.needs_full_rescan:
+        print(f"  Incremental cycle detection requested a full rescan. Flagged {cycle_detector.rescan(kb)} propositions.")
+    else: print(f"  Circular support flagged incrementally during linking ({cycle_detector.stats['flagged']} propositions).")
     print("  Updating proposition confidences (Era logic)...")
-    propositions_to_update = list(kb.values()) # Önce listeye alalım
-    for prop in propositions_to_update:
-        update_proposition_confidence_era(prop, kb, source_reliability_scores)
+    if update_workers > 1: # Güvenilirlik ve döngü tespiti tüm KB üzerinde yapıldı; bileşenler bağımsız güncellenir
+        update_confidences_by_component(kb, source_reliability_scores, ledger, num_workers=update_workers)
+    else:
+        propositions_to_update = list(kb.values()) # Önce listeye alalım
+        for prop in propositions_to_update:
+            update_proposition_confidence_era(prop, kb, source_reliability_scores, ledger)
     print("Updates complete.")
     return kb
 
@@ -61,6 +61,13 @@ def check_plausibility_v_era(proposition: Proposition) -> Tuple[Optional[float],
     # print(f"DEBUG Validator: Prop '{proposition.prop_id[:8]}' Plausibility: {plausibility_score}, Notes: {validation_notes}")
     return plausibility_score, validation_notes
 
+def apply_plausibility_check_era(proposition: Proposition):
+    """ Makullük kontrolünü çalıştırır ve sonucu önermenin epistemik verisine yazar. """
+    plausibility_score, validation_notes = check_plausibility_v_era(proposition)
+    if hasattr(proposition, 'epistemic_data') and proposition.epistemic_data:
+        proposition.epistemic_data.plausibility_score = plausibility_score
+        if validation_notes: proposition.epistemic_data.validation_notes.extend(validation_notes)
+
 
 # --- Test Bloğu ---
 if __name__ == "__main__":